@@ -0,0 +1,118 @@
+
+from typing import Dict
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from time import perf_counter
+
+from wx import Colour
+from wx import DC
+from wx import PyTimer
+from wx import Rect
+from wx import Size
+from wx import VListBox
+from wx import Window
+
+from pyfabricate.ConsoleLineStore import ALL_PROJECTS
+from pyfabricate.ConsoleLineStore import ConsoleLine
+from pyfabricate.ConsoleLineStore import ConsoleLineStore
+from pyfabricate.ConsoleLineStore import LineFilter
+from pyfabricate.ConsoleLineStore import LineLevel
+
+LINE_NUMBER_COLOR: Tuple[int, int, int] = (255, 0, 0)
+
+LEVEL_COLORS: Dict[LineLevel, Tuple[int, int, int]] = {
+    LineLevel.INFO:    (0, 0, 0),
+    LineLevel.WARNING: (204, 120, 0),
+    LineLevel.ERROR:   (204, 0, 0),
+}
+
+LINE_MARGIN: int = 4
+
+FLUSH_INTERVAL_MILLISECONDS: int   = 50
+FLUSH_INTERVAL_SECONDS:      float = FLUSH_INTERVAL_MILLISECONDS / 1000
+
+
+class BufferedConsole(VListBox):
+    """
+    A numbered, append only console.  Lines live in a `ConsoleLineStore`;  The control is
+    virtual and only draws the rows in view, so memory and redraw cost do not grow with the
+    number of lines.  New lines are shown in batches;  A batch is shown when a line arrives
+    and the last batch is older than the flush interval, otherwise by a short timer
+    """
+    def __init__(self, parent: Window, size: Size):
+
+        super().__init__(parent, size=size)
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._lineStore:       ConsoleLineStore        = ConsoleLineStore()
+        self._lineNumberColor: Colour                  = Colour(*LINE_NUMBER_COLOR)
+        self._levelColors:     Dict[LineLevel, Colour] = {level: Colour(*color) for level, color in LEVEL_COLORS.items()}
+        self._lineHeight:      int                     = self.GetCharHeight() + LINE_MARGIN
+        self._lastFlush:       float                   = 0.0
+        self._flushTimer:      PyTimer                 = PyTimer(self.flush)
+
+    @property
+    def lineStore(self) -> ConsoleLineStore:
+        return self._lineStore
+
+    @property
+    def lineFilter(self) -> LineFilter:
+        return self._lineStore.lineFilter
+
+    @lineFilter.setter
+    def lineFilter(self, lineFilter: LineFilter):
+        self._lineStore.lineFilter = lineFilter
+        self._showLines(follow=True)
+
+    def addLine(self, text: str, level: LineLevel = LineLevel.INFO, project: str = ALL_PROJECTS):
+        """
+        Args:
+            text:     The line to append;  Shown within the flush interval
+            level:    Its severity
+            project:  The project that reported it
+        """
+        if self._lineStore.append(text=text, level=level, project=project) is False:
+            return
+
+        if perf_counter() - self._lastFlush >= FLUSH_INTERVAL_SECONDS:
+            self.flush()
+        elif self._flushTimer.IsRunning() is False:
+            self._flushTimer.StartOnce(FLUSH_INTERVAL_MILLISECONDS)
+
+    def flush(self):
+        """
+        Shows every line appended so far;  Stays at the end if the end was in view
+        """
+        self._flushTimer.Stop()
+        self._lastFlush = perf_counter()
+
+        itemCount: int = self.GetItemCount()
+        self._showLines(follow=itemCount == 0 or self.GetVisibleRowsEnd() >= itemCount)
+
+    def OnMeasureItem(self, n: int) -> int:
+        return self._lineHeight
+
+    def OnDrawItem(self, dc: DC, rect: Rect, n: int):
+
+        consoleLine: ConsoleLine = self._lineStore.visibleLine(n)
+        lineNumber:  str         = f'{consoleLine.number}: '
+        y:           int         = rect.y + LINE_MARGIN // 2
+
+        dc.SetTextForeground(self._lineNumberColor)
+        dc.DrawText(lineNumber, rect.x + LINE_MARGIN, y)
+
+        dc.SetTextForeground(self._levelColors[consoleLine.level])
+        dc.DrawText(consoleLine.text, rect.x + LINE_MARGIN + dc.GetTextExtent(lineNumber).width, y)
+
+    def _showLines(self, follow: bool):
+
+        visibleCount: int = self._lineStore.visibleCount
+
+        self.SetItemCount(visibleCount)
+        if follow is True and visibleCount > 0:
+            self.ScrollToRow(visibleCount - 1)
+        self.Refresh()
@@ -0,0 +1,291 @@
+
+from typing import Deque
+from typing import Dict
+from typing import FrozenSet
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from array import array
+
+from bisect import bisect_left
+
+from collections import deque
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from enum import Enum
+
+#
+# Lines are kept in chunks of this many;  A full chunk is packed into one UTF-8 blob
+# plus an offset table, so a line costs its text and a few bytes of bookkeeping
+#
+CHUNK_SIZE: int = 4096
+#
+# The oldest chunk is dropped when the store holds more than this many lines
+#
+MAXIMUM_LINES: int = 512 * CHUNK_SIZE
+
+#
+# Narrowing re-examines each line in view;  Past this share of the store, a rescan is cheaper
+#
+NARROWING_RATIO: int = 4
+
+ALL_PROJECTS: str = ''
+
+
+class LineLevel(Enum):
+    INFO    = 0
+    WARNING = 1
+    ERROR   = 2
+
+
+ALL_LEVELS: FrozenSet[LineLevel] = frozenset(LineLevel)
+
+
+@dataclass
+class ConsoleLine:
+    number:  int       = 0
+    text:    str       = ''
+    level:   LineLevel = LineLevel.INFO
+    project: str       = ALL_PROJECTS
+
+
+@dataclass(frozen=True)
+class LineFilter:
+    """
+    A line is shown when its level is one of `levels`, it belongs to `project`, and its text
+    contains `text`;  The text match is case-sensitive
+    """
+    levels:  FrozenSet[LineLevel] = ALL_LEVELS
+    project: str                  = ALL_PROJECTS
+    text:    str                  = ''
+
+    def narrows(self, other: 'LineFilter') -> bool:
+        """
+        Args:
+            other:  The filter in effect
+
+        Returns:  True if every line this filter shows is also shown by `other`
+        """
+        return self.levels <= other.levels and other.project in (ALL_PROJECTS, self.project) and other.text in self.text
+
+
+@dataclass
+class LineChunk:
+    firstNumber: int
+    texts:       List[str] = field(default_factory=list)
+    levels:      bytearray = field(default_factory=bytearray)
+    projects:    array     = field(default_factory=lambda: array('L'))
+    blob:        bytes     = b''
+    offsets:     array     = field(default_factory=lambda: array('L'))
+
+    @property
+    def sealed(self) -> bool:
+        return len(self.offsets) > 0
+
+    def seal(self):
+        """
+        Packs the texts into one blob;  The chunk is read only afterward
+        """
+        encoded: List[bytes] = [text.encode('utf-8') for text in self.texts]
+        offset:  int         = 0
+
+        self.offsets.append(offset)
+        for line in encoded:
+            offset += len(line)
+            self.offsets.append(offset)
+
+        self.blob  = b''.join(encoded)
+        self.texts = []
+
+    def text(self, index: int) -> str:
+        if self.sealed is True:
+            return self.blob[self.offsets[index]:self.offsets[index + 1]].decode('utf-8')
+        else:
+            return self.texts[index]
+
+
+class ConsoleLineStore:
+    """
+    A compact, bounded store of console lines with a filtered view.  The view is a sorted array
+    of line numbers;  Appending a line extends it when the line matches, and a filter that narrows
+    the one in effect only re-examines the lines already in view, when the view is small.  Other
+    filter changes rescan the store, skipping whole chunks that cannot match
+    """
+    def __init__(self, maximumLines: int = MAXIMUM_LINES):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._maximumChunks: int              = max(2, maximumLines // CHUNK_SIZE)
+        self._chunks:        Deque[LineChunk] = deque()
+        self._nextNumber:    int              = 0
+        self._projectNames:  List[str]        = []
+        self._projectIds:    Dict[str, int]   = {}
+        self._lineFilter:    LineFilter       = LineFilter()
+        self._visible:       array            = array('Q')
+
+    @property
+    def lineCount(self) -> int:
+        """
+        The number of retained lines
+        """
+        if len(self._chunks) == 0:
+            return 0
+        return self._nextNumber - self._chunks[0].firstNumber
+
+    @property
+    def visibleCount(self) -> int:
+        return len(self._visible)
+
+    @property
+    def projects(self) -> List[str]:
+        return list(self._projectNames)
+
+    @property
+    def lineFilter(self) -> LineFilter:
+        return self._lineFilter
+
+    @lineFilter.setter
+    def lineFilter(self, lineFilter: LineFilter):
+
+        if lineFilter.narrows(self._lineFilter) is True and len(self._visible) * NARROWING_RATIO < self.lineCount:
+            self._visible = array('Q', [number for number in self._visible if self._matches(lineFilter, number)])
+        else:
+            self._visible = self._rescan(lineFilter)
+
+        self._lineFilter = lineFilter
+
+    def append(self, text: str, level: LineLevel = LineLevel.INFO, project: str = ALL_PROJECTS) -> bool:
+        """
+        Args:
+            text:       The line
+            level:      Its severity
+            project:    The project that reported it
+
+        Returns:  True if the line is in the filtered view
+        """
+        chunk: LineChunk = self._openChunk()
+
+        chunk.texts.append(text)
+        chunk.levels.append(level.value)
+        chunk.projects.append(self._projectId(project))
+
+        number: int = self._nextNumber
+        self._nextNumber += 1
+
+        lineFilter: LineFilter = self._lineFilter
+        visible:    bool       = level in lineFilter.levels and lineFilter.project in (ALL_PROJECTS, project) and lineFilter.text in text
+        if visible is True:
+            self._visible.append(number)
+
+        return visible
+
+    def visibleLine(self, row: int) -> ConsoleLine:
+        """
+        Args:
+            row:  A row of the filtered view
+
+        Returns:  The line shown on that row;  Numbered from one
+        """
+        return self.line(self._visible[row])
+
+    def line(self, number: int) -> ConsoleLine:
+
+        chunk, index = self._locate(number)
+
+        return ConsoleLine(number=number + 1,
+                           text=chunk.text(index),
+                           level=LineLevel(chunk.levels[index]),
+                           project=self._projectNames[chunk.projects[index]])
+
+    def clear(self):
+        """
+        Forgets every line and project;  Numbering starts over
+        """
+        self._chunks.clear()
+        self._nextNumber = 0
+        self._projectNames.clear()
+        self._projectIds.clear()
+        self._visible = array('Q')
+
+    def _openChunk(self) -> LineChunk:
+
+        if len(self._chunks) == 0 or len(self._chunks[-1].levels) == CHUNK_SIZE:
+            if len(self._chunks) > 0:
+                self._chunks[-1].seal()
+            if len(self._chunks) == self._maximumChunks:
+                self._evictOldestChunk()
+            self._chunks.append(LineChunk(firstNumber=self._nextNumber))
+
+        return self._chunks[-1]
+
+    def _evictOldestChunk(self):
+
+        self._chunks.popleft()
+
+        firstNumber: int = self._chunks[0].firstNumber
+
+        del self._visible[:bisect_left(self._visible, firstNumber)]
+
+    def _locate(self, number: int):
+        """
+        Every chunk but the newest is full, so a line's chunk is arithmetic
+        """
+        relative: int = number - self._chunks[0].firstNumber
+
+        return self._chunks[relative // CHUNK_SIZE], relative % CHUNK_SIZE
+
+    def _projectId(self, project: str) -> int:
+
+        projectId: int = self._projectIds.get(project, -1)
+        if projectId == -1:
+            projectId = len(self._projectNames)
+            self._projectNames.append(project)
+            self._projectIds[project] = projectId
+
+        return projectId
+
+    def _matches(self, lineFilter: LineFilter, number: int) -> bool:
+
+        chunk, index = self._locate(number)
+
+        if LineLevel(chunk.levels[index]) not in lineFilter.levels:
+            return False
+        if lineFilter.project != ALL_PROJECTS and self._projectNames[chunk.projects[index]] != lineFilter.project:
+            return False
+
+        return lineFilter.text == '' or lineFilter.text in chunk.text(index)
+
+    def _rescan(self, lineFilter: LineFilter) -> array:
+
+        visible:     array = array('Q')
+        levelMarks:  bytes = bytes(1 if value in {level.value for level in lineFilter.levels} else 0 for value in range(256))
+        encodedText: bytes = lineFilter.text.encode('utf-8')
+        projectId:   int   = self._projectIds.get(lineFilter.project, -1)
+        anyProject:  bool  = lineFilter.project == ALL_PROJECTS
+
+        if anyProject is False and projectId == -1:
+            return visible
+
+        for chunk in self._chunks:
+            if anyProject is False and projectId not in chunk.projects:
+                continue
+            if chunk.sealed is True and encodedText not in chunk.blob:
+                continue
+            marks: bytearray = chunk.levels.translate(levelMarks)
+            if anyProject is True and lineFilter.text == '' and 0 not in marks:
+                visible.extend(range(chunk.firstNumber, chunk.firstNumber + len(marks)))
+                continue
+            #
+            # Let bytearray.find walk to the lines at a wanted level
+            #
+            index: int       = marks.find(1)
+            while index != -1:
+                if (anyProject is True or chunk.projects[index] == projectId) and (lineFilter.text == '' or lineFilter.text in chunk.text(index)):
+                    visible.append(chunk.firstNumber + index)
+                index = marks.find(1, index + 1)
+
+        return visible
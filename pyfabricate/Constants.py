@@ -3,3 +3,12 @@
 APPLICATION_NAME: str = 'pyfabricate'
 
 TEMPLATES_DIRECTORY_NAME: str = 'templates'
+CACHE_DIRECTORY_NAME:     str = 'cache'
+TOKENS_FILE_NAME:         str = 'tokens.json'
+DAEMON_SOCKET_NAME:       str = 'pyfabricated.sock'
+WHEELS_DIRECTORY_NAME:    str = 'wheels'
+
+GOLDEN_ENVIRONMENTS_DIRECTORY_NAME: str = 'goldenEnvironments'
+DROP_WHEELS_DIRECTORY_NAME:         str = 'dropWheels'
+PYTHON_VERSIONS_FILE_NAME:          str = 'pythonVersions.json'
+INTERPRETERS_FILE_NAME:             str = 'interpreters.json'
@@ -1,10 +1,17 @@
 
+from os import environ as osEnvironment
+
+from pathlib import Path
+
 THE_GREAT_MAC_PLATFORM: str = 'macOS'
 
+PYENV_ROOT_VARIABLE:  str = 'PYENV_ROOT'
+PYENV_ROOT_DIRECTORY: str = '.pyenv'
+
 PYENV_CMD:             str = 'pyenv'
 
 MAC_OS_PYENV_PATH:     str = f'/opt/homebrew/bin'
-NON_MAC_OS_PYENV_PATH: str = f'/home/circleci/.pyenv/bin'
+NON_MAC_OS_PYENV_PATH: str = f'{osEnvironment.get(PYENV_ROOT_VARIABLE, Path.home() / PYENV_ROOT_DIRECTORY)}/bin'
 
 MAC_OS_PYENV_CMD:     str = f'{MAC_OS_PYENV_PATH}/{PYENV_CMD} versions'
 NON_MAC_OS_PYENV_CMD: str = f'{NON_MAC_OS_PYENV_PATH}/{PYENV_CMD} versions'
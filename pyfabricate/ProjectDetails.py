@@ -1,10 +1,15 @@
 
+from typing import Any
+from typing import Dict
+
 from dataclasses import dataclass
 
 from pathlib import Path
 
 from semantic_version import Version as SemanticVersion
 
+ProjectDetailsDictionary = Dict[str, Any]
+
 
 @dataclass
 class ProjectDetails:
@@ -18,3 +23,44 @@ class ProjectDetails:
     baseDirectory: Path = Path('/')
 
     pythonVersion: SemanticVersion = SemanticVersion('0.0.0')
+
+    def toDictionary(self) -> ProjectDetailsDictionary:
+        """
+        Returns:  A JSON friendly representation of these details
+        """
+        return {
+            'name':          self.name,
+            'moduleName':    self.moduleName,
+            'ownerName':     self.ownerName,
+            'ownerEmail':    self.ownerEmail,
+            'description':   self.description,
+            'keywords':      self.keywords,
+            'baseDirectory': str(self.baseDirectory),
+            'pythonVersion': str(self.pythonVersion),
+        }
+
+    @classmethod
+    def fromDictionary(cls, dictionary: ProjectDetailsDictionary) -> 'ProjectDetails':
+        """
+        Missing keys take the dataclass defaults;  Unknown keys are ignored
+
+        Args:
+            dictionary:  Typically, something read from a JSON document
+
+        Returns:  A fully typed project details object
+        """
+        projectDetails: ProjectDetails = ProjectDetails()
+
+        projectDetails.name        = dictionary.get('name',        projectDetails.name)
+        projectDetails.moduleName  = dictionary.get('moduleName',  projectDetails.moduleName)
+        projectDetails.ownerName   = dictionary.get('ownerName',   projectDetails.ownerName)
+        projectDetails.ownerEmail  = dictionary.get('ownerEmail',  projectDetails.ownerEmail)
+        projectDetails.description = dictionary.get('description', projectDetails.description)
+        projectDetails.keywords    = dictionary.get('keywords',    projectDetails.keywords)
+
+        if 'baseDirectory' in dictionary:
+            projectDetails.baseDirectory = Path(dictionary['baseDirectory']).expanduser()
+        if 'pythonVersion' in dictionary:
+            projectDetails.pythonVersion = SemanticVersion(str(dictionary['pythonVersion']))
+
+        return projectDetails
@@ -0,0 +1,245 @@
+
+from logging import config
+
+from os import sep as osSep
+
+from json import load as jsonLoad
+
+from pathlib import Path
+
+from click import Choice
+from click import argument
+from click import echo
+from click import group
+from click import option
+from click import version_option
+from click import Path as ClickPath
+
+from codeallybasic.ResourceManager import ResourceManager
+
+from pyfabricate import __version__
+
+from pyfabricate.Settings import Settings
+
+from pyfabricate.batch.BatchFabricator import BatchFabricator
+from pyfabricate.batch.BatchFabricator import BatchReport
+from pyfabricate.batch.BatchFabricator import DEFAULT_WORKER_COUNT
+from pyfabricate.batch.BatchManifest import BatchManifest
+
+from pyfabricate.daemon.DaemonClient import DaemonClient
+from pyfabricate.daemon.DaemonClient import DaemonResponses
+from pyfabricate.daemon.FabricationDaemon import Priority
+from pyfabricate.daemon.FabricationDaemon import defaultSocketPath
+
+from pyfabricate.fabrication.DryRunExecutor import DryRunReport
+from pyfabricate.fabrication.FabricationError import FabricationError
+from pyfabricate.fabrication.FabricationManifest import VerificationReport
+from pyfabricate.fabrication.Fabricator import Fabricator
+from pyfabricate.fabrication.OutputPolicy import OutputPolicy
+from pyfabricate.fabrication.ProjectUpdater import UpdateAction
+from pyfabricate.fabrication.ProjectUpdater import UpdateReport
+
+from pyfabricate.oswrapper.Wheelhouse import Wheelhouse
+
+JSON_LOGGING_CONFIG_FILENAME: str = "loggingConfiguration.json"
+RESOURCES_PACKAGE_NAME:       str = 'pyfabricate.resources'
+RESOURCES_PATH:               str = f'pyfabricate{osSep}resources'
+
+
+def setUpLogging():
+    """
+    The headless commands share the application's logging configuration;  They never import wxPython
+    """
+    import logging
+
+    configFilePath: str = ResourceManager.retrieveResourcePath(bareFileName=JSON_LOGGING_CONFIG_FILENAME,
+                                                               resourcePath=RESOURCES_PATH,
+                                                               packageName=RESOURCES_PACKAGE_NAME)
+
+    with open(configFilePath, 'r') as loggingConfigurationFile:
+        configurationDictionary = jsonLoad(loggingConfigurationFile)
+
+    config.dictConfig(configurationDictionary)
+    logging.logProcesses = False
+    logging.logThreads   = False
+
+
+@group()
+@version_option(version=f'{__version__}', message='%(version)s')
+def commandHandler():
+    """
+    Headless PyFabricate commands
+    """
+    setUpLogging()
+
+
+@commandHandler.command()
+@argument('manifest', type=ClickPath(exists=True, dir_okay=False, path_type=Path))
+@option('-w', '--workers', type=int, default=DEFAULT_WORKER_COUNT, show_default=True, help='The number of worker processes')
+@option('-o', '--output-policy', 'outputPolicyValue',
+        type=Choice([outputPolicy.value for outputPolicy in OutputPolicy]),
+        default=None,
+        help='How to materialize files;  Defaults to the outputPolicy setting')
+def batch(manifest: Path, workers: int, outputPolicyValue: str):
+    """
+    Fabricate all the projects described in MANIFEST
+    """
+    if outputPolicyValue is None:
+        outputPolicy: OutputPolicy = Settings().outputPolicy
+    else:
+        outputPolicy = OutputPolicy(outputPolicyValue)
+
+    batchManifest:   BatchManifest   = BatchManifest(manifestPath=manifest)
+    batchFabricator: BatchFabricator = BatchFabricator(projects=batchManifest.projects, workers=workers, outputPolicy=outputPolicy)
+
+    report: BatchReport = batchFabricator.fabricate()
+
+    for failure in report.failures:
+        echo(f'FAILED {failure.projectName}: {failure.message}', err=True)
+
+    echo(report.summary)
+
+    if len(report.failures) > 0:
+        raise SystemExit(1)
+
+
+@commandHandler.command()
+@argument('manifest', type=ClickPath(exists=True, dir_okay=False, path_type=Path))
+@option('-s', '--socket', 'socketPath', type=ClickPath(dir_okay=False, path_type=Path), default=None, help='Defaults to the pyfabricated socket in the configuration directory')
+@option('-p', '--priority', 'priorityValue',
+        type=Choice([priority.value for priority in Priority]),
+        default=Priority.BATCH.value,
+        show_default=True)
+def submit(manifest: Path, socketPath: Path, priorityValue: str):
+    """
+    Have a running pyfabricated fabricate the projects described in MANIFEST
+    """
+    batchManifest: BatchManifest = BatchManifest(manifestPath=manifest)
+    daemonClient:  DaemonClient  = DaemonClient(socketPath=defaultSocketPath() if socketPath is None else socketPath)
+
+    try:
+        responses: DaemonResponses = daemonClient.fabricate(projects=batchManifest.projects, priority=Priority(priorityValue))
+    except FabricationError as fe:
+        echo(fe.message, err=True)
+        raise SystemExit(1)
+
+    failures: int = 0
+    for projectDetails, response in zip(batchManifest.projects, responses):
+        if response['success'] is True:
+            echo(f'{projectDetails.name}: {response["result"]["elapsed"] * 1000:.1f} ms, queued {response["queued"] * 1000:.1f} ms')
+        else:
+            failures += 1
+            echo(f'FAILED {projectDetails.name}: {response["message"]}', err=True)
+
+    if failures > 0:
+        raise SystemExit(1)
+
+
+@commandHandler.command(name='dryrun')
+@argument('manifest', type=ClickPath(exists=True, dir_okay=False, path_type=Path))
+def dryRun(manifest: Path):
+    """
+    Report what fabricating the projects in MANIFEST would write, without writing it
+    """
+    batchManifest: BatchManifest = BatchManifest(manifestPath=manifest)
+
+    byteCount:    int = 0
+    syscallCount: int = 0
+    for projectDetails in batchManifest.projects:
+        try:
+            report: DryRunReport = Fabricator(projectDetails=projectDetails).dryRun()
+        except FabricationError as fe:
+            echo(f'FAILED {projectDetails.name}: {fe.message}', err=True)
+            continue
+
+        echo(report.summary)
+        byteCount    += report.byteCount
+        syscallCount += report.syscallCount
+
+    echo(f'Total: {len(batchManifest.projects)} projects, {byteCount} bytes, {syscallCount} file system operations')
+
+
+@commandHandler.command()
+@argument('project', type=ClickPath(exists=True, file_okay=False, path_type=Path))
+def update(project: Path):
+    """
+    Re-apply changed templates to the fabricated PROJECT
+    """
+    try:
+        report: UpdateReport = Fabricator.forUpdate(projectPath=project.resolve()).update()
+    except FabricationError as fe:
+        echo(f'FAILED {project}: {fe.message}', err=True)
+        raise SystemExit(1)
+
+    for result in report.results:
+        if result.action != UpdateAction.UNCHANGED:
+            echo(f'{result.action.value:>9} {result.relativePath}')
+
+    echo(report.summary)
+
+    if len(report.conflicts) > 0:
+        echo(f'Resolve the conflict markers in {len(report.conflicts)} file(s)', err=True)
+        raise SystemExit(1)
+
+
+@commandHandler.command()
+@argument('project', type=ClickPath(exists=True, file_okay=False, path_type=Path))
+def verify(project: Path):
+    """
+    Check whether the fabricated PROJECT still matches its templates
+    """
+    try:
+        report: VerificationReport = Fabricator.verify(projectPath=project.resolve())
+    except FabricationError as fe:
+        echo(f'FAILED {project}: {fe.message}', err=True)
+        raise SystemExit(1)
+
+    for relativePath in report.modified:
+        echo(f' modified {relativePath}')
+    for relativePath in report.missing:
+        echo(f'  missing {relativePath}')
+    for templateName in report.changedTemplates:
+        echo(f'  changed template {templateName}')
+
+    echo(report.summary)
+
+    if report.isClean is False:
+        raise SystemExit(1)
+
+
+@commandHandler.command()
+@argument('template')
+def customize(template: str):
+    """
+    Copy the packaged TEMPLATE into the configuration directory to change it
+    """
+    try:
+        templatePath: Path = Fabricator.customizeTemplate(templateName=template)
+    except FabricationError as fe:
+        echo(f'FAILED {template}: {fe.message}', err=True)
+        raise SystemExit(1)
+
+    echo(f'Fabrication now uses {templatePath}')
+
+
+@commandHandler.command()
+@option('-i', '--import', 'dropPath', type=ClickPath(exists=True, file_okay=False, path_type=Path), default=None,
+        help='Also import the wheels in this directory;  The drop directory is always imported')
+def wheelhouse(dropPath: Path):
+    """
+    Import new wheels into the local wheelhouse and list it
+    """
+    configurationWheelhouse: Wheelhouse = Fabricator.wheelhouse(configurationTemplatePath=Fabricator.prepareTemplates())
+
+    importedCount: int = len(configurationWheelhouse.importWheels())
+    if dropPath is not None:
+        importedCount += len(Wheelhouse(wheelhousePath=configurationWheelhouse.path, dropPath=dropPath).importWheels())
+
+    for wheel in configurationWheelhouse.wheels:
+        echo(f'{wheel.name:>30} {wheel.version} {wheel.path.name}')
+
+    echo(f'Imported {importedCount} wheels into {configurationWheelhouse.path}')
+
+
+if __name__ == "__main__":
+    commandHandler()
@@ -1,4 +1,7 @@
 
+from typing import Callable
+from typing import Dict
+from typing import FrozenSet
 from typing import Optional
 
 from logging import Logger
@@ -6,24 +9,35 @@ from logging import getLogger
 
 from os import getenv as osGetEnv
 
+from threading import Thread
+
+from wx import Button
+from wx import CallAfter
+from wx import Choice
 from wx import ClientDC
+from wx import CloseEvent
 from wx import CommandEvent
 from wx import DEFAULT_FRAME_STYLE
 from wx import FRAME_FLOAT_ON_PARENT
 from wx import FRAME_TOOL_WINDOW
-from wx import HSCROLL
+from wx import ICON_ERROR
 from wx import ID_ABOUT
 from wx import ID_ANY
 from wx import ID_EXIT
 from wx import Icon
 from wx import Menu
 from wx import MenuBar
+from wx import NOT_FOUND
+from wx import MessageDialog
+from wx import OK
 from wx import Point
+from wx import SearchCtrl
+from wx import EVT_BUTTON
+from wx import EVT_CHOICE
+from wx import EVT_CLOSE
 from wx import EVT_MENU
+from wx import EVT_TEXT
 from wx import Size
-from wx import TE_MULTILINE
-
-from wx import Yield as wxYield
 
 from wx.adv import AboutBox
 from wx.adv import AboutDialogInfo
@@ -33,13 +47,26 @@ from wx.lib.sized_controls import SizedPanel
 
 from wx.lib.wordwrap import wordwrap
 
-from wx.richtext import RichTextCtrl
-
 from codeallybasic.SecureConversions import SecureConversions
 
+from pyfabricate.BufferedConsole import BufferedConsole
+
+from pyfabricate.ConsoleLineStore import ALL_LEVELS
+from pyfabricate.ConsoleLineStore import ALL_PROJECTS
+from pyfabricate.ConsoleLineStore import LineFilter
+from pyfabricate.ConsoleLineStore import LineLevel
+
+from pyfabricate.fabrication.FabricationCancelled import FabricationCancelled
 from pyfabricate.fabrication.FabricationError import FabricationError
 from pyfabricate.fabrication.Fabricator import Fabricator
+from pyfabricate.fabrication.GoldenEnvironmentCache import MEGABYTE
+from pyfabricate.fabrication.ProgressReporter import ErrorReported
+from pyfabricate.fabrication.ProgressReporter import NO_PROGRESS_REPORTER
+from pyfabricate.fabrication.ProgressReporter import ProgressEvents
+from pyfabricate.fabrication.ProgressReporter import ProgressReporter
+from pyfabricate.fabrication.ProgressReporter import WarningReported
 from pyfabricate.ProjectDetails import ProjectDetails
+from pyfabricate.Settings import Settings
 
 from pyfabricate import __version__ as pyFabricateVersion
 
@@ -64,6 +91,24 @@ project should look like.
 
 DESCRIPTION_WIDTH: int = 400
 
+LEVEL_CHOICES: Dict[str, FrozenSet[LineLevel]] = {
+    'All lines':           ALL_LEVELS,
+    'Warnings and errors': frozenset({LineLevel.WARNING, LineLevel.ERROR}),
+    'Errors':              frozenset({LineLevel.ERROR}),
+}
+ALL_PROJECTS_CHOICE: str = 'All projects'
+
+#
+# Each batch of progress events is one CallAfter
+#
+PROGRESS_BATCH_SIZE:     int   = 64
+PROGRESS_BATCH_INTERVAL: float = 0.05
+
+#
+# A cancelled fabrication stops at its next checkpoint and removes its staging directory;  Closing waits this long for it
+#
+CLOSE_TIMEOUT: float = 10.0
+
 
 class PyFabricateFrame(SizedFrame):
     def __init__(self):
@@ -90,27 +135,124 @@ class PyFabricateFrame(SizedFrame):
         self._makeMenus()
 
         panel: SizedPanel = self.GetContentsPane()
-        panel.SetSizerType('horizontal')
+        panel.SetSizerType('vertical')
+
+        self._layoutFilterControls(parent=panel)
 
-        self._console: RichTextCtrl = RichTextCtrl(parent=panel, size=Size(WINDOW_WIDTH, WINDOW_HEIGHT), style=TE_MULTILINE | HSCROLL)
-        self._console.SetSizerProps(expand=True)
+        self._console: BufferedConsole = BufferedConsole(parent=panel, size=Size(WINDOW_WIDTH, WINDOW_HEIGHT))
+        self._console.SetSizerProps(expand=True, proportion=1)
 
-        self._lineNumber: int = 0
+        self._projectName:      str              = ALL_PROJECTS
+        self._progressReporter: ProgressReporter = NO_PROGRESS_REPORTER
+        self._worker:           Thread           = Thread()
+
+        self.Bind(EVT_CLOSE, self._onClose)
 
     def runOperations(self, projectDetails: ProjectDetails):
+        """
+        Fabricates on a worker thread;  The worker reaches the UI only through `CallAfter`
+
+        Args:
+            projectDetails:  The project to fabricate
+        """
+        if self._worker.is_alive() is True:
+            self.logger.warning(f'Fabrication is running;  Ignoring {projectDetails.name}')
+            return
 
         self.SetSize(Size(WINDOW_WIDTH, WINDOW_HEIGHT))
         self.Layout()
-        wxYield()
+
+        self._projectName = projectDetails.name
+        if self._projectChoice.FindString(self._projectName) == NOT_FOUND:
+            self._projectChoice.Append(self._projectName)
 
         self._addLineToConsole('Operations are running')
         self._addLineToConsole(f'{projectDetails}')
 
+        self._progressReporter = ProgressReporter(batchSize=PROGRESS_BATCH_SIZE, batchInterval=PROGRESS_BATCH_INTERVAL)
+        self._progressReporter.subscribe(self._onProgressEvents)
+
+        self._cancelButton.Enable()
+        self._worker = Thread(target=self._fabricate, args=(projectDetails, self._progressReporter), name='Fabrication', daemon=True)
+        self._worker.start()
+
+    def _fabricate(self, projectDetails: ProjectDetails, progressReporter: ProgressReporter):
+        """
+        Runs on the worker thread
+
+        Args:
+            projectDetails:     The project to fabricate
+            progressReporter:   Delivers progress to the UI thread
+        """
+        errorMessage: str  = ''
+        cancelled:    bool = False
         try:
-            fabricator: Fabricator = Fabricator(projectDetails=projectDetails, progressCallback=self._addLineToConsole)
+            settings:   Settings   = Settings()
+            fabricator: Fabricator = Fabricator(projectDetails=projectDetails,
+                                                outputPolicy=settings.outputPolicy,
+                                                progressReporter=progressReporter,
+                                                createVirtualEnvironment=settings.createVirtualEnvironment,
+                                                pipPolicy=settings.pipPolicy,
+                                                goldenEnvironmentBytes=settings.goldenEnvironmentMegabytes * MEGABYTE)
             fabricator.fabricate()
+        except FabricationCancelled:
+            cancelled = True
         except FabricationError as fe:
             self.logger.error(f'{fe.message}')
+            errorMessage = fe.message
+        except Exception as e:
+            self.logger.exception(f'Fabrication of {projectDetails.name} failed')
+            errorMessage = f'{e.__class__.__name__}: {e}'
+        finally:
+            progressReporter.flush()
+
+        self._callAfter(self._onFabricationFinished, errorMessage, cancelled)
+
+    def _onFabricationFinished(self, errorMessage: str, cancelled: bool):
+
+        self._cancelButton.Disable()
+        if cancelled is True:
+            self._addLineToConsole('Fabrication cancelled', level=LineLevel.WARNING)
+        self._console.flush()
+
+        if errorMessage != '':
+            booBoo: MessageDialog = MessageDialog(parent=None,
+                                                  message=errorMessage,
+                                                  caption='Fabrication Error',
+                                                  style=OK | ICON_ERROR)
+            booBoo.ShowModal()
+            booBoo.Destroy()
+
+    def _callAfter(self, function: Callable, *args):
+        """
+        Marshals a call onto the UI thread;  Dropped if the frame is gone by then
+        """
+        def whenAlive():
+            if self:
+                function(*args)
+
+        CallAfter(whenAlive)
+
+    def _layoutFilterControls(self, parent: SizedPanel):
+
+        filterPanel: SizedPanel = SizedPanel(parent)
+        filterPanel.SetSizerType('horizontal')
+
+        self._levelChoice:   Choice     = Choice(filterPanel, choices=list(LEVEL_CHOICES.keys()))
+        self._projectChoice: Choice     = Choice(filterPanel, choices=[ALL_PROJECTS_CHOICE])
+        self._searchControl: SearchCtrl = SearchCtrl(filterPanel)
+        self._cancelButton:  Button     = Button(filterPanel, label='Cancel')
+
+        self._levelChoice.SetSelection(0)
+        self._projectChoice.SetSelection(0)
+        self._searchControl.SetDescriptiveText('Filter')
+        self._searchControl.SetSizerProps(expand=True, proportion=1)
+        self._cancelButton.Disable()
+
+        self.Bind(EVT_CHOICE, self._onFilterChanged, self._levelChoice)
+        self.Bind(EVT_CHOICE, self._onFilterChanged, self._projectChoice)
+        self.Bind(EVT_TEXT,   self._onFilterChanged, self._searchControl)
+        self.Bind(EVT_BUTTON, self._onCancel,        self._cancelButton)
 
     def _makeMenus(self):
         fileMenu: Menu = Menu()
@@ -126,6 +268,36 @@ class PyFabricateFrame(SizedFrame):
 
         self.SetMenuBar(menuBar)
 
+    # noinspection PyUnusedLocal
+    def _onFilterChanged(self, event: CommandEvent):
+
+        project: str = self._projectChoice.GetStringSelection()
+        if project == ALL_PROJECTS_CHOICE:
+            project = ALL_PROJECTS
+
+        self._console.lineFilter = LineFilter(levels=LEVEL_CHOICES[self._levelChoice.GetStringSelection()],
+                                              project=project,
+                                              text=self._searchControl.GetValue())
+
+    # noinspection PyUnusedLocal
+    def _onCancel(self, event: CommandEvent):
+
+        self._cancelButton.Disable()
+        self._progressReporter.cancel()
+        self._addLineToConsole('Cancelling after the current step', level=LineLevel.WARNING)
+
+    def _onClose(self, event: CloseEvent):
+        """
+        The worker is a daemon thread;  Without the join, the process could exit mid-fabrication
+        and leave the staging directory behind
+        """
+        if self._worker.is_alive() is True:
+            self._progressReporter.cancel()
+            self._worker.join(timeout=CLOSE_TIMEOUT)
+            if self._worker.is_alive() is True:
+                self.logger.warning(f'Fabrication did not stop within {CLOSE_TIMEOUT} seconds')
+        event.Skip()
+
     # noinspection PyUnusedLocal
     def _onFileExit(self, event: CommandEvent):
         self.Close(True)
@@ -149,25 +321,29 @@ class PyFabricateFrame(SizedFrame):
 
         AboutBox(info)
 
-    def _addLineToConsole(self, text: str):
+    def _onProgressEvents(self, events: ProgressEvents):
         """
-        Adds a line to our pseudo operations console.  Scrolls to end
-        so last line is always visible
-
-        Args:
-            text:  The line to append
+        Called on the worker thread
         """
+        self._callAfter(self._showProgressEvents, events)
+
+    def _showProgressEvents(self, events: ProgressEvents):
 
-        self._lineNumber += 1
+        for event in events:
+            if isinstance(event, ErrorReported):
+                self._addLineToConsole(str(event), level=LineLevel.ERROR)
+            elif isinstance(event, WarningReported):
+                self._addLineToConsole(str(event), level=LineLevel.WARNING)
+            else:
+                self._addLineToConsole(str(event))
 
-        self._console.BeginFontSize(14)
-        self._console.BeginTextColour((255, 0, 0))
-        self._console.WriteText(f'{self._lineNumber}: ')
-        self._console.EndTextColour()
-        self._console.EndFontSize()
+    def _addLineToConsole(self, text: str, level: LineLevel = LineLevel.INFO):
+        """
+        Adds a line to our pseudo operations console.  The console draws lines in batches
+        and scrolls to the end so the last line is always visible
 
-        self._console.WriteText(text=f'{text}')
-        self._console.Newline()
-        carrotPosition: float = self._console.GetCaretPosition()        # Hee, hee
-        self._console.ShowPosition(carrotPosition)
-        wxYield()
+        Args:
+            text:   The line to append
+            level:  Its severity;  The console can filter by it
+        """
+        self._console.addLine(text, level=level, project=self._projectName)
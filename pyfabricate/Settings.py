@@ -8,10 +8,14 @@ from codeallybasic.DynamicConfiguration import Sections
 from codeallybasic.DynamicConfiguration import ValueDescription
 from codeallybasic.DynamicConfiguration import ValueDescriptions
 
+from codeallybasic.SecureConversions import SecureConversions
 from codeallybasic.SingletonV3 import SingletonV3
 
 from pyfabricate.Constants import APPLICATION_NAME
 
+from pyfabricate.fabrication.OutputPolicy import OutputPolicy
+from pyfabricate.oswrapper.VirtualEnvironmentBuilder import PipPolicy
+
 
 def toPath(pathString: str) -> Path:
     return Path(pathString)
@@ -29,9 +33,20 @@ PROJECT_PROPERTIES: ValueDescriptions = ValueDescriptions(
     }
 )
 
+FABRICATION_PROPERTIES: ValueDescriptions = ValueDescriptions(
+    {
+        KeyName('outputPolicy'):               ValueDescription(defaultValue=OutputPolicy.PLAIN.value, deserializer=OutputPolicy, enumUseValue=True),
+        KeyName('createVirtualEnvironment'):   ValueDescription(defaultValue='False', deserializer=SecureConversions.secureBoolean),
+        KeyName('pipPolicy'):                  ValueDescription(defaultValue=PipPolicy.CACHED_WHEEL.value, deserializer=PipPolicy, enumUseValue=True),
+        KeyName('goldenEnvironmentMegabytes'): ValueDescription(defaultValue='2048', deserializer=int),
+        KeyName('interpreterDirectories'):     ValueDescription(defaultValue=''),
+    }
+)
+
 SETTINGS_SECTIONS: Sections = Sections(
     {
-        SectionName('Project'): PROJECT_PROPERTIES,
+        SectionName('Project'):     PROJECT_PROPERTIES,
+        SectionName('Fabrication'): FABRICATION_PROPERTIES,
     }
 )
 
@@ -0,0 +1,164 @@
+
+from typing import List
+from typing import NewType
+
+from logging import Logger
+from logging import getLogger
+
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from os import cpu_count
+
+from pathlib import Path
+
+from time import perf_counter
+
+from pyfabricate.ProjectDetails import ProjectDetails
+
+from pyfabricate.batch.BatchManifest import ProjectDetailsList
+
+from pyfabricate.fabrication.FabricationError import FabricationError
+from pyfabricate.fabrication.Fabricator import Fabricator
+from pyfabricate.fabrication.OutputPolicy import OutputPolicy
+from pyfabricate.fabrication.ProgressReporter import ProgressReporter
+from pyfabricate.fabrication.ProgressReporter import ProgressSummary
+
+DEFAULT_WORKER_COUNT: int = cpu_count() or 1
+
+#
+# Workers only aggregate progress;  One delivery per this many events
+#
+PROGRESS_BATCH_SIZE: int = 256
+
+
+@dataclass
+class FabricationResult:
+    projectName: str   = ''
+    success:     bool  = True
+    elapsed:     float = 0.0
+    message:     str   = ''
+    fileCount:   int   = 0
+    byteCount:   int   = 0
+    writeTime:   float = 0.0
+
+
+FabricationResults = NewType('FabricationResults', List[FabricationResult])
+
+
+def fabricationResultsFactory() -> FabricationResults:
+    return FabricationResults([])
+
+
+@dataclass
+class BatchReport:
+    workers: int                = 1
+    elapsed: float              = 0.0
+    results: FabricationResults = field(default_factory=fabricationResultsFactory)
+
+    @property
+    def failures(self) -> FabricationResults:
+        return FabricationResults([result for result in self.results if result.success is False])
+
+    @property
+    def projectsPerSecond(self) -> float:
+        if self.elapsed == 0.0:
+            return 0.0
+        return len(self.results) / self.elapsed
+
+    @property
+    def fileCount(self) -> int:
+        return sum(result.fileCount for result in self.results)
+
+    @property
+    def byteCount(self) -> int:
+        return sum(result.byteCount for result in self.results)
+
+    @property
+    def summary(self) -> str:
+        succeeded: int = len(self.results) - len(self.failures)
+        return (
+            f'Fabricated {succeeded}/{len(self.results)} projects with {self.workers} workers '
+            f'in {self.elapsed:.2f}s ({self.projectsPerSecond:.1f} projects/s); '
+            f'{self.fileCount} files, {self.byteCount} bytes; failures: {len(self.failures)}'
+        )
+
+
+def fabricateProject(projectDetails: ProjectDetails, outputPolicy: OutputPolicy = OutputPolicy.PLAIN) -> FabricationResult:
+    """
+    Runs in a worker process;  Must stay a module level function so that it pickles
+
+    Args:
+        projectDetails:  The project to fabricate
+        outputPolicy:    How to materialize the fabricated files
+
+    Returns:  How it went
+    """
+    startTime: float = perf_counter()
+
+    progressSummary:  ProgressSummary  = ProgressSummary()
+    progressReporter: ProgressReporter = ProgressReporter(batchSize=PROGRESS_BATCH_SIZE)
+    progressReporter.subscribe(progressSummary)
+    try:
+        fabricator: Fabricator = Fabricator(projectDetails=projectDetails, outputPolicy=outputPolicy, progressReporter=progressReporter)
+        fabricator.fabricate()
+        result: FabricationResult = FabricationResult(projectName=projectDetails.name)
+    except FabricationError as fe:
+        result = FabricationResult(projectName=projectDetails.name, success=False, message=fe.message)
+    except Exception as e:
+        result = FabricationResult(projectName=projectDetails.name, success=False, message=f'{e.__class__.__name__}: {e}')
+
+    progressReporter.flush()
+
+    result.elapsed   = perf_counter() - startTime
+    result.fileCount = progressSummary.fileCount
+    result.byteCount = progressSummary.byteCount
+    result.writeTime = progressSummary.writeTime
+
+    return result
+
+
+class BatchFabricator:
+    """
+    Fabricates many projects across a process pool.  Fabrication is I/O heavy, but template
+    substitution and the Python overhead of each step are CPU bound;  Separate processes
+    side step the GIL
+    """
+    def __init__(self, projects: ProjectDetailsList, workers: int = DEFAULT_WORKER_COUNT, outputPolicy: OutputPolicy = OutputPolicy.PLAIN):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._projects:     ProjectDetailsList = projects
+        self._workers:      int                = max(1, workers)
+        self._outputPolicy: OutputPolicy       = outputPolicy
+
+    def fabricate(self) -> BatchReport:
+
+        #
+        # Populate and compile the templates once so the workers only ever load them
+        #
+        configurationTemplatePath: Path = Fabricator.prepareTemplates()
+        Fabricator.templateCache(configurationTemplatePath=configurationTemplatePath).warm(templateDirectory=configurationTemplatePath)
+
+        report:    BatchReport = BatchReport(workers=self._workers)
+        startTime: float       = perf_counter()
+
+        with ProcessPoolExecutor(max_workers=self._workers) as executor:
+
+            futures: List[Future] = [executor.submit(fabricateProject, projectDetails, self._outputPolicy) for projectDetails in self._projects]
+
+            for future in as_completed(futures):
+                result: FabricationResult = future.result()
+                if result.success is False:
+                    self.logger.error(f'{result.projectName}: {result.message}')
+                report.results.append(result)
+
+        report.elapsed = perf_counter() - startTime
+
+        self.logger.info(report.summary)
+
+        return report
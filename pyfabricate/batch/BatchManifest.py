@@ -0,0 +1,73 @@
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import NewType
+
+from logging import Logger
+from logging import getLogger
+
+from json import loads as jsonLoads
+
+from pathlib import Path
+
+from pyfabricate.ProjectDetails import ProjectDetails
+from pyfabricate.ProjectDetails import ProjectDetailsDictionary
+
+from pyfabricate.fabrication.FabricationError import FabricationError
+
+ProjectDetailsList = NewType('ProjectDetailsList', List[ProjectDetails])
+
+DEFAULTS_KEY: str = 'defaults'
+PROJECTS_KEY: str = 'projects'
+
+
+class BatchManifest:
+    """
+    A batch manifest is a JSON document that describes many projects.  Either a bare list of
+    project details records or an object of the form:
+
+        {
+            "defaults": {"ownerName": "Gato Malo", "baseDirectory": "~/tmp", "pythonVersion": "3.12.4"},
+            "projects": [
+                {"name": "DemoProject1", "moduleName": "demoproject1"},
+                {"name": "DemoProject2", "moduleName": "demoproject2", "pythonVersion": "3.11.9"}
+            ]
+        }
+
+    Each project record overrides the values in `defaults`
+    """
+    def __init__(self, manifestPath: Path):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._manifestPath: Path               = manifestPath
+        self._projects:     ProjectDetailsList = self._load()
+
+    @property
+    def projects(self) -> ProjectDetailsList:
+        return self._projects
+
+    def _load(self) -> ProjectDetailsList:
+
+        try:
+            document: Any = jsonLoads(self._manifestPath.read_text())
+        except ValueError as e:
+            raise FabricationError(message=f'Invalid manifest {self._manifestPath}: {e}')
+
+        if isinstance(document, list):
+            defaults: ProjectDetailsDictionary       = {}
+            records:  List[ProjectDetailsDictionary] = document
+        else:
+            defaults = document.get(DEFAULTS_KEY, {})
+            records  = document.get(PROJECTS_KEY, [])
+
+        projects: ProjectDetailsList = ProjectDetailsList([])
+        for record in records:
+            merged: Dict[str, Any] = dict(defaults)
+            merged.update(record)
+            projects.append(ProjectDetails.fromDictionary(merged))
+
+        self.logger.info(f'Loaded {len(projects)} projects from {self._manifestPath}')
+
+        return projects
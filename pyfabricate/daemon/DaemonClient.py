@@ -0,0 +1,92 @@
+
+from typing import Any
+from typing import Dict
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from json import dumps as jsonDumps
+from json import loads as jsonLoads
+
+from pathlib import Path
+
+from socket import AF_UNIX
+from socket import SOCK_STREAM
+from socket import socket
+
+from pyfabricate.ProjectDetails import ProjectDetails
+
+from pyfabricate.daemon.FabricationDaemon import COMMAND_FABRICATE
+from pyfabricate.daemon.FabricationDaemon import COMMAND_STATUS
+from pyfabricate.daemon.FabricationDaemon import Priority
+from pyfabricate.fabrication.FabricationError import FabricationError
+
+DaemonResponse  = Dict[str, Any]
+DaemonResponses = List[DaemonResponse]
+
+#
+# The longest we wait for the next response;  Queued requests answer when their fabrication is done
+#
+DEFAULT_RESPONSE_TIMEOUT: float = 300.0
+
+
+class DaemonClient:
+    """
+    Talks to a running `pyfabricated`.  Does not import anything the daemon has already warmed
+    """
+    def __init__(self, socketPath: Path, timeout: float = DEFAULT_RESPONSE_TIMEOUT):
+        """
+
+        Args:
+            socketPath:  Where the daemon listens
+            timeout:     Seconds to wait for the connection and for each response
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._socketPath: Path  = socketPath
+        self._timeout:    float = timeout
+
+    def fabricate(self, projects: List[ProjectDetails], priority: Priority = Priority.INTERACTIVE) -> DaemonResponses:
+        """
+        All the requests go out on one connection before any response is read;  The daemon
+        runs them concurrently;  Batch requests are subject to the connection's limit
+
+        Args:
+            projects:   The projects to fabricate
+            priority:   Batch requests yield to interactive ones
+
+        Returns:  One response per project, in project order
+        """
+        requests: List[Dict[str, Any]] = [
+            {'id': index, 'command': COMMAND_FABRICATE, 'priority': priority.value, 'project': projectDetails.toDictionary()}
+            for index, projectDetails in enumerate(projects)
+        ]
+
+        return self._send(requests=requests)
+
+    def status(self) -> DaemonResponse:
+        return self._send(requests=[{'id': 0, 'command': COMMAND_STATUS}])[0]
+
+    def _send(self, requests: List[Dict[str, Any]]) -> DaemonResponses:
+
+        responses: Dict[Any, DaemonResponse] = {}
+        try:
+            with socket(AF_UNIX, SOCK_STREAM) as clientSocket:
+                clientSocket.settimeout(self._timeout)
+                clientSocket.connect(str(self._socketPath))
+                clientSocket.sendall(b''.join(jsonDumps(request).encode() + b'\n' for request in requests))
+
+                with clientSocket.makefile('rb') as responseFile:
+                    while len(responses) < len(requests):
+                        line: bytes = responseFile.readline()
+                        if len(line) == 0:
+                            raise FabricationError(message=f'pyfabricated closed the connection after {len(responses)} of {len(requests)} responses')
+                        response: DaemonResponse = jsonLoads(line)
+                        responses[response.get('id')] = response
+        except TimeoutError:
+            raise FabricationError(message=f'pyfabricated on {self._socketPath} did not respond within {self._timeout} seconds')
+        except OSError as e:
+            raise FabricationError(message=f'Cannot reach pyfabricated on {self._socketPath}: {e}')
+
+        return [responses.get(request['id'], {'success': False, 'message': 'No response'}) for request in requests]
@@ -0,0 +1,465 @@
+
+from typing import Any
+from typing import Deque
+from typing import Dict
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from asyncio import AbstractEventLoop
+from asyncio import CancelledError
+from asyncio import Condition
+from asyncio import Event
+from asyncio import Future
+from asyncio import Lock
+from asyncio import Semaphore
+from asyncio import Server
+from asyncio import StreamReader
+from asyncio import StreamWriter
+from asyncio import Task
+from asyncio import current_task
+from asyncio import gather
+from asyncio import get_running_loop
+from asyncio import open_unix_connection
+from asyncio import start_unix_server
+
+from collections import deque
+
+from concurrent.futures import ThreadPoolExecutor
+
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import field
+
+from enum import Enum
+
+from json import dumps as jsonDumps
+from json import loads as jsonLoads
+
+from os import getuid as osGetUid
+
+from pathlib import Path
+
+from platform import platform as osPlatform
+
+from signal import SIGINT
+from signal import SIGTERM
+
+from socket import SOL_SOCKET
+from socket import socket
+
+from struct import calcsize
+from struct import unpack
+
+from time import perf_counter
+
+from codeallybasic.ConfigurationLocator import ConfigurationLocator
+
+from pyfabricate.Constants import APPLICATION_NAME
+from pyfabricate.Constants import DAEMON_SOCKET_NAME
+from pyfabricate.Platform import THE_GREAT_MAC_PLATFORM
+from pyfabricate.ProjectDetails import ProjectDetails
+from pyfabricate.Settings import Settings
+
+from pyfabricate.batch.BatchFabricator import DEFAULT_WORKER_COUNT
+from pyfabricate.batch.BatchFabricator import FabricationResult
+from pyfabricate.batch.BatchFabricator import fabricateProject
+
+from pyfabricate.fabrication.Fabricator import Fabricator
+from pyfabricate.fabrication.OutputPolicy import OutputPolicy
+from pyfabricate.fabrication.TemplateCache import TemplateCache
+
+from pyfabricate.oswrapper.ExternalCommands import UnableToRetrievePythonVersionsException
+from pyfabricate.oswrapper.PythonVersionCache import PythonVersionCache
+
+#
+# Requests and responses are single line JSON documents
+#
+COMMAND_FABRICATE: str = 'fabricate'
+COMMAND_VERSIONS:  str = 'versions'
+COMMAND_STATUS:    str = 'status'
+
+DEFAULT_CLIENT_LIMIT:  int = 4
+MAXIMUM_REQUEST_BYTES: int = 1024 * 1024
+
+#
+# Linux struct ucred:  pid, uid, gid
+#
+PEER_CREDENTIALS: str = '3i'
+#
+# macOS struct xucred:  version, uid, group count, groups;  From getsockopt(SOL_LOCAL, LOCAL_PEERCRED)
+#
+MAC_OS_PEER_CREDENTIALS: str = 'IIh16I'
+MAC_OS_SOL_LOCAL:        int = 0
+MAC_OS_LOCAL_PEERCRED:   int = 0x001
+
+NO_UID: int = -1
+
+#
+# Only the daemon's user may connect;  Then a client the platform cannot identify is that user
+#
+SOCKET_MODE: int = 0o600
+
+
+class Priority(Enum):
+    """
+    * INTERACTIVE:  Someone is waiting;  Runs ahead of queued batch work and has a worker of its own
+    * BATCH:        Runs when no interactive request is waiting
+    """
+    INTERACTIVE = 'interactive'
+    BATCH       = 'batch'
+
+
+#
+# The lanes each kind of dispatcher serves, in preference order
+#
+SHARED_LANES:      List[Priority] = [Priority.INTERACTIVE, Priority.BATCH]
+INTERACTIVE_LANES: List[Priority] = [Priority.INTERACTIVE]
+
+
+@dataclass
+class FabricationJob:
+    projectDetails: ProjectDetails
+    outputPolicy:   OutputPolicy
+    future:         Future
+    queuedTime:     float = field(default_factory=perf_counter)
+    startTime:      float = 0.0
+
+
+@dataclass
+class DaemonStatistics:
+    served:  int = 0
+    failed:  int = 0
+    running: int = 0
+
+
+def defaultSocketPath() -> Path:
+    """
+    Returns:  The socket in the pyfabricate configuration directory
+    """
+    configurationLocator: ConfigurationLocator = ConfigurationLocator()
+
+    return configurationLocator.applicationPath(applicationName=APPLICATION_NAME) / DAEMON_SOCKET_NAME
+
+
+class FabricationDaemon:
+    """
+    A resident fabrication service on a Unix domain socket.  The settings, the Python version
+    list, the configuration templates and the compiled template cache are loaded once at start
+    up;  Each request then only pays for its own fabrication.
+
+    Fabrications run on a thread pool.  Each connection has a limit on the batch requests it
+    may have queued or running.  Interactive requests are not limited;  They are dispatched
+    before queued batch requests and one worker only ever serves interactive requests.  So a
+    large batch never starves a user, not even on the connection that queued the batch
+    """
+    def __init__(self, socketPath: Path, workers: int = DEFAULT_WORKER_COUNT, clientLimit: int = DEFAULT_CLIENT_LIMIT):
+        """
+
+        Args:
+            socketPath:     Where to listen
+            workers:        The number of fabrications that run at once, besides the interactive lane
+            clientLimit:    The number of batch requests one connection may have queued or running
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._socketPath:  Path = socketPath
+        self._workers:     int  = max(1, workers)
+        self._clientLimit: int  = max(1, clientLimit)
+
+        self._pending:       Dict[Priority, Deque[FabricationJob]] = {priority: deque() for priority in Priority}
+        self._jobAvailable:  Condition                             = cast(Condition, None)
+        self._stopped:       Event                                 = cast(Event, None)
+        self._statistics:    DaemonStatistics                      = DaemonStatistics()
+        self._executor:      ThreadPoolExecutor                    = cast(ThreadPoolExecutor, None)
+        self._connections:   Dict[Task, StreamWriter]              = {}
+
+        self._outputPolicy:   OutputPolicy  = OutputPolicy.PLAIN
+        self._pythonVersions: List[str]     = []
+        self._templateCache:  TemplateCache = cast(TemplateCache, None)
+        self._startTime:      float         = 0.0
+
+    @property
+    def socketPath(self) -> Path:
+        return self._socketPath
+
+    def warm(self):
+        """
+        Everything a cold launch pays for before it can fabricate
+        """
+        self._outputPolicy = Settings().outputPolicy
+
+        configurationTemplatePath: Path = Fabricator.prepareTemplates()
+
+        self._templateCache = Fabricator.templateCache(configurationTemplatePath=configurationTemplatePath)
+        self._templateCache.warm(templateDirectory=configurationTemplatePath)
+        Fabricator.templateBundle()
+
+        try:
+            self._pythonVersions = [str(version) for version in PythonVersionCache.cacheFor().pythonVersions]
+        except (UnableToRetrievePythonVersionsException, OSError) as e:
+            self.logger.warning(f'No Python versions available: {e}')
+
+    async def serve(self):
+        """
+        Runs until `stop` is called or the process receives SIGINT or SIGTERM
+        """
+        loop: AbstractEventLoop = get_running_loop()
+
+        self._jobAvailable = Condition()
+        self._stopped      = Event()
+        self._executor     = ThreadPoolExecutor(max_workers=self._workers + 1, thread_name_prefix='pyfabricated')
+        self._startTime    = perf_counter()
+
+        await loop.run_in_executor(self._executor, self.warm)
+
+        for signalNumber in (SIGINT, SIGTERM):
+            loop.add_signal_handler(signalNumber, self.stop)
+
+        await self._removeStaleSocket()
+        self._socketPath.parent.mkdir(parents=True, exist_ok=True)
+
+        server: Server = await start_unix_server(self._handleClient, path=str(self._socketPath), limit=MAXIMUM_REQUEST_BYTES)
+        self._socketPath.chmod(SOCKET_MODE)
+
+        dispatchers: List[Task] = [loop.create_task(self._dispatch(lanes=SHARED_LANES)) for _ in range(self._workers)]
+        dispatchers.append(loop.create_task(self._dispatch(lanes=INTERACTIVE_LANES)))
+
+        self.logger.info(f'Listening on {self._socketPath} with {self._workers} workers and an interactive lane')
+        try:
+            await self._stopped.wait()
+        finally:
+            #
+            # Since Python 3.12.1 `wait_closed` also waits for every connection;  So, the
+            # connections, idle ones included, go first
+            #
+            server.close()
+            for connection, writer in list(self._connections.items()):
+                writer.close()
+                connection.cancel()
+            for dispatcher in dispatchers:
+                dispatcher.cancel()
+            await gather(*dispatchers, *self._connections, return_exceptions=True)
+            await server.wait_closed()
+
+            self._executor.shutdown(wait=True)
+            self._templateCache.save()
+            self._socketPath.unlink(missing_ok=True)
+
+            for signalNumber in (SIGINT, SIGTERM):
+                loop.remove_signal_handler(signalNumber)
+
+        self.logger.info(f'Stopped;  Served {self._statistics.served} requests, {self._statistics.failed} failed')
+
+    def stop(self):
+        self._stopped.set()
+
+    async def _handleClient(self, reader: StreamReader, writer: StreamWriter):
+        """
+        A client may send many requests without waiting;  Each response carries the id of its
+        request and responses are written as the fabrications finish
+        """
+        peerUid:     int        = self._peerUid(writer=writer)
+        clientLimit: Semaphore  = Semaphore(self._clientLimit)
+        writeLock:   Lock       = Lock()
+        requests:    List[Task] = []
+        connection:  Task       = cast(Task, current_task())
+
+        self._connections[connection] = writer
+        try:
+            while True:
+                try:
+                    line: bytes = await reader.readline()
+                except ValueError:
+                    await self._respond(writer, writeLock, {'success': False, 'message': f'Request larger than {MAXIMUM_REQUEST_BYTES} bytes'})
+                    break
+                if len(line) == 0:
+                    break
+
+                requests.append(get_running_loop().create_task(self._handleRequest(line, peerUid, clientLimit, writer, writeLock)))
+
+            await gather(*requests)
+        except ConnectionError as e:
+            self.logger.info(f'Client went away: {e}')
+        finally:
+            for request in requests:
+                request.cancel()
+            del self._connections[connection]
+            writer.close()
+
+    async def _handleRequest(self, line: bytes, peerUid: int, clientLimit: Semaphore, writer: StreamWriter, writeLock: Lock):
+
+        requestId: Any = None
+        try:
+            request: Dict[str, Any] = jsonLoads(line)
+            requestId = request.get('id')
+
+            command: str = request.get('command', COMMAND_FABRICATE)
+            if command == COMMAND_FABRICATE:
+                response: Dict[str, Any] = await self._fabricate(request=request, peerUid=peerUid, clientLimit=clientLimit)
+            elif command == COMMAND_VERSIONS:
+                response = {'success': True, 'versions': self._pythonVersions}
+            elif command == COMMAND_STATUS:
+                response = {'success': True, 'status': self._status()}
+            else:
+                response = {'success': False, 'message': f'Unknown command {command}'}
+        except (ValueError, AttributeError, TypeError, KeyError) as e:
+            response = {'success': False, 'message': f'Invalid request: {e}'}
+        except Exception as e:
+            #
+            # The client waits for a response to every request;  Never leave it hanging
+            #
+            self.logger.exception(f'Request {requestId} failed')
+            response = {'success': False, 'message': f'Request failed: {e.__class__.__name__}: {e}'}
+
+        response['id'] = requestId
+
+        await self._respond(writer, writeLock, response)
+
+    async def _fabricate(self, request: Dict[str, Any], peerUid: int, clientLimit: Semaphore) -> Dict[str, Any]:
+        """
+        The daemon writes with its own permissions;  So, a client may only fabricate into a
+        directory it owns.  Only batch requests wait for the connection's limit
+        """
+        if isinstance(request.get('project'), dict) is False:
+            raise ValueError('A fabricate request needs the project details')
+
+        priority:       Priority       = Priority(request.get('priority', Priority.BATCH.value))
+        outputPolicy:   OutputPolicy   = OutputPolicy(request['outputPolicy']) if 'outputPolicy' in request else self._outputPolicy
+        projectDetails: ProjectDetails = ProjectDetails.fromDictionary(request['project'])
+
+        if self._ownsDirectory(directory=projectDetails.baseDirectory, uid=osGetUid() if peerUid == NO_UID else peerUid) is False:
+            return {'success': False, 'message': f'{projectDetails.baseDirectory} does not belong to the requesting user'}
+
+        job: FabricationJob = FabricationJob(projectDetails=projectDetails,
+                                             outputPolicy=outputPolicy,
+                                             future=get_running_loop().create_future())
+        if priority == Priority.INTERACTIVE:
+            result: FabricationResult = await self._queue(job=job, priority=priority)
+        else:
+            async with clientLimit:
+                result = await self._queue(job=job, priority=priority)
+
+        return {'success': result.success, 'message': result.message, 'queued': job.startTime - job.queuedTime, 'result': asdict(result)}
+
+    async def _queue(self, job: FabricationJob, priority: Priority) -> FabricationResult:
+        """
+        A job is withdrawn when its request is cancelled, for example because the client went
+        away;  Nobody would be told about its project
+        """
+        async with self._jobAvailable:
+            self._pending[priority].append(job)
+            #
+            # The interactive lane ignores batch jobs;  Waking only it would strand the job
+            #
+            self._jobAvailable.notify_all()
+        try:
+            return await job.future
+        except CancelledError:
+            if job in self._pending[priority]:
+                self._pending[priority].remove(job)
+            raise
+
+    async def _dispatch(self, lanes: List[Priority]):
+
+        loop: AbstractEventLoop = get_running_loop()
+        while True:
+            async with self._jobAvailable:
+                await self._jobAvailable.wait_for(lambda: self._hasJob(lanes=lanes))
+                job: FabricationJob = self._nextJob(lanes=lanes)
+
+            job.startTime = perf_counter()
+
+            self._statistics.running += 1
+            try:
+                result: FabricationResult = await loop.run_in_executor(self._executor, fabricateProject, job.projectDetails, job.outputPolicy)
+            finally:
+                self._statistics.running -= 1
+
+            self._statistics.served += 1
+            if result.success is False:
+                self._statistics.failed += 1
+            if job.future.cancelled() is False:
+                job.future.set_result(result)
+
+    def _hasJob(self, lanes: List[Priority]) -> bool:
+        return any(len(self._pending[priority]) > 0 for priority in lanes)
+
+    def _nextJob(self, lanes: List[Priority]) -> FabricationJob:
+
+        priority: Priority = next(priority for priority in lanes if len(self._pending[priority]) > 0)
+
+        return self._pending[priority].popleft()
+
+    def _status(self) -> Dict[str, Any]:
+
+        return {
+            'uptime':         perf_counter() - self._startTime,
+            'workers':        self._workers,
+            'clients':        len(self._connections),
+            'queued':         {priority.value: len(self._pending[priority]) for priority in Priority},
+            'running':        self._statistics.running,
+            'served':         self._statistics.served,
+            'failed':         self._statistics.failed,
+            'templateHits':   self._templateCache.hits,
+            'pythonVersions': len(self._pythonVersions),
+        }
+
+    async def _respond(self, writer: StreamWriter, writeLock: Lock, response: Dict[str, Any]):
+
+        async with writeLock:
+            writer.write(jsonDumps(response).encode() + b'\n')
+            await writer.drain()
+
+    async def _removeStaleSocket(self):
+        """
+        A socket left by a daemon that died is removed;  A live daemon is not displaced
+        """
+        if self._socketPath.exists() is False:
+            return
+        try:
+            _, writer = await open_unix_connection(path=str(self._socketPath))
+            writer.close()
+            raise OSError(f'A daemon is already listening on {self._socketPath}')
+        except ConnectionRefusedError:
+            self._socketPath.unlink()
+
+    def _ownsDirectory(self, directory: Path, uid: int) -> bool:
+        """
+        A base directory that does not exist yet is created in its nearest existing ancestor;
+        So that ancestor decides
+        """
+        existing: Path = directory.expanduser().absolute()
+        while existing.exists() is False and existing != existing.parent:
+            existing = existing.parent
+        try:
+            return existing.stat().st_uid == uid
+        except OSError:
+            return False
+
+    def _peerUid(self, writer: StreamWriter) -> int:
+        """
+        Returns:  The client's user id;  NO_UID where the platform does not report it
+        """
+        clientSocket: socket = writer.get_extra_info('socket')
+        try:
+            from socket import SO_PEERCRED
+
+            credentials: bytes = clientSocket.getsockopt(SOL_SOCKET, SO_PEERCRED, calcsize(PEER_CREDENTIALS))
+            _, uid, _ = unpack(PEER_CREDENTIALS, credentials)
+            return uid
+        except ImportError:
+            pass
+        except (OSError, AttributeError):
+            return NO_UID
+
+        if osPlatform(terse=True).startswith(THE_GREAT_MAC_PLATFORM) is True:
+            try:
+                credentials = clientSocket.getsockopt(MAC_OS_SOL_LOCAL, MAC_OS_LOCAL_PEERCRED, calcsize(MAC_OS_PEER_CREDENTIALS))
+                return unpack(MAC_OS_PEER_CREDENTIALS, credentials)[1]
+            except (OSError, AttributeError):
+                pass
+
+        return NO_UID
@@ -0,0 +1,42 @@
+
+from asyncio import run as asyncioRun
+
+from pathlib import Path
+
+from click import command
+from click import option
+from click import version_option
+from click import Path as ClickPath
+
+from pyfabricate import __version__
+
+from pyfabricate.PyFabricate import setUpLogging
+
+from pyfabricate.batch.BatchFabricator import DEFAULT_WORKER_COUNT
+
+from pyfabricate.daemon.FabricationDaemon import DEFAULT_CLIENT_LIMIT
+from pyfabricate.daemon.FabricationDaemon import FabricationDaemon
+from pyfabricate.daemon.FabricationDaemon import defaultSocketPath
+
+
+@command()
+@version_option(version=f'{__version__}', message='%(version)s')
+@option('-s', '--socket', 'socketPath', type=ClickPath(dir_okay=False, path_type=Path), default=None, help='Defaults to pyfabricated.sock in the configuration directory')
+@option('-w', '--workers', type=int, default=DEFAULT_WORKER_COUNT, show_default=True, help='Concurrent fabrications, besides the interactive lane')
+@option('-l', '--client-limit', 'clientLimit', type=int, default=DEFAULT_CLIENT_LIMIT, show_default=True, help='Batch requests one connection may have queued or running')
+def pyfabricated(socketPath: Path, workers: int, clientLimit: int):
+    """
+    Serve fabrication requests on a Unix domain socket
+    """
+    setUpLogging()
+
+    if socketPath is None:
+        socketPath = defaultSocketPath()
+
+    daemon: FabricationDaemon = FabricationDaemon(socketPath=socketPath, workers=workers, clientLimit=clientLimit)
+
+    asyncioRun(daemon.serve())
+
+
+if __name__ == "__main__":
+    pyfabricated()
@@ -0,0 +1,145 @@
+
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from asyncio import AbstractEventLoop
+from asyncio import Semaphore
+from asyncio import Task
+from asyncio import create_task
+from asyncio import gather
+from asyncio import get_running_loop
+
+from concurrent.futures import ThreadPoolExecutor
+
+from functools import partial
+
+from pathlib import Path
+
+from time import perf_counter
+
+from pyfabricate.fabrication.FabricationPlan import CopyFile
+from pyfabricate.fabrication.FabricationPlan import FabricationPlan
+from pyfabricate.fabrication.FabricationPlan import FileOperation
+from pyfabricate.fabrication.FabricationPlan import MakeDirectory
+from pyfabricate.fabrication.FabricationPlan import RenderFile
+from pyfabricate.fabrication.FabricationPlan import TouchFile
+from pyfabricate.fabrication.FabricationPlan import WriteFile
+from pyfabricate.fabrication.OutputBackend import OutputBackend
+from pyfabricate.fabrication.PlanExecutor import NO_OUTPUT_BACKEND
+from pyfabricate.fabrication.PlanExecutor import NO_PATH
+from pyfabricate.fabrication.ProgressReporter import ProgressReporter
+
+DEFAULT_CONCURRENCY: int = 8
+
+
+class AsyncPlanExecutor:
+    """
+    Executes a fabrication plan with the blocking file system calls on a bounded thread pool.
+    Templates are rendered on the event loop while previously rendered files are still being
+    written;  On high latency (network) file systems, the writes overlap instead of queueing
+    behind each other.
+
+    Directories are created first;  Then the files in any order;  Progress is reported on
+    the event loop thread
+    """
+    def __init__(self,
+                 rootPath:         Path,
+                 progressReporter: ProgressReporter,
+                 reportedRootPath: Path          = NO_PATH,
+                 outputBackend:    OutputBackend = NO_OUTPUT_BACKEND,
+                 concurrency:      int           = DEFAULT_CONCURRENCY):
+        """
+
+        Args:
+            rootPath:           Where to materialize the plan's relative paths
+            progressReporter:   Somewhere to report our progress as we go along
+            reportedRootPath:   The root path to use in progress reports;  Defaults to `rootPath`
+            outputBackend:      How files are put on disk;  Defaults to writing every file in full
+            concurrency:        The maximum number of file system calls in flight
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._rootPath:         Path             = rootPath
+        self._progressReporter: ProgressReporter = progressReporter
+        self._concurrency:      int              = max(1, concurrency)
+
+        if outputBackend is NO_OUTPUT_BACKEND:
+            self._outputBackend: OutputBackend = OutputBackend()
+        else:
+            self._outputBackend = outputBackend
+
+        if reportedRootPath is NO_PATH:
+            self._reportedRootPath: Path = rootPath
+        else:
+            self._reportedRootPath = reportedRootPath
+
+    async def execute(self, plan: FabricationPlan):
+        """
+        The semaphore is the only bound;  The pool has a thread for each permit, so it never
+        queues.  It is shut down without waiting on the event loop;  After a failure, the
+        writes already running are waited for on another thread
+        """
+        loop:      AbstractEventLoop  = get_running_loop()
+        semaphore: Semaphore          = Semaphore(self._concurrency)
+        pool:      ThreadPoolExecutor = ThreadPoolExecutor(max_workers=self._concurrency, thread_name_prefix='fabricate')
+
+        tasks: List[Task] = []
+        try:
+            directories: List[MakeDirectory] = [operation for operation in plan.operations if isinstance(operation, MakeDirectory)]
+            await gather(*[self._makeDirectory(loop=loop, pool=pool, semaphore=semaphore, operation=operation) for operation in directories])
+
+            for operation in plan.operations:
+                if isinstance(operation, FileOperation):
+                    content: bytes = self._renderContent(operation=operation)
+                    await semaphore.acquire()
+                    tasks.append(create_task(self._writeFile(loop=loop, pool=pool, semaphore=semaphore, operation=operation, content=content)))
+            await gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await gather(*tasks, return_exceptions=True)
+            await loop.run_in_executor(None, partial(pool.shutdown, wait=True, cancel_futures=True))
+            raise
+
+        pool.shutdown(wait=False)
+
+        self.logger.info(f'Plan executed asynchronously: {len(plan.operations)} operations')
+
+    async def _makeDirectory(self, loop: AbstractEventLoop, pool: ThreadPoolExecutor, semaphore: Semaphore, operation: MakeDirectory):
+
+        fullPath:  Path  = self._rootPath / operation.relativePath
+        startTime: float = perf_counter()
+
+        async with semaphore:
+            await loop.run_in_executor(pool, partial(fullPath.mkdir, parents=True, exist_ok=True))
+
+        self._progressReporter.directoryCreated(path=self._reportedRootPath / operation.relativePath, startTime=startTime)
+
+    async def _writeFile(self, loop: AbstractEventLoop, pool: ThreadPoolExecutor, semaphore: Semaphore, operation: FileOperation, content: bytes):
+
+        fullPath:  Path  = self._rootPath / operation.relativePath
+        startTime: float = perf_counter()
+        try:
+            if isinstance(operation, CopyFile):
+                await loop.run_in_executor(pool, partial(self._outputBackend.copyFile, fullPath=fullPath, sourcePath=operation.sourcePath, mode=operation.mode))
+            else:
+                await loop.run_in_executor(pool, partial(self._outputBackend.writeFile, fullPath=fullPath, content=content, mode=operation.mode))
+        finally:
+            semaphore.release()
+
+        self._progressReporter.fileWritten(path=self._reportedRootPath / operation.relativePath, byteCount=operation.byteCount, startTime=startTime)
+
+    def _renderContent(self, operation: FileOperation) -> bytes:
+        """
+        Rendering is CPU work;  It stays on the event loop.  Copies are read on the pool
+
+        Returns:  The content to write;  Empty for copies
+        """
+        if isinstance(operation, (WriteFile, RenderFile)):
+            return operation.content
+        elif isinstance(operation, (TouchFile, CopyFile)):
+            return b''
+        else:
+            assert False, f'Unknown plan operation: {operation}'
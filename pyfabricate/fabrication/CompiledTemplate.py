@@ -0,0 +1,162 @@
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Mapping
+from typing import NewType
+from typing import Pattern
+from typing import Set
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from re import IGNORECASE
+from re import Match
+from re import VERBOSE
+from re import compile as reCompile
+
+Literals    = NewType('Literals',    List[bytes])
+Identifiers = NewType('Identifiers', List[str])
+
+CompiledTemplateDictionary = Dict[str, Any]
+
+DELIMITER: bytes = b'$'
+
+#
+# `string.Template.pattern` for bytes.  `$` and the ASCII identifiers never occur inside a
+# UTF-8 multibyte sequence;  So, scanning the encoded template finds exactly the placeholders
+# that scanning the decoded text does
+#
+PLACEHOLDER_PATTERN: Pattern[bytes] = reCompile(rb"""
+    \$(?:
+        (?P<escaped>\$)                      |
+        (?P<named>[_a-z][_a-z0-9]*)          |
+        {(?P<braced>[_a-z][_a-z0-9]*)}       |
+        (?P<invalid>)
+    )
+    """, IGNORECASE | VERBOSE)
+
+#
+# Literals are serialized as text;  This round trips any byte sequence
+#
+LITERAL_ENCODING: str = 'utf-8'
+LITERAL_ERRORS:   str = 'surrogateescape'
+
+
+def literalsFactory() -> Literals:
+    return Literals([])
+
+
+def identifiersFactory() -> Identifiers:
+    return Identifiers([])
+
+
+@dataclass
+class TokenPosition:
+    """
+    Where a placeholder sits in the original template;  Byte offsets
+    """
+    start:      int = 0
+    end:        int = 0
+    identifier: str = ''
+
+
+TokenPositions = NewType('TokenPositions', List[TokenPosition])
+
+
+def tokenPositionsFactory() -> TokenPositions:
+    return TokenPositions([])
+
+
+@dataclass
+class CompiledTemplate:
+    """
+    The parsed form of a `string.Template`.  The template bytes are split once into literal
+    slices and token slots;  `literals` always has one more entry than `identifiers`.
+    Rendering is a bytes join, so there is no regular expression scan per substitution and
+    no decode/encode round trip of the template text;  Only the token values are encoded
+
+    `$TOKEN`, `${TOKEN}` and `$$` behave exactly like `string.Template` with UTF-8 output
+    """
+    literals:       Literals       = field(default_factory=literalsFactory)
+    identifiers:    Identifiers    = field(default_factory=identifiersFactory)
+    tokenPositions: TokenPositions = field(default_factory=tokenPositionsFactory)
+
+    @property
+    def identifierSet(self) -> Set[str]:
+        return set(self.identifiers)
+
+    @classmethod
+    def compile(cls, content: bytes) -> 'CompiledTemplate':
+        """
+
+        Args:
+            content:  The raw template;  ASCII or UTF-8
+
+        Returns:  The parsed template
+
+        Raises:  ValueError on an invalid placeholder just like `Template.substitute`
+        """
+        compiledTemplate: CompiledTemplate = CompiledTemplate()
+
+        currentLiteral: List[bytes] = []
+        lastEnd:        int         = 0
+
+        match: Match
+        for match in PLACEHOLDER_PATTERN.finditer(content):
+
+            currentLiteral.append(content[lastEnd:match.start()])
+            lastEnd = match.end()
+
+            identifierBytes: bytes = match.group('named') or match.group('braced')
+            if identifierBytes is not None:
+                identifier: str = identifierBytes.decode()
+                compiledTemplate.literals.append(b''.join(currentLiteral))
+                compiledTemplate.identifiers.append(identifier)
+                compiledTemplate.tokenPositions.append(TokenPosition(start=match.start(), end=match.end(), identifier=identifier))
+                currentLiteral = []
+            elif match.group('escaped') is not None:
+                currentLiteral.append(DELIMITER)
+            else:
+                lineNumber: int = content.count(b'\n', 0, match.start()) + 1
+                raise ValueError(f'Invalid placeholder in string: line {lineNumber}, position {match.start()}')
+
+        currentLiteral.append(content[lastEnd:])
+        compiledTemplate.literals.append(b''.join(currentLiteral))
+
+        return compiledTemplate
+
+    def render(self, tokens: Mapping[str, object]) -> bytes:
+        """
+        Same semantics as `Template.substitute` followed by a UTF-8 encode
+
+        Args:
+            tokens:  The token values
+
+        Returns:  The rendered bytes
+
+        Raises:  KeyError when a referenced token is missing
+        """
+        pieces: List[bytes] = [self.literals[0]]
+        for identifier, literal in zip(self.identifiers, self.literals[1:]):
+            pieces.append(str(tokens[identifier]).encode())
+            pieces.append(literal)
+
+        return b''.join(pieces)
+
+    def toDictionary(self) -> CompiledTemplateDictionary:
+        return {
+            'literals':       [literal.decode(LITERAL_ENCODING, LITERAL_ERRORS) for literal in self.literals],
+            'identifiers':    self.identifiers,
+            'tokenPositions': [[position.start, position.end, position.identifier] for position in self.tokenPositions],
+        }
+
+    @classmethod
+    def fromDictionary(cls, dictionary: CompiledTemplateDictionary) -> 'CompiledTemplate':
+
+        literals:         Literals         = Literals([literal.encode(LITERAL_ENCODING, LITERAL_ERRORS) for literal in dictionary['literals']])
+        compiledTemplate: CompiledTemplate = CompiledTemplate(literals=literals, identifiers=Identifiers(dictionary['identifiers']))
+        for start, end, identifier in dictionary['tokenPositions']:
+            compiledTemplate.tokenPositions.append(TokenPosition(start=start, end=end, identifier=identifier))
+
+        return compiledTemplate
@@ -0,0 +1,199 @@
+
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from errno import EMLINK
+from errno import EPERM
+from errno import EXDEV
+
+from hashlib import sha256
+
+from os import chmod as osChmod
+from os import getpid as osGetPid
+from os import link as osLink
+
+from pathlib import Path
+
+from secrets import token_hex
+
+from threading import Lock
+
+from pyfabricate.fabrication.FabricationPlan import DEFAULT_FILE_MODE
+from pyfabricate.fabrication.OutputBackend import OutputBackend
+from pyfabricate.fabrication.OutputPolicy import OutputPolicy
+
+from pyfabricate.oswrapper.FileCloner import FileCloner
+
+STORE_DIRECTORY_NAME:   str = 'contentStore'
+OBJECTS_DIRECTORY_NAME: str = 'objects'
+
+MATERIALIZED_CLONE:    str = 'cloned'
+MATERIALIZED_HARDLINK: str = 'hardlinked'
+MATERIALIZED_WRITE:    str = 'written'
+
+#
+# The file system refused a hard link;  Fall back
+#
+LINK_UNSUPPORTED_ERRORS = {EMLINK, EPERM, EXDEV}
+
+Materializer = Callable[[Path, Path], bool]
+
+
+class ContentStore:
+    """
+    A content addressed store of fabricated outputs.  Objects are named by their SHA-256
+    and file mode, since hard linked files share their mode.  An object is added by cloning
+    or hard linking a file that was just written, never by writing the content again.  It is
+    linked into place from a uniquely named temporary file, so concurrent fabrications
+    (threads or processes) can safely add the same object
+    """
+    def __init__(self, storePath: Path):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._objectsPath: Path = storePath / OBJECTS_DIRECTORY_NAME
+
+    def objectPath(self, content: bytes, mode: int) -> Path:
+        """
+        Args:
+            content:  The file content
+            mode:     The file mode
+
+        Returns:  Where the store keeps that content;  It may not be there yet
+        """
+        digest: str = sha256(content).hexdigest()
+
+        return self._objectsPath / digest[:2] / f'{digest}-{mode:o}'
+
+    def add(self, sourcePath: Path, objectPath: Path, mode: int, materializers: List[Materializer]) -> bool:
+        """
+        Args:
+            sourcePath:     A file with the object's content and mode
+            objectPath:     As returned by `objectPath`
+            mode:           The object's file mode
+            materializers:  How to share the source's data with the object, in preference order
+
+        Returns:  `False` when none of the materializers could share the data;  Nothing is stored
+        """
+        objectPath.parent.mkdir(parents=True, exist_ok=True)
+
+        temporaryPath: Path = objectPath.with_name(f'.{objectPath.name}.{osGetPid()}.{token_hex(4)}')
+        if any(materializer(sourcePath, temporaryPath) is True for materializer in materializers) is False:
+            return False
+        try:
+            if mode != DEFAULT_FILE_MODE:
+                osChmod(temporaryPath, mode)
+            osLink(temporaryPath, objectPath)
+        except FileExistsError:
+            pass
+        finally:
+            temporaryPath.unlink()
+
+        self.logger.debug(f'Stored {objectPath}')
+
+        return True
+
+
+class DeduplicatingOutputBackend(OutputBackend):
+    """
+    Byte identical outputs (LICENSE, requirements.txt, _version.py, ...) are stored once in a
+    content store on the same volume as the projects and materialized according to the
+    output policy.  Empty files are always plain writes.
+
+    Content that is not in the store yet is written in full and then added to the store by a
+    clone or a hard link;  Where the file system supports neither, nothing is stored
+    """
+    def __init__(self, storePath: Path, outputPolicy: OutputPolicy):
+        """
+
+        Args:
+            storePath:      Must be on the same file system as the fabricated projects for hard links and clones to work
+            outputPolicy:   How to materialize the files
+        """
+        super().__init__()
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._contentStore:  ContentStore                   = ContentStore(storePath=storePath)
+        self._materializers: List[Tuple[str, Materializer]] = self._computeMaterializers(outputPolicy=outputPolicy)
+        self._storing:       bool                           = True
+
+        self._statisticsLock: Lock           = Lock()
+        self._statistics:     Dict[str, int] = {MATERIALIZED_CLONE: 0, MATERIALIZED_HARDLINK: 0, MATERIALIZED_WRITE: 0}
+
+    @property
+    def statistics(self) -> Dict[str, int]:
+        """
+        Returns:  How many files were cloned, hard linked or written
+        """
+        with self._statisticsLock:
+            return dict(self._statistics)
+
+    def writeFile(self, fullPath: Path, content: bytes, mode: int = DEFAULT_FILE_MODE):
+
+        if len(content) == 0 or len(self._materializers) == 0:
+            super().writeFile(fullPath=fullPath, content=content, mode=mode)
+            self._count(MATERIALIZED_WRITE)
+            return
+
+        objectPath: Path = self._contentStore.objectPath(content=content, mode=mode)
+        if objectPath.exists() is True:
+            fullPath.unlink(missing_ok=True)
+            for materialization, materializer in self._materializers:
+                if materializer(objectPath, fullPath) is True:
+                    if materialization == MATERIALIZED_CLONE and mode != DEFAULT_FILE_MODE:
+                        osChmod(fullPath, mode)
+                    self._count(materialization)
+                    return
+
+        super().writeFile(fullPath=fullPath, content=content, mode=mode)
+        self._count(MATERIALIZED_WRITE)
+
+        if self._storing is True and objectPath.exists() is False:
+            #
+            # Once the file system refuses, later files are not tried
+            #
+            self._storing = self._contentStore.add(sourcePath=fullPath, objectPath=objectPath, mode=mode,
+                                                   materializers=[materializer for _, materializer in self._materializers])
+
+    def copyFile(self, fullPath: Path, sourcePath: Path, mode: int = DEFAULT_FILE_MODE):
+        """
+        The content has to be hashed to find it in the store;  So, it is read
+        """
+        self.writeFile(fullPath=fullPath, content=sourcePath.read_bytes(), mode=mode)
+
+    def _computeMaterializers(self, outputPolicy: OutputPolicy) -> List[Tuple[str, Materializer]]:
+
+        if outputPolicy == OutputPolicy.REFLINK:
+            return [(MATERIALIZED_CLONE, self._clone)]
+        elif outputPolicy == OutputPolicy.REFLINK_OR_HARDLINK:
+            return [(MATERIALIZED_CLONE, self._clone), (MATERIALIZED_HARDLINK, self._hardLink)]
+        elif outputPolicy == OutputPolicy.HARDLINK:
+            return [(MATERIALIZED_HARDLINK, self._hardLink)]
+        else:
+            return []
+
+    def _clone(self, sourcePath: Path, destinationPath: Path) -> bool:
+
+        return FileCloner.cloneFile(sourcePath=sourcePath, destinationPath=destinationPath)
+
+    def _hardLink(self, sourcePath: Path, destinationPath: Path) -> bool:
+
+        try:
+            osLink(sourcePath, destinationPath)
+        except OSError as e:
+            if e.errno in LINK_UNSUPPORTED_ERRORS:
+                self.logger.debug(f'Cannot hard link {sourcePath}: {e}')
+                return False
+            raise
+
+        return True
+
+    def _count(self, materialization: str):
+        with self._statisticsLock:
+            self._statistics[materialization] += 1
@@ -0,0 +1,211 @@
+
+from typing import Dict
+from typing import List
+from typing import NewType
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from collections import Counter
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from pathlib import Path
+
+from time import perf_counter
+from time import time_ns
+
+from pyfabricate.fabrication.FabricationManifest import FabricationManifest
+from pyfabricate.fabrication.FabricationManifest import MANIFEST_FILE_NAME
+from pyfabricate.fabrication.FabricationPlan import CopyFile
+from pyfabricate.fabrication.FabricationPlan import DEFAULT_FILE_MODE
+from pyfabricate.fabrication.FabricationPlan import FabricationPlan
+from pyfabricate.fabrication.FabricationPlan import FileOperation
+from pyfabricate.fabrication.FabricationPlan import MakeDirectory
+from pyfabricate.fabrication.FabricationPlan import RenderFile
+from pyfabricate.fabrication.FabricationPlan import WriteFile
+from pyfabricate.fabrication.FabricationPlan import outputContent
+from pyfabricate.fabrication.FabricationState import BASE_ARCHIVE_NAME
+from pyfabricate.fabrication.FabricationState import BaseContents
+from pyfabricate.fabrication.FabricationState import FabricationState
+from pyfabricate.fabrication.FabricationState import STATE_DIRECTORY_NAME
+from pyfabricate.fabrication.FabricationState import STATE_FILE_NAME
+
+#
+# The file system operations a real run performs
+#
+SYSCALL_MKDIR:  str = 'mkdir'
+SYSCALL_OPEN:   str = 'open'
+SYSCALL_WRITE:  str = 'write'
+SYSCALL_COPY:   str = 'copy_file_range'
+SYSCALL_FCHMOD: str = 'fchmod'
+SYSCALL_CLOSE:  str = 'close'
+SYSCALL_RENAME: str = 'rename'
+
+NO_FABRICATION_STATE: FabricationState = cast(FabricationState, None)
+
+
+@dataclass
+class DryRunFile:
+    path:      Path
+    byteCount: int = 0
+    mode:      int = DEFAULT_FILE_MODE
+
+
+DryRunFiles       = NewType('DryRunFiles',       List[DryRunFile])
+DryRunDirectories = NewType('DryRunDirectories', List[Path])
+
+
+def dryRunFilesFactory() -> DryRunFiles:
+    return DryRunFiles([])
+
+
+def dryRunDirectoriesFactory() -> DryRunDirectories:
+    return DryRunDirectories([])
+
+
+@dataclass
+class DryRunReport:
+    """
+    What a real fabrication would do.  The paths are the final, published, paths
+    """
+    projectPath:   Path              = Path('')
+    directories:   DryRunDirectories = field(default_factory=dryRunDirectoriesFactory)
+    files:         DryRunFiles       = field(default_factory=dryRunFilesFactory)
+    syscalls:      Dict[str, int]    = field(default_factory=dict)
+    renderSeconds: float             = 0.0
+
+    @property
+    def byteCount(self) -> int:
+        return sum(dryRunFile.byteCount for dryRunFile in self.files)
+
+    @property
+    def syscallCount(self) -> int:
+        return sum(self.syscalls.values())
+
+    @property
+    def summary(self) -> str:
+        syscalls: str = ', '.join(f'{count} {name}' for name, count in self.syscalls.items())
+        return (
+            f'{self.projectPath}: {len(self.directories)} directories, {len(self.files)} files, {self.byteCount} bytes, '
+            f'{self.syscallCount} file system operations ({syscalls}); rendered in {self.renderSeconds * 1000:.2f} ms'
+        )
+
+
+class DryRunExecutor:
+    """
+    Walks a fabrication plan exactly like the PlanExecutor does, renders every template,
+    and accounts for the file system operations of the plain output backend;  It never
+    touches the target file system.
+    Timing `execute` gives a zero I/O baseline for the rendering path
+    """
+    def __init__(self, projectPath: Path, baseDirectoryExists: bool = True, fabricationState: FabricationState = NO_FABRICATION_STATE):
+        """
+
+        Args:
+            projectPath:          Where a real run would publish the project
+            baseDirectoryExists:  If not, a real run creates it
+            fabricationState:     The state a real run records in the project's `.pyfabricate` directory;  Its base contents are not used
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._projectPath:         Path             = projectPath
+        self._baseDirectoryExists: bool             = baseDirectoryExists
+        self._fabricationState:    FabricationState = fabricationState
+
+    def execute(self, plan: FabricationPlan) -> DryRunReport:
+
+        report:   DryRunReport = DryRunReport(projectPath=self._projectPath)
+        syscalls: Counter      = Counter()
+
+        syscalls[SYSCALL_MKDIR] += 1                    # The staging directory
+        if self._baseDirectoryExists is False:
+            syscalls[SYSCALL_MKDIR] += 1
+
+        renderSeconds: float = 0.0
+        for operation in plan.operations:
+
+            fullPath: Path = self._projectPath / operation.relativePath
+
+            if isinstance(operation, MakeDirectory):
+                syscalls[SYSCALL_MKDIR] += 1
+                report.directories.append(fullPath)
+            elif isinstance(operation, FileOperation):
+                if isinstance(operation, CopyFile):
+                    #
+                    # Source and destination are both open;  The kernel copies;  The permissions are preserved
+                    #
+                    byteCount: int = operation.byteCount
+                    syscalls[SYSCALL_OPEN]   += 2
+                    syscalls[SYSCALL_COPY]   += 1
+                    syscalls[SYSCALL_FCHMOD] += 1
+                    syscalls[SYSCALL_CLOSE]  += 2
+                else:
+                    if isinstance(operation, (WriteFile, RenderFile)):
+                        startTime: float = perf_counter()
+                        byteCount = len(operation.content)
+                        renderSeconds += perf_counter() - startTime
+                    else:
+                        byteCount = 0
+
+                    syscalls[SYSCALL_OPEN] += 1
+                    if byteCount > 0:
+                        syscalls[SYSCALL_WRITE] += 1
+                    if operation.mode != DEFAULT_FILE_MODE:
+                        syscalls[SYSCALL_FCHMOD] += 1
+                    syscalls[SYSCALL_CLOSE] += 1
+
+                report.files.append(DryRunFile(path=fullPath, byteCount=byteCount, mode=operation.mode))
+
+        self._recordFabricationState(plan=plan, report=report, syscalls=syscalls)
+
+        syscalls[SYSCALL_RENAME] += 1                   # Publish
+
+        report.syscalls      = dict(syscalls)
+        report.renderSeconds = renderSeconds
+
+        self.logger.info(report.summary)
+
+        return report
+
+    def _recordFabricationState(self, plan: FabricationPlan, report: DryRunReport, syscalls: Counter):
+        """
+        The state and the manifest are serialized exactly as a real run does;  So the byte counts
+        are exact.  A real run records the mtime of every file it wrote;  Any mtime has as many digits
+        """
+        baseContents: BaseContents        = BaseContents({operation.relativePath: outputContent(operation=operation)
+                                                          for operation in plan.operations if isinstance(operation, FileOperation)})
+        manifest:     FabricationManifest = FabricationManifest()
+        mtimeNs:      int                 = time_ns()
+
+        if self._fabricationState is not NO_FABRICATION_STATE:
+            statePath: Path             = self._projectPath / STATE_DIRECTORY_NAME
+            state:     FabricationState = FabricationState(projectDetails=self._fabricationState.projectDetails,
+                                                           fabricationDate=self._fabricationState.fabricationDate,
+                                                           baseContents=baseContents)
+            syscalls[SYSCALL_MKDIR] += 1
+            report.directories.append(statePath)
+
+            self._writeAtomically(fullPath=statePath / STATE_FILE_NAME,   content=state.stateDocument(), report=report, syscalls=syscalls)
+            self._writeAtomically(fullPath=statePath / BASE_ARCHIVE_NAME, content=state.baseArchive(),   report=report, syscalls=syscalls)
+
+        manifest.addTemplates(plan=plan)
+        for operation in plan.operations:
+            if isinstance(operation, FileOperation):
+                manifest.addFile(operation=operation, content=baseContents[operation.relativePath])
+                manifest.entries[operation.relativePath].mtimeNs = mtimeNs
+
+        self._writeAtomically(fullPath=self._projectPath / MANIFEST_FILE_NAME, content=manifest.document(), report=report, syscalls=syscalls)
+
+    def _writeAtomically(self, fullPath: Path, content: bytes, report: DryRunReport, syscalls: Counter):
+        """
+        A temporary file that is renamed into place
+        """
+        syscalls[SYSCALL_OPEN]   += 1
+        syscalls[SYSCALL_WRITE]  += 1
+        syscalls[SYSCALL_CLOSE]  += 1
+        syscalls[SYSCALL_RENAME] += 1
+
+        report.files.append(DryRunFile(path=fullPath, byteCount=len(content)))
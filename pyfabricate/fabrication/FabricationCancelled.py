@@ -0,0 +1,10 @@
+
+from pyfabricate.fabrication.FabricationError import FabricationError
+
+
+class FabricationCancelled(FabricationError):
+    """
+    Raised between fabrication steps once someone cancels the run
+    """
+    def __init__(self, message: str = 'Fabrication cancelled'):
+        super().__init__(message=message)
@@ -0,0 +1,257 @@
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import NewType
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from hashlib import sha256
+
+from json import dumps as jsonDumps
+from json import loads as jsonLoads
+
+from os import getpid as osGetPid
+from os import replace as osReplace
+from os import stat_result
+
+from pathlib import Path
+
+from time import perf_counter
+
+from pyfabricate.fabrication.FabricationError import FabricationError
+from pyfabricate.fabrication.FabricationPlan import FabricationPlan
+from pyfabricate.fabrication.FabricationPlan import FileOperation
+from pyfabricate.fabrication.FabricationPlan import RenderFile
+from pyfabricate.fabrication.TemplateSource import TemplateSource
+
+MANIFEST_FILE_NAME: str = '.pyfabricate-manifest.json'
+MANIFEST_VERSION:   int = 1
+
+#
+# The stat data does not vouch for the content;  Verification always hashes the file
+#
+NO_MTIME: int = 0
+
+NO_PATH: Path = cast(Path, None)
+
+ManifestTokens = Dict[str, str]
+ManifestPaths  = NewType('ManifestPaths', List[Path])
+
+
+def manifestPathsFactory() -> ManifestPaths:
+    return ManifestPaths([])
+
+
+@dataclass
+class ManifestEntry:
+    contentHash: str            = ''
+    size:        int            = 0
+    mtimeNs:     int            = NO_MTIME
+    tokens:      ManifestTokens = field(default_factory=dict)
+
+
+@dataclass
+class VerificationReport:
+    projectPath:      Path          = Path('')
+    fileCount:        int           = 0
+    hashedCount:      int           = 0
+    modified:         ManifestPaths = field(default_factory=manifestPathsFactory)
+    missing:          ManifestPaths = field(default_factory=manifestPathsFactory)
+    changedTemplates: List[str]     = field(default_factory=list)
+    elapsed:          float         = 0.0
+
+    @property
+    def isClean(self) -> bool:
+        return len(self.modified) == 0 and len(self.missing) == 0 and len(self.changedTemplates) == 0
+
+    @property
+    def summary(self) -> str:
+        verdict: str = 'matches its templates' if self.isClean is True else 'has drifted'
+        return (
+            f'{self.projectPath} {verdict}: {self.fileCount} files, {self.hashedCount} hashed, '
+            f'{len(self.modified)} modified, {len(self.missing)} missing, {len(self.changedTemplates)} templates changed '
+            f'in {self.elapsed * 1000:.2f} ms'
+        )
+
+
+class FabricationManifest:
+    """
+    What a fabrication produced:  The hash of every template it used, the tokens each
+    rendered file references and the hash of every generated file.  A file's size and mtime
+    are only recorded when they vouch for its hash;  Verification then only hashes files
+    whose stat data changed.  The Merkle root identifies the whole generated content with one hash
+    """
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._templates: Dict[str, str]           = {}
+        self._entries:   Dict[Path, ManifestEntry] = {}
+
+    @property
+    def entries(self) -> Dict[Path, ManifestEntry]:
+        return self._entries
+
+    @property
+    def templateFingerprint(self) -> str:
+        fingerprint = sha256()
+        for name, contentHash in sorted(self._templates.items()):
+            fingerprint.update(f'{name}\0{contentHash}\n'.encode())
+
+        return fingerprint.hexdigest()
+
+    @property
+    def merkleRoot(self) -> str:
+        """
+        Leaves are the hashes of each path and its content hash in path order;  An odd node
+        at any level is paired with itself
+        """
+        level: List[bytes] = [
+            sha256(f'{relativePath.as_posix()}\0{entry.contentHash}'.encode()).digest()
+            for relativePath, entry in sorted(self._entries.items())
+        ]
+        if len(level) == 0:
+            return sha256(b'').hexdigest()
+
+        while len(level) > 1:
+            if len(level) % 2 == 1:
+                level.append(level[-1])
+            level = [sha256(level[index] + level[index + 1]).digest() for index in range(0, len(level), 2)]
+
+        return level[0].hex()
+
+    def addTemplates(self, plan: FabricationPlan):
+        """
+        Args:
+            plan:  The plan records the hash of each template it renders or copies
+        """
+        self._templates.update(plan.templates)
+
+    def addFile(self, operation: FileOperation, content: bytes, fullPath: Path = NO_PATH):
+        """
+
+        Args:
+            operation:  The operation that generated the file
+            content:    The generated content
+            fullPath:   Only when the file on disk is known to have this content;  Its stat data is recorded
+        """
+        entry: ManifestEntry = ManifestEntry(contentHash=sha256(content).hexdigest(), size=len(content))
+
+        if isinstance(operation, RenderFile):
+            entry.tokens = {identifier: str(operation.tokens[identifier]) for identifier in sorted(operation.compiledTemplate.identifierSet)}
+        if fullPath is not NO_PATH:
+            entry.mtimeNs = fullPath.stat().st_mtime_ns
+
+        self._entries[operation.relativePath] = entry
+
+    def carryOver(self, operation: FileOperation, content: bytes, previous: 'FabricationManifest'):
+        """
+        For files that were not rewritten;  The previous stat data still vouches for the
+        content if the content did not change
+
+        Args:
+            operation:  The operation that generates the file
+            content:    The generated content
+            previous:   The manifest recorded before
+        """
+        self.addFile(operation=operation, content=content)
+
+        entry:         ManifestEntry = self._entries[operation.relativePath]
+        previousEntry: ManifestEntry = previous.entries.get(operation.relativePath, cast(ManifestEntry, None))
+        if previousEntry is not None and previousEntry.contentHash == entry.contentHash:
+            entry.mtimeNs = previousEntry.mtimeNs
+
+    def verify(self, projectPath: Path, templateSource: TemplateSource) -> VerificationReport:
+        """
+        Stats every generated file and hashes only those whose size or mtime changed
+
+        Args:
+            projectPath:    The fabricated project
+            templateSource: The templates the project should match
+
+        Returns:  What drifted
+        """
+        startTime: float              = perf_counter()
+        report:    VerificationReport = VerificationReport(projectPath=projectPath, fileCount=len(self._entries))
+
+        for relativePath, entry in self._entries.items():
+            fullPath: Path = projectPath / relativePath
+            try:
+                statResult: stat_result = fullPath.stat()
+            except FileNotFoundError:
+                report.missing.append(relativePath)
+                continue
+
+            if entry.mtimeNs != NO_MTIME and statResult.st_size == entry.size and statResult.st_mtime_ns == entry.mtimeNs:
+                continue
+
+            report.hashedCount += 1
+            if statResult.st_size != entry.size or sha256(fullPath.read_bytes()).hexdigest() != entry.contentHash:
+                report.modified.append(relativePath)
+
+        for name, contentHash in self._templates.items():
+            if templateSource.contentHash(name) != contentHash:
+                report.changedTemplates.append(name)
+
+        report.elapsed = perf_counter() - startTime
+
+        return report
+
+    def save(self, projectPath: Path):
+
+        manifestPath:  Path = projectPath / MANIFEST_FILE_NAME
+        temporaryPath: Path = manifestPath.with_name(f'{MANIFEST_FILE_NAME}.{osGetPid()}')
+        temporaryPath.write_bytes(self.document())
+        osReplace(temporaryPath, manifestPath)
+
+        self.logger.info(f'Manifest saved: {manifestPath}')
+
+    def document(self) -> bytes:
+        """
+        Returns:  The content of the manifest file
+        """
+        document: Dict[str, Any] = {
+            'version':             MANIFEST_VERSION,
+            'templateFingerprint': self.templateFingerprint,
+            'merkleRoot':          self.merkleRoot,
+            'templates':           dict(sorted(self._templates.items())),
+            'files': {
+                relativePath.as_posix(): {
+                    'sha256':  entry.contentHash,
+                    'size':    entry.size,
+                    'mtimeNs': entry.mtimeNs,
+                    'tokens':  entry.tokens,
+                }
+                for relativePath, entry in sorted(self._entries.items())
+            }
+        }
+        return jsonDumps(document, indent=4).encode()
+
+    @classmethod
+    def load(cls, projectPath: Path) -> 'FabricationManifest':
+
+        manifestPath: Path = projectPath / MANIFEST_FILE_NAME
+        try:
+            document: Dict[str, Any] = jsonLoads(manifestPath.read_text())
+            if document.get('version') != MANIFEST_VERSION:
+                raise FabricationError(message=f'Unsupported manifest version in {manifestPath}')
+
+            manifest: FabricationManifest = FabricationManifest()
+            manifest._templates = dict(document['templates'])
+            for name, value in document['files'].items():
+                manifest._entries[Path(name)] = ManifestEntry(contentHash=value['sha256'],
+                                                              size=value['size'],
+                                                              mtimeNs=value['mtimeNs'],
+                                                              tokens=value.get('tokens', {}))
+        except FileNotFoundError:
+            raise FabricationError(message=f'{projectPath} has no fabrication manifest')
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            raise FabricationError(message=f'Unreadable fabrication manifest {manifestPath}: {e}')
+
+        return manifest
@@ -0,0 +1,228 @@
+
+from typing import Dict
+from typing import List
+from typing import Mapping
+from typing import NewType
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from pathlib import Path
+
+from pyfabricate.fabrication.CompiledTemplate import CompiledTemplate
+
+DEFAULT_FILE_MODE: int = 0o666      # Subject to the umask just like a plain open()
+
+TokenDictionary = Mapping[str, object]
+
+
+@dataclass
+class PlanOperation:
+    """
+    Paths are relative to the project root so that the same plan can be executed anywhere
+    """
+    relativePath: Path = cast(Path, None)
+
+    @property
+    def byteCount(self) -> int:
+        return 0
+
+
+@dataclass
+class MakeDirectory(PlanOperation):
+    pass
+
+
+@dataclass
+class FileOperation(PlanOperation):
+    mode: int = DEFAULT_FILE_MODE
+
+
+@dataclass
+class TouchFile(FileOperation):
+    pass
+
+
+@dataclass
+class WriteFile(FileOperation):
+    """
+    Content that the plan compiler computed directly
+    """
+    content: bytes = b''
+
+    @property
+    def byteCount(self) -> int:
+        return len(self.content)
+
+
+@dataclass
+class CopyFile(FileOperation):
+    """
+    A template that needs no token substitution
+    """
+    sourcePath: Path = cast(Path, None)
+
+    @property
+    def byteCount(self) -> int:
+        return self.sourcePath.stat().st_size
+
+
+@dataclass
+class RenderFile(FileOperation):
+    """
+    A template that needs token substitution.  Rendering is deferred until someone asks
+    for the content and then remembered;  That keeps plan compilation cheap and lets
+    executors choose when to pay for rendering
+    """
+    templatePath:     Path             = cast(Path, None)
+    compiledTemplate: CompiledTemplate = cast(CompiledTemplate, None)
+    tokens:           TokenDictionary  = field(default_factory=dict)
+
+    _content: bytes = field(default=cast(bytes, None), init=False, repr=False, compare=False)
+
+    @property
+    def content(self) -> bytes:
+        if self._content is None:
+            self._content = self.compiledTemplate.render(self.tokens)
+        return self._content
+
+    @property
+    def byteCount(self) -> int:
+        return len(self.content)
+
+
+PlanOperations = NewType('PlanOperations', List[PlanOperation])
+
+
+def outputContent(operation: FileOperation) -> bytes:
+    """
+    Renders or reads as necessary
+
+    Args:
+        operation:  Any file operation
+
+    Returns:  The bytes the operation puts on disk
+    """
+    if isinstance(operation, (WriteFile, RenderFile)):
+        return operation.content
+    elif isinstance(operation, CopyFile):
+        return operation.sourcePath.read_bytes()
+    else:
+        return b''
+
+
+@dataclass
+class FabricationPlanSummary:
+    directories: int = 0
+    touches:     int = 0
+    copies:      int = 0
+    writes:      int = 0
+    renders:     int = 0
+    chmods:      int = 0
+    byteCount:   int = 0
+
+    @property
+    def fileCount(self) -> int:
+        return self.touches + self.copies + self.writes + self.renders
+
+    def __str__(self) -> str:
+        return (
+            f'{self.directories} directories, {self.fileCount} files '
+            f'({self.touches} touched, {self.copies} copied, {self.writes} written, {self.renders} rendered), '
+            f'{self.chmods} mode changes, {self.byteCount} bytes'
+        )
+
+
+class FabricationPlan:
+    """
+    A declarative description of everything a fabrication writes.  Each output path appears
+    exactly once;  A later operation on the same path replaces the earlier one but keeps
+    its position, so that directories are still created before their contents
+    """
+    def __init__(self, projectPath: Path):
+        """
+
+        Args:
+            projectPath:  The fully qualified project root;  Operation paths are relative to it
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._projectPath: Path                      = projectPath
+        self._operations:  Dict[Path, PlanOperation] = {}
+        self._templates:   Dict[str, str]            = {}
+
+    @property
+    def projectPath(self) -> Path:
+        return self._projectPath
+
+    @property
+    def operations(self) -> PlanOperations:
+        return PlanOperations(list(self._operations.values()))
+
+    @property
+    def templates(self) -> Dict[str, str]:
+        """
+        Returns:  The name and content hash of each template the plan uses
+        """
+        return self._templates
+
+    @property
+    def summary(self) -> FabricationPlanSummary:
+        """
+        Renders any templates that have not been rendered yet; Nothing is written
+        """
+        summary: FabricationPlanSummary = FabricationPlanSummary()
+
+        for operation in self._operations.values():
+            if isinstance(operation, MakeDirectory):
+                summary.directories += 1
+            elif isinstance(operation, TouchFile):
+                summary.touches += 1
+            elif isinstance(operation, CopyFile):
+                summary.copies += 1
+            elif isinstance(operation, WriteFile):
+                summary.writes += 1
+            elif isinstance(operation, RenderFile):
+                summary.renders += 1
+
+            if isinstance(operation, FileOperation) and operation.mode != DEFAULT_FILE_MODE:
+                summary.chmods += 1
+
+            summary.byteCount += operation.byteCount
+
+        return summary
+
+    def makeDirectory(self, path: Path):
+        self._add(MakeDirectory(relativePath=self._relative(path)))
+
+    def touchFile(self, path: Path):
+        self._add(TouchFile(relativePath=self._relative(path)))
+
+    def writeFile(self, path: Path, content: bytes, mode: int = DEFAULT_FILE_MODE):
+        self._add(WriteFile(relativePath=self._relative(path), content=content, mode=mode))
+
+    def copyFile(self, path: Path, sourcePath: Path, mode: int = DEFAULT_FILE_MODE):
+        self._add(CopyFile(relativePath=self._relative(path), sourcePath=sourcePath, mode=mode))
+
+    def renderFile(self, path: Path, templatePath: Path, compiledTemplate: CompiledTemplate, tokens: TokenDictionary, mode: int = DEFAULT_FILE_MODE):
+        self._add(RenderFile(relativePath=self._relative(path),
+                             templatePath=templatePath,
+                             compiledTemplate=compiledTemplate,
+                             tokens=tokens,
+                             mode=mode)
+                  )
+
+    def useTemplate(self, name: str, contentHash: str):
+        self._templates[name] = contentHash
+
+    def _add(self, operation: PlanOperation):
+        self._operations[operation.relativePath] = operation
+
+    def _relative(self, path: Path) -> Path:
+        if path.is_absolute() is True:
+            return path.relative_to(self._projectPath)
+        return path
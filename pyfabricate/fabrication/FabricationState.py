@@ -0,0 +1,133 @@
+
+from typing import Any
+from typing import Dict
+from typing import NewType
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from datetime import datetime
+
+from io import BytesIO
+
+from json import dumps as jsonDumps
+from json import loads as jsonLoads
+
+from os import getpid as osGetPid
+from os import replace as osReplace
+
+from pathlib import Path
+
+from zipfile import ZIP_DEFLATED
+from zipfile import BadZipFile
+from zipfile import ZipFile
+
+from pyfabricate.ProjectDetails import ProjectDetails
+
+from pyfabricate.fabrication.FabricationError import FabricationError
+
+STATE_DIRECTORY_NAME: str = '.pyfabricate'
+STATE_FILE_NAME:      str = 'fabrication.json'
+BASE_ARCHIVE_NAME:    str = 'base.zip'
+
+STATE_VERSION: int = 1
+
+#
+# What we generated, keyed by the path relative to the project root;  The common ancestor for updates
+#
+BaseContents = NewType('BaseContents', Dict[Path, bytes])
+
+
+def baseContentsFactory() -> BaseContents:
+    return BaseContents({})
+
+
+@dataclass
+class FabricationState:
+    """
+    Everything needed to re-fabricate a project later:  The project details, the date that
+    was baked into the templates and the content of every file we generated.  It is kept in
+    the project's `.pyfabricate` directory.  The generated content is kept compressed in a
+    single archive so that it never shares an inode with the project files.  The directory is
+    committed with the project so that any clone can be updated
+    """
+    projectDetails:  ProjectDetails = field(default_factory=ProjectDetails)
+    fabricationDate: datetime       = field(default_factory=datetime.now)
+    baseContents:    BaseContents   = field(default_factory=baseContentsFactory)
+
+    def save(self, projectPath: Path):
+        """
+        Each file is written to a temporary file and then renamed into place
+
+        Args:
+            projectPath:  The project root
+        """
+        logger:    Logger = getLogger(__name__)
+        statePath: Path   = projectPath / STATE_DIRECTORY_NAME
+        statePath.mkdir(exist_ok=True)
+
+        for fileName, content in ((STATE_FILE_NAME, self.stateDocument()), (BASE_ARCHIVE_NAME, self.baseArchive())):
+            filePath:      Path = statePath / fileName
+            temporaryPath: Path = filePath.with_name(f'{fileName}.{osGetPid()}')
+            temporaryPath.write_bytes(content)
+            osReplace(temporaryPath, filePath)
+
+        logger.info(f'Fabrication state saved: {statePath}')
+
+    def stateDocument(self) -> bytes:
+        """
+        Returns:  The content of the state file
+        """
+        document: Dict[str, Any] = {
+            'version':         STATE_VERSION,
+            'fabricationDate': self.fabricationDate.isoformat(),
+            'projectDetails':  self.projectDetails.toDictionary(),
+        }
+        return jsonDumps(document, indent=4).encode()
+
+    def baseArchive(self) -> bytes:
+        """
+        Returns:  The content of the base archive
+        """
+        archiveBuffer: BytesIO = BytesIO()
+        with ZipFile(archiveBuffer, 'w', compression=ZIP_DEFLATED) as archive:
+            for relativePath, content in sorted(self.baseContents.items()):
+                archive.writestr(relativePath.as_posix(), content)
+
+        return archiveBuffer.getvalue()
+
+    @classmethod
+    def load(cls, projectPath: Path) -> 'FabricationState':
+        """
+        The project details are relocated to the project's current base directory
+
+        Args:
+            projectPath:  The project root
+
+        Returns:  The state recorded when the project was fabricated or last updated
+        """
+        statePath: Path = projectPath / STATE_DIRECTORY_NAME
+        try:
+            document: Dict[str, Any] = jsonLoads((statePath / STATE_FILE_NAME).read_text())
+            if document.get('version') != STATE_VERSION:
+                raise FabricationError(message=f'Unsupported fabrication state version in {statePath}')
+
+            projectDetails:  ProjectDetails = ProjectDetails.fromDictionary(document['projectDetails'])
+            fabricationDate: datetime       = datetime.fromisoformat(document['fabricationDate'])
+
+            baseContents: BaseContents = baseContentsFactory()
+            with ZipFile(statePath / BASE_ARCHIVE_NAME) as archive:
+                for name in archive.namelist():
+                    baseContents[Path(name)] = archive.read(name)
+
+        except FileNotFoundError:
+            raise FabricationError(message=f'{projectPath} was not fabricated by pyfabricate or predates update support')
+        except (ValueError, KeyError, TypeError, BadZipFile) as e:
+            raise FabricationError(message=f'Unreadable fabrication state in {statePath}: {e}')
+
+        projectDetails.baseDirectory = projectPath.parent
+
+        return FabricationState(projectDetails=projectDetails, fabricationDate=fabricationDate, baseContents=baseContents)
@@ -1,7 +1,7 @@
 
-from typing import Callable
 from typing import Dict
 from typing import List
+from typing import Set
 from typing import cast
 
 from logging import Logger
@@ -9,42 +9,104 @@ from logging import getLogger
 
 from datetime import datetime
 
-from string import Template
-
 from dataclasses import dataclass
 
-from os import pathsep as osPathSep
+from asyncio import AbstractEventLoop
+from asyncio import get_running_loop
+from asyncio import wait as asyncioWait
+from asyncio import wrap_future
 
-from pathlib import Path
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
 
-from semantic_version import Version as SemanticVersion
+from functools import partial
+
+from os import getpid
+from os import linesep as osLineSep
+from os import sep as osSep
+from os import rename
 
-from wx import CENTER
-from wx import ICON_ERROR
-from wx import OK
+from secrets import token_hex
 
-from wx import MessageDialog
+from threading import Event
+
+from shutil import rmtree
+
+from pathlib import Path
+
+from semantic_version import Version as SemanticVersion
 
 from codeallybasic.ConfigurationLocator import ConfigurationLocator
 from codeallybasic.ResourceManager import ResourceManager
 
 from pyfabricate.Constants import APPLICATION_NAME
+from pyfabricate.Constants import CACHE_DIRECTORY_NAME
+from pyfabricate.Constants import GOLDEN_ENVIRONMENTS_DIRECTORY_NAME
 from pyfabricate.Constants import TEMPLATES_DIRECTORY_NAME
+from pyfabricate.Constants import TOKENS_FILE_NAME
+from pyfabricate.Constants import WHEELS_DIRECTORY_NAME
+from pyfabricate.Constants import DROP_WHEELS_DIRECTORY_NAME
+from pyfabricate.fabrication.FabricationCancelled import FabricationCancelled
 from pyfabricate.fabrication.FabricationError import FabricationError
+from pyfabricate.fabrication.AsyncPlanExecutor import AsyncPlanExecutor
+from pyfabricate.fabrication.AsyncPlanExecutor import DEFAULT_CONCURRENCY
+from pyfabricate.fabrication.CompiledTemplate import CompiledTemplate
+from pyfabricate.fabrication.DeduplicatingOutputBackend import DeduplicatingOutputBackend
+from pyfabricate.fabrication.DeduplicatingOutputBackend import STORE_DIRECTORY_NAME
+from pyfabricate.fabrication.DryRunExecutor import DryRunExecutor
+from pyfabricate.fabrication.DryRunExecutor import DryRunReport
+from pyfabricate.fabrication.FabricationManifest import FabricationManifest
+from pyfabricate.fabrication.FabricationManifest import VerificationReport
+from pyfabricate.fabrication.FabricationPlan import DEFAULT_FILE_MODE
+from pyfabricate.fabrication.FabricationPlan import FabricationPlan
+from pyfabricate.fabrication.FabricationPlan import FileOperation
+from pyfabricate.fabrication.FabricationPlan import TokenDictionary
+from pyfabricate.fabrication.FabricationPlan import outputContent
+from pyfabricate.fabrication.FabricationState import BaseContents
+from pyfabricate.fabrication.FabricationState import FabricationState
+from pyfabricate.fabrication.GoldenEnvironmentCache import GoldenEnvironmentCache
+from pyfabricate.fabrication.OutputBackend import OutputBackend
+from pyfabricate.fabrication.OutputPolicy import OutputPolicy
+from pyfabricate.fabrication.PlanExecutor import PlanExecutor
+from pyfabricate.fabrication.ProgressReporter import NO_PROGRESS_REPORTER
+from pyfabricate.fabrication.ProgressReporter import ProgressCallback
+from pyfabricate.fabrication.ProgressReporter import ProgressReporter
+from pyfabricate.fabrication.ProjectUpdater import ProjectUpdater
+from pyfabricate.fabrication.ProjectUpdater import UpdateReport
+from pyfabricate.fabrication.TemplateBundle import BUNDLE_FILE_NAME
+from pyfabricate.fabrication.TemplateBundle import NO_TEMPLATE_BUNDLE
+from pyfabricate.fabrication.TemplateBundle import TemplateBundle
+from pyfabricate.fabrication.TemplateCache import TemplateCache
+from pyfabricate.fabrication.TemplateSource import TemplateSource
+from pyfabricate.fabrication.TemplateSynchronizer import PackagedTemplates
+from pyfabricate.fabrication.TemplateSynchronizer import RELEASED_HASHES_FILE_NAME
+from pyfabricate.fabrication.TemplateSynchronizer import ReleasedHashes
+from pyfabricate.fabrication.TemplateSynchronizer import TemplateSynchronizer
+from pyfabricate.fabrication.TokenContext import TokenContext
+from pyfabricate.fabrication.TokenContext import TokenProviders
 from pyfabricate.oswrapper.ExternalCommands import ExternalCommands
 from pyfabricate.oswrapper.ExternalCommands import UnableToCreateVirtualEnvironment
+from pyfabricate.oswrapper.InterpreterDiscovery import InterpreterDiscovery
+from pyfabricate.oswrapper.VirtualEnvironmentBuilder import PipPolicy
+from pyfabricate.oswrapper.VirtualEnvironmentBuilder import VirtualEnvironmentBuilder
+from pyfabricate.oswrapper.VirtualEnvironmentBuilder import VirtualEnvironmentCancelled
+from pyfabricate.oswrapper.Wheelhouse import Wheelhouse
 
 from pyfabricate.ProjectDetails import ProjectDetails
 
-TEMPLATE_RESOURCE_PATH: str = f'pyfabricate{osPathSep}resources{osPathSep}templates'
+TEMPLATE_RESOURCE_PATH: str = f'pyfabricate{osSep}resources{osSep}templates'
 TEMPLATE_PACKAGE_NAME:  str = 'pyfabricate.resources.templates'
+BUNDLE_RESOURCE_PATH:   str = f'pyfabricate{osSep}resources'
+BUNDLE_PACKAGE_NAME:    str = 'pyfabricate.resources'
 
 
-ProgressCallback   = Callable[[str], None]
 SkeletonDictionary = Dict[str, Path]
 
 NO_PATH:        Path = cast(Path, None)
 
+NO_FABRICATION_STATE: FabricationState = cast(FabricationState, None)
+
 CIRCLECI_PATH:  Path = Path('.circleci')
 SRC_PATH:       Path = Path('src')
 TESTS_PATH:     Path = Path('tests')
@@ -83,6 +145,7 @@ TOKEN_OWNER_EMAIL:           str = 'OWNER_EMAIL'
 TOKEN_DESCRIPTION:           str = 'DESCRIPTION'
 TOKEN_KEYWORDS:              str = 'KEYWORDS'
 TOKEN_SIMPLE_PYTHON_VERSION: str = 'SIMPLE_PYTHON_VERSION'
+TOKEN_PYTHON_INTERPRETER:    str = 'PYTHON_INTERPRETER'
 
 TOKEN_DAY:             str = 'DAY'
 TOKEN_MONTH_NAME_FULL: str = 'MONTH_NAME_FULL'
@@ -90,6 +153,30 @@ TOKEN_YEAR:            str = 'YEAR'
 
 EXECUTION_PERMISSIONS: int = 0o555      # equivalent to gou+rx
 
+STAGING_PREFIX: str = '.pyfabricate-staging-'
+
+STEP_COMPILE_PLAN:  str = 'Compiling plan'
+STEP_WRITE_FILES:   str = 'Writing files'
+STEP_RECORD_STATE:  str = 'Recording fabrication state'
+STEP_UPDATE_FILES:  str = 'Updating files'
+
+STEP_CREATE_VIRTUAL_ENVIRONMENT: str = 'Creating virtual environment'
+
+#
+# Environments are mostly waiting on the file system;  Do not let a batch start dozens at once
+#
+VIRTUAL_ENVIRONMENT_WORKERS: int = 2
+#
+# Seconds;  How often a fabrication waiting for its virtual environment checks for a cancel
+#
+VIRTUAL_ENVIRONMENT_POLL_INTERVAL: float = 0.1
+
+NO_GOLDEN_ENVIRONMENTS: int = 0
+
+REQUIREMENTS_TEMPLATE: str = 'requirements.txt.template'
+
+NO_PROGRESS_CALLBACK: ProgressCallback = cast(ProgressCallback, None)
+
 
 @dataclass
 class SkeletonDirectories:
@@ -109,29 +196,198 @@ class SkeletonDirectories:
 
 
 class Fabricator:
-    def __init__(self, projectDetails: ProjectDetails, progressCallback: ProgressCallback):
+    """
+    Does not depend on wxPython so that it can run headless (batch mode, worker processes)
+    Errors are reported by raising a FabricationError;  The UI decides how to present them
+    """
+    clsLogger: Logger = getLogger(__name__)
+
+    _synchronizedPaths: Set[Path] = set()
+
+    _virtualEnvironmentExecutor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=VIRTUAL_ENVIRONMENT_WORKERS, thread_name_prefix='VirtualEnvironment')
+
+    def __init__(self, projectDetails: ProjectDetails, progressCallback: ProgressCallback = NO_PROGRESS_CALLBACK, outputPolicy: OutputPolicy = OutputPolicy.PLAIN,
+                 fabricationState: FabricationState = NO_FABRICATION_STATE, progressReporter: ProgressReporter = NO_PROGRESS_REPORTER,
+                 createVirtualEnvironment: bool = False, pipPolicy: PipPolicy = PipPolicy.CACHED_WHEEL, goldenEnvironmentBytes: int = NO_GOLDEN_ENVIRONMENTS):
         """
 
         Args:
-            projectDetails:         The details about the project we are creating
-            progressCallback:       Somewhere to report our progress as we go along
+            projectDetails:             The details about the project we are creating
+            progressCallback:           Somewhere to report our progress, as lines of text, as we go along
+            outputPolicy:               How to materialize the fabricated files
+            fabricationState:           Only when updating an existing project;  See `forUpdate`
+            progressReporter:           For typed progress events;  The progress callback, if any, becomes one more subscriber
+            createVirtualEnvironment:   Also create the project's virtual environment, while the files are written
+            pipPolicy:                  How the virtual environment gets pip
+            goldenEnvironmentBytes:     When positive, the virtual environment is a clone of a golden one with the project requirements
+                                        installed;  The golden environments may use this much disk space
         """
 
         self.logger: Logger = getLogger(__name__)
 
         self._projectDetails:   ProjectDetails   = projectDetails
-        self._progressCallback: ProgressCallback = progressCallback
+        self._outputPolicy:     OutputPolicy     = outputPolicy
+        self._updating:         bool             = fabricationState is not NO_FABRICATION_STATE
+        self._pipPolicy:        PipPolicy        = pipPolicy
+
+        self._createVirtualEnvironment:    bool  = createVirtualEnvironment
+        self._goldenEnvironmentBytes:      int   = goldenEnvironmentBytes
+        self._virtualEnvironmentAbandoned: Event = Event()
+
+        if progressReporter is NO_PROGRESS_REPORTER:
+            self._progressReporter: ProgressReporter = ProgressReporter()
+        else:
+            self._progressReporter = progressReporter
+        if progressCallback is not NO_PROGRESS_CALLBACK:
+            self._progressReporter.subscribe(ProgressReporter.lineSubscriber(progressCallback=progressCallback))
+
+        if self._updating is True:
+            self._fabricationState: FabricationState = fabricationState
+        else:
+            self._fabricationState = FabricationState(projectDetails=projectDetails)
+
+        self._projectPath:               Path                = self._computeProjectPath()
+        self._configurationTemplatePath: Path                = Fabricator.prepareTemplates()
+        self._directories:               SkeletonDirectories = self._computeSkeletonDirectories(self._projectPath)
+        self._templateCache:             TemplateCache       = Fabricator.templateCache(configurationTemplatePath=self._configurationTemplatePath)
+        self._templateSource:            TemplateSource      = Fabricator.templateSource(configurationTemplatePath=self._configurationTemplatePath)
+        self._tokenContext:              TokenContext        = self._createTokenContext()
+        self._plan:                      FabricationPlan     = FabricationPlan(projectPath=self._projectPath)
 
-        self._projectPath:    Path                 = self._createProjectDirectory()
-        configurationLocator: ConfigurationLocator = ConfigurationLocator()
+    def fabricate(self):
+        """
+        Compiles the plan and then executes it in a single pass.  The project is rendered into a
+        staging directory next to the final project directory and then published with a single
+        rename.  On failure, the staging directory is removed;  So, there is never a half-built
+        project in the way of the next attempt.  A run cancelled through the progress reporter
+        stops at the next step and raises FabricationCancelled
+        """
+        with self._progressReporter.step(STEP_COMPILE_PLAN):
+            plan: FabricationPlan = self.compilePlan()
 
-        configPath:                      Path                = configurationLocator.applicationPath(applicationName=APPLICATION_NAME)
-        self._configurationTemplatePath: Path                = configPath / TEMPLATES_DIRECTORY_NAME
-        self._directories:               SkeletonDirectories = self._computeSkeletonDirectories(self._projectPath)
+        stagingPath:        Path   = self._createStagingDirectory()
+        virtualEnvironment: Future = self._startVirtualEnvironment(stagingPath=stagingPath)
+        try:
+            executor: PlanExecutor = PlanExecutor(rootPath=stagingPath,
+                                                  progressReporter=self._progressReporter,
+                                                  reportedRootPath=self._projectPath,
+                                                  outputBackend=self._createOutputBackend())
+            with self._progressReporter.step(STEP_WRITE_FILES):
+                executor.execute(plan=plan)
+
+            with self._progressReporter.step(STEP_RECORD_STATE):
+                self._recordFabricationState(rootPath=stagingPath, plan=plan)
+            self._finishVirtualEnvironment(virtualEnvironment=virtualEnvironment)
+            self._progressReporter.checkpoint()
+            self._publish(stagingPath=stagingPath)
+        except BaseException as e:
+            self._abandonVirtualEnvironment(virtualEnvironment=virtualEnvironment)
+            self._discardStagingDirectory(stagingPath=stagingPath, cause=e)
+            raise
+
+        self._reportCompletion()
+
+    async def fabricateAsync(self, concurrency: int = DEFAULT_CONCURRENCY):
+        """
+        Same as `fabricate` but the file writes go through a bounded thread pool while the
+        templates are rendered on the event loop.  Every other blocking step runs on the loop's
+        default executor;  The loop is never blocked on the file system
+
+        Args:
+            concurrency:  The maximum number of file system calls in flight
+        """
+        loop: AbstractEventLoop = get_running_loop()
 
-        self._copyTemplatesToConfiguration(configurationTemplatePath=self._configurationTemplatePath)
+        with self._progressReporter.step(STEP_COMPILE_PLAN):
+            plan: FabricationPlan = await loop.run_in_executor(None, self.compilePlan)
 
-    def fabricate(self):
+        stagingPath:        Path   = await loop.run_in_executor(None, self._createStagingDirectory)
+        virtualEnvironment: Future = self._startVirtualEnvironment(stagingPath=stagingPath)
+        try:
+            executor: AsyncPlanExecutor = AsyncPlanExecutor(rootPath=stagingPath,
+                                                            progressReporter=self._progressReporter,
+                                                            reportedRootPath=self._projectPath,
+                                                            outputBackend=await loop.run_in_executor(None, self._createOutputBackend),
+                                                            concurrency=concurrency)
+            with self._progressReporter.step(STEP_WRITE_FILES):
+                await executor.execute(plan=plan)
+
+            with self._progressReporter.step(STEP_RECORD_STATE):
+                await loop.run_in_executor(None, partial(self._recordFabricationState, rootPath=stagingPath, plan=plan))
+            while virtualEnvironment.done() is False:
+                self._progressReporter.checkpoint()
+                await asyncioWait([wrap_future(virtualEnvironment)], timeout=VIRTUAL_ENVIRONMENT_POLL_INTERVAL)
+            self._finishVirtualEnvironment(virtualEnvironment=virtualEnvironment)
+            self._progressReporter.checkpoint()
+            await loop.run_in_executor(None, partial(self._publish, stagingPath=stagingPath))
+        except BaseException as e:
+            await loop.run_in_executor(None, partial(self._abandonVirtualEnvironment, virtualEnvironment=virtualEnvironment))
+            await loop.run_in_executor(None, partial(self._discardStagingDirectory, stagingPath=stagingPath, cause=e))
+            raise
+
+        self._reportCompletion()
+
+    def update(self) -> UpdateReport:
+        """
+        Re-renders an existing project from its recorded project details and re-applies only
+        the files whose template output changed.  Files the user edited are merged;  Overlapping
+        edits are marked as conflicts
+
+        Returns:  What happened to each file
+        """
+        if self._updating is False:
+            raise FabricationError(message='Use Fabricator.forUpdate to update an existing project')
+
+        with self._progressReporter.step(STEP_COMPILE_PLAN):
+            plan: FabricationPlan = self.compilePlan()
+
+        updater: ProjectUpdater = ProjectUpdater(projectPath=self._projectPath, progressReporter=self._progressReporter)
+        with self._progressReporter.step(STEP_UPDATE_FILES):
+            report: UpdateReport = updater.update(plan=plan, fabricationState=self._fabricationState)
+
+        self._progressReporter.flush()
+
+        return report
+
+    @classmethod
+    def verify(cls, projectPath: Path) -> VerificationReport:
+        """
+        Does not re-fabricate anything;  Only files whose stat data changed are hashed.  The templates
+        are compared as they are;  They are not synchronized first
+
+        Args:
+            projectPath:  A project that pyfabricate fabricated
+
+        Returns:  Whether the project still matches its templates
+        """
+        manifest: FabricationManifest = FabricationManifest.load(projectPath=projectPath)
+
+        templateSource: TemplateSource = Fabricator.templateSource(configurationTemplatePath=Fabricator.configurationTemplatePath())
+
+        return manifest.verify(projectPath=projectPath, templateSource=templateSource)
+
+    def dryRun(self) -> DryRunReport:
+        """
+        Goes through every step, including template rendering, without touching the target
+        file system
+
+        Returns:  The directories, files, bytes and file system operations a real run would produce
+        """
+        plan:     FabricationPlan = self.compilePlan()
+        executor: DryRunExecutor  = DryRunExecutor(projectPath=self._projectPath,
+                                                   baseDirectoryExists=self._projectDetails.baseDirectory.exists(),
+                                                   fabricationState=self._fabricationState)
+
+        return executor.execute(plan=plan)
+
+    def compilePlan(self) -> FabricationPlan:
+        """
+        Nothing touches the project directory;  Use the plan summary to inspect the operation
+        counts and bytes before executing
+
+        Returns:  A declarative description of the entire fabrication
+        """
+        self._plan = FabricationPlan(projectPath=self._projectPath)
 
         self._createSkeletonDirectories()
         self._createPythonPackageFiles()
@@ -141,31 +397,180 @@ class Fabricator:
         self._createProjectRootNoSubstitutionFiles()
         self._createProjectRootSubstitutionFiles()
         self._createApplicationSpecificPythonVersion()
-        # self._createProjectVirtualEnvironment()
         self._createVirtualEnvironmentScript()
 
-    def _createProjectDirectory(self) -> Path:
+        self._templateCache.save()
+
+        self.logger.info(f'Plan compiled: {len(self._plan.operations)} operations')
+
+        return self._plan
 
+    @classmethod
+    def forUpdate(cls, projectPath: Path, progressCallback: ProgressCallback = NO_PROGRESS_CALLBACK, progressReporter: ProgressReporter = NO_PROGRESS_REPORTER) -> 'Fabricator':
+        """
+
+        Args:
+            projectPath:        A project that pyfabricate fabricated
+            progressCallback:   Somewhere to report our progress, as lines of text, as we go along
+            progressReporter:   For typed progress events
+
+        Returns:  A fabricator ready to `update` the project
+        """
+        fabricationState: FabricationState = FabricationState.load(projectPath=projectPath)
+
+        return cls(projectDetails=fabricationState.projectDetails,
+                   progressCallback=progressCallback,
+                   fabricationState=fabricationState,
+                   progressReporter=progressReporter)
+
+    def _computeProjectPath(self) -> Path:
+        """
+        Fail early;  We do not want to overwrite a potential project.  When updating, the
+        project must be where its recorded name says it is
+
+        Returns:  The fully qualified project path;  It is not created until the fabrication is published
+        """
         projectPath: Path = self._projectDetails.baseDirectory / self._projectDetails.name
 
-        try:
-            projectPath.mkdir(parents=True, exist_ok=False)
-        except FileExistsError:
-            booBoo: MessageDialog = MessageDialog(parent=None,
-                                                  message='We do not want to overwrite a potential project',
-                                                  caption='Project path already exists',
-                                                  style=OK | ICON_ERROR)
-            booBoo.ShowModal()
+        if self._updating is True:
+            if projectPath.is_dir() is False:
+                raise FabricationError(message=f'Project {self._projectDetails.name} is not at {projectPath}')
+        elif projectPath.exists() is True:
             raise FabricationError(message=f'Project path already exists. {projectPath}')
 
-        self._progressCallback(f'Created: {projectPath}')
+        return projectPath
+
+    def _createStagingDirectory(self) -> Path:
+        """
+        The staging directory is a sibling of the project directory so that it is on the same
+        file system and the publishing rename is atomic.  It is created with a plain mkdir so
+        that it gets the same mode the project directory always had
+
+        Returns:  The staging directory path
+        """
+        baseDirectory: Path = self._projectDetails.baseDirectory
+        baseDirectory.mkdir(parents=True, exist_ok=True)
+
+        stagingPath: Path = baseDirectory / f'{STAGING_PREFIX}{self._projectDetails.name}-{getpid()}-{token_hex(4)}'
+        stagingPath.mkdir()
+
+        self.logger.info(f'Staging directory created: {stagingPath}')
+        return stagingPath
+
+    def _createOutputBackend(self) -> OutputBackend:
+        """
+        The content store lives in the cache directory.  Clones and hard links do not cross
+        volumes;  So, when the projects are on another volume, every file is written in full
+
+        Returns:  The backend that matches our output policy
+        """
+        if self._outputPolicy == OutputPolicy.PLAIN:
+            return OutputBackend()
+
+        storePath: Path = self._configurationTemplatePath.parent / CACHE_DIRECTORY_NAME / STORE_DIRECTORY_NAME
+        storePath.mkdir(parents=True, exist_ok=True)
+        if storePath.stat().st_dev != self._projectDetails.baseDirectory.stat().st_dev:
+            self.logger.info(f'{storePath} is not on the volume of {self._projectDetails.baseDirectory};  Not deduplicating')
+            return OutputBackend()
+
+        return DeduplicatingOutputBackend(storePath=storePath, outputPolicy=self._outputPolicy)
+
+    def _recordFabricationState(self, rootPath: Path, plan: FabricationPlan):
+        """
+        Keeps what we generated so that a later update has a common ancestor to merge with
+        and writes the manifest that `verify` checks against
+
+        Args:
+            rootPath:  Where the plan was executed
+            plan:      The executed plan;  Its rendered content is remembered
+        """
+        baseContents: BaseContents        = BaseContents({})
+        manifest:     FabricationManifest = FabricationManifest()
+
+        manifest.addTemplates(plan=plan)
+        for operation in plan.operations:
+            if isinstance(operation, FileOperation):
+                content: bytes = outputContent(operation=operation)
+
+                baseContents[operation.relativePath] = content
+                manifest.addFile(operation=operation, content=content, fullPath=rootPath / operation.relativePath)
+
+        self._fabricationState.baseContents = baseContents
+        self._fabricationState.save(projectPath=rootPath)
+        manifest.save(projectPath=rootPath)
+
+    def _discardStagingDirectory(self, stagingPath: Path, cause: BaseException):
+        """
+        The progress reported before the failure is delivered first;  A cancelled run reports no error
+        """
+        self._progressReporter.flush()
+
+        self.logger.error(f'Fabrication failed;  Removing {stagingPath}')
+        rmtree(stagingPath, ignore_errors=True)
 
+        if isinstance(cause, FabricationCancelled) is True:
+            return
+        message: str = cause.message if isinstance(cause, FabricationError) else f'{cause.__class__.__name__}: {cause}'
+        self._progressReporter.error(message)
+
+    def _reportCompletion(self):
+
+        self._progressReporter.message(f'Application specific version set to {self._projectDetails.pythonVersion}')
+        if self._createVirtualEnvironment is False:
+            self._progressReporter.message(f'Do not forget to execute: {self._directories.projectPath / Path(VENV_CREATION_SCRIPT_TEMPLATE).stem}')
+        self._progressReporter.flush()
+
+    def _publish(self, stagingPath: Path):
+        """
+        A rename onto an existing, empty directory succeeds on POSIX;  So check first
+
+        Args:
+            stagingPath:  The fully rendered project
+        """
+        projectPath: Path = self._projectPath
+        if projectPath.exists() is True:
+            raise FabricationError(message=f'Project path already exists. {projectPath}')
+        try:
+            rename(stagingPath, projectPath)
+        except OSError as e:
+            raise FabricationError(message=f'Unable to publish {projectPath}: {e}')
+
+        self._progressReporter.message(f'Created: {projectPath}')
         self.logger.info(f'Project path created: {projectPath}')
-        return projectPath
+
+    def _createTokenContext(self) -> TokenContext:
+        """
+        One context for the whole fabrication.  The user's token definitions live next to the
+        configuration templates;  They cannot redefine the built-in tokens
+
+        Returns:  The lazy token context
+        """
+        projectDetails:  ProjectDetails = self._projectDetails
+        fabricationDate: datetime       = self._fabricationState.fabricationDate
+
+        builtInProviders: TokenProviders = {
+            TOKEN_PROJECT_NAME:          lambda: projectDetails.name,
+            TOKEN_MODULE_NAME:           lambda: projectDetails.moduleName,
+            TOKEN_PYTHON_VERSION:        lambda: projectDetails.pythonVersion,
+            TOKEN_OWNER_NAME:            lambda: projectDetails.ownerName,
+            TOKEN_OWNER_EMAIL:           lambda: projectDetails.ownerEmail,
+            TOKEN_DESCRIPTION:           lambda: projectDetails.description,
+            TOKEN_KEYWORDS:              lambda: projectDetails.keywords,
+            TOKEN_SIMPLE_PYTHON_VERSION: lambda: f'{projectDetails.pythonVersion.major}.{projectDetails.pythonVersion.minor}',
+            TOKEN_PYTHON_INTERPRETER:    lambda: self._pythonInterpreter(),
+            TOKEN_DAY:                   lambda: fabricationDate.day,
+            TOKEN_MONTH_NAME_FULL:       lambda: fabricationDate.strftime("%B"),
+            TOKEN_YEAR:                  lambda: fabricationDate.year,
+        }
+        userProviders: TokenProviders = TokenContext.loadUserProviders(tokensFilePath=self._configurationTemplatePath.parent / TOKENS_FILE_NAME)
+        for name in userProviders.keys() & builtInProviders.keys():
+            self.logger.warning(f'Ignoring the user definition of the built-in token {name}')
+
+        return TokenContext(providers=userProviders | builtInProviders)
 
     def _computeSkeletonDirectories(self, projectPath: Path) -> SkeletonDirectories:
 
-        self._progressCallback('Computing project skeleton')
+        self._progressReporter.message('Computing project skeleton')
 
         moduleNamePath: Path = Path(f'{self._projectDetails.moduleName.lower()}')
 
@@ -191,11 +596,7 @@ class Fabricator:
         for varName, directoryPath in skeletonDictionary.items():
 
             if varName != 'projectPath':
-
-                directoryPath.mkdir(parents=True, exist_ok=True)
-                self._progressCallback(f'Created: {directoryPath}')
-
-        self.logger.info(f'Skeleton directories created')
+                self._plan.makeDirectory(directoryPath)
 
     def _createPythonPackageFiles(self):
 
@@ -206,70 +607,39 @@ class Fabricator:
                 pass
             else:
                 fullPath: Path = self._directories.projectPath / directoryPath / PACKAGE_DEFINITION_FILENAME
-                fullPath.touch()
-                self._progressCallback(f'Created: {fullPath}')
-
-        self.logger.info(f'Python package files created')
+                self._plan.touchFile(fullPath)
 
     def _createVersioningCapabilities(self):
         """
         Moves the _version.py.template file in place
         Updates the module __init__.py file to make the module version number available
         """
-        templateVersionFile: Path = self._configurationTemplatePath / VERSION_PY_TEMPLATE
-        destinationPath:     Path = self._directories.srcModulePath / VERSION_PY_TEMPLATE.stem
-
-        destinationPath.write_bytes(templateVersionFile.read_bytes())
-        self._progressCallback(f'Created: {destinationPath}')
+        destinationPath: Path = self._directories.srcModulePath / VERSION_PY_TEMPLATE.stem
 
-        updatedVersionVariable: str = VERSION_VARIABLE % self._projectDetails.name.lower()
-        self._progressCallback(f'Updated version variable: `{updatedVersionVariable}`')
+        self._copyTemplate(destinationPath, templateName=VERSION_PY_TEMPLATE.name)
 
-        moduleInitPath: Path = self._directories.srcModulePath / PACKAGE_DEFINITION_FILENAME
+        updatedVersionVariable: str  = VERSION_VARIABLE % self._projectDetails.name.lower()
+        moduleInitPath:         Path = self._directories.srcModulePath / PACKAGE_DEFINITION_FILENAME
 
-        moduleInitPath.write_text(updatedVersionVariable)
-        self._progressCallback(f'Updated {moduleInitPath}')
-        self.logger.info(f'Project versioning capability creation complete')
+        self._plan.writeFile(moduleInitPath, content=updatedVersionVariable.encode())
 
     def _createLoggingConfigurationFiles(self):
 
-        # Move the module template
-        #
-        templateLoggingConfigurationFile: Path = self._configurationTemplatePath / LOGGING_CONFIGURATION_TEMPLATE
-        destinationPath:                  Path = self._directories.srcModuleResources / Path(LOGGING_CONFIGURATION_TEMPLATE).stem
-
-        destinationPath.write_bytes(templateLoggingConfigurationFile.read_bytes())
-        self._progressCallback(f'Created: {destinationPath}')
+        destinationPath: Path = self._directories.srcModuleResources / Path(LOGGING_CONFIGURATION_TEMPLATE).stem
 
-        subDict = {
-            TOKEN_PROJECT_NAME: self._projectDetails.name.lower(),
-        }
-        # Make the substitutions
-        #
-        template: Template = Template(destinationPath.read_text())
-        result:   str      = template.substitute(subDict)
+        loggerTokens: TokenContext = self._tokenContext.scope({TOKEN_PROJECT_NAME: lambda: self._projectDetails.name.lower()})
 
-        # Write the result back
-        #
-        destinationPath.write_text(result)
+        self._renderFile(destinationPath, templateName=LOGGING_CONFIGURATION_TEMPLATE, tokens=loggerTokens)
 
-        # move the test module template
-        templateTestLoggingConfigurationFile: Path = self._configurationTemplatePath / TEST_LOGGING_CONFIGURATION_TEMPLATE
-        destinationTestPath:                  Path = self._directories.testsResourcesPath / Path(TEST_LOGGING_CONFIGURATION_TEMPLATE).stem
+        destinationTestPath: Path = self._directories.testsResourcesPath / Path(TEST_LOGGING_CONFIGURATION_TEMPLATE).stem
 
-        destinationTestPath.write_bytes(templateTestLoggingConfigurationFile.read_bytes())
-        self._progressCallback(f'Created: {destinationTestPath}')
-        self.logger.info(f'Logging configuration files created')
+        self._copyTemplate(destinationTestPath, templateName=TEST_LOGGING_CONFIGURATION_TEMPLATE)
 
     def _createCircleCIFile(self):
 
-        templateCIFile:  Path = self._configurationTemplatePath / CIRCLE_CI_TEMPLATE
         destinationPath: Path = self._directories.circleCIPath / Path(CIRCLE_CI_TEMPLATE).stem
 
-        destinationPath.write_bytes(templateCIFile.read_bytes())
-
-        self._progressCallback(f'Created {destinationPath}')
-        self.logger.info(f'Circle CI configuration created')
+        self._copyTemplate(destinationPath, templateName=CIRCLE_CI_TEMPLATE)
 
     def _createProjectRootNoSubstitutionFiles(self):
         """
@@ -278,130 +648,290 @@ class Fabricator:
 
         for templateFile in NO_TOKENS_SUBSTITUTION_TEMPLATES:
 
-            templatePath:    Path = self._configurationTemplatePath / templateFile
             destinationPath: Path = self._directories.projectPath / templateFile.stem
 
-            destinationPath.write_bytes(templatePath.read_bytes())
-
-            self._progressCallback(f'Created: {destinationPath}')
+            self._copyTemplate(destinationPath, templateName=templateFile.name)
 
     def _createProjectRootSubstitutionFiles(self):
         """
-
+        These templates see every token in the fabrication's token context
         """
-        pythonVersion:       SemanticVersion = self._projectDetails.pythonVersion
-        simplePythonVersion: str             = f'{pythonVersion.major}.{pythonVersion.minor}'
-        tokenDict = {
-            TOKEN_PYTHON_VERSION:        self._projectDetails.pythonVersion,
-            TOKEN_PROJECT_NAME:          self._projectDetails.name,
-            TOKEN_MODULE_NAME:           self._projectDetails.moduleName,
-            TOKEN_OWNER_NAME:            self._projectDetails.ownerName,
-            TOKEN_OWNER_EMAIL:           self._projectDetails.ownerEmail,
-            TOKEN_DESCRIPTION:           self._projectDetails.description,
-            TOKEN_KEYWORDS:              self._projectDetails.keywords,
-            TOKEN_SIMPLE_PYTHON_VERSION: simplePythonVersion,
-        }
         for templateFile in TOKEN_SUBSTITUTION_TEMPLATES:
-            templatePath:    Path = self._configurationTemplatePath / templateFile
             destinationPath: Path = self._directories.projectPath / templateFile.stem
-            #
-            # Copy the template
-            #
-            destinationPath.write_bytes(templatePath.read_bytes())
-            #
-            # Make the substitutions
-            #
-            template: Template = Template(destinationPath.read_text())
-            result:   str      = template.substitute(tokenDict)
-            #
-            # Write the result back
-            #
-            destinationPath.write_text(result)
-            self._progressCallback(f'Created {destinationPath}')
+
+            self._renderFile(destinationPath, templateName=templateFile.name, tokens=self._tokenContext)
 
     def _createApplicationSpecificPythonVersion(self):
         """
-        Manually create .python-version
+        Manually create .python-version;  Only for a version pyenv can resolve.  The virtual
+        environment script runs any other interpreter by its path
+        """
+        if ExternalCommands.isPyenvVersion(self._projectDetails.pythonVersion) is False:
+            self.logger.info(f'{self._projectDetails.pythonVersion} is not a pyenv version;  No {PYTHON_VERSION_FILENAME}')
+            return
+
+        pythonVersionPath: Path = self._directories.projectPath / Path(PYTHON_VERSION_FILENAME)
 
+        self._plan.writeFile(pythonVersionPath, content=str(self._projectDetails.pythonVersion).encode())
+
+    def _pythonInterpreter(self) -> str:
+        """
+        Returns:  What createVirtualEnv.sh runs;  The pyenv shim follows .python-version, any
+        other interpreter is run by its path
         """
+        pythonVersion: SemanticVersion = self._projectDetails.pythonVersion
+        if ExternalCommands.isPyenvVersion(pythonVersion) is True:
+            return 'python'
 
-        self.logger.info('Creating application specific version - Start')
+        interpreterPath: Path = InterpreterDiscovery.cacheFor().interpreterFor(pythonVersion)
+        if interpreterPath is NO_PATH:
+            return f'python{pythonVersion.major}.{pythonVersion.minor}'
 
-        pythonVersionPath: Path = self._directories.projectPath / Path(PYTHON_VERSION_FILENAME)
-        pythonVersionPath.write_text(str(self._projectDetails.pythonVersion))
+        return str(interpreterPath)
 
-        self._progressCallback(f'Application specific version set to {self._projectDetails.pythonVersion}')
+    def _startVirtualEnvironment(self, stagingPath: Path) -> Future:
+        """
+        The virtual environment is built in the staging directory, on its own thread, while the
+        project files are written;  It is published with them
 
-        self.logger.info(f'Creating application specific version - Complete')
+        Args:
+            stagingPath:  The staging directory
 
-    def _createProjectVirtualEnvironment(self):
+        Returns:  Completes with the environment's final path;  NO_PATH if none was requested
         """
-        Currently unused see issue - https://github.com/hasii2011/pyfabricate/issues/5 for details.
+        if self._createVirtualEnvironment is False:
+            noEnvironment: Future = Future()
+            noEnvironment.set_result(NO_PATH)
+            return noEnvironment
+
+        builder: VirtualEnvironmentBuilder = VirtualEnvironmentBuilder(pythonVersion=self._projectDetails.pythonVersion,
+                                                                       wheelhouse=Fabricator.wheelhouse(configurationTemplatePath=self._configurationTemplatePath),
+                                                                       pipPolicy=self._pipPolicy,
+                                                                       progressCallback=self._progressReporter.message,
+                                                                       cancelled=lambda: self._progressReporter.cancelled or self._virtualEnvironmentAbandoned.is_set())
+
+        environmentPath: Path = stagingPath / builder.environmentName
+        finalPath:       Path = self._projectPath / builder.environmentName
+
+        if self._goldenEnvironmentBytes == NO_GOLDEN_ENVIRONMENTS or self._pipPolicy == PipPolicy.NONE:
+            return Fabricator._virtualEnvironmentExecutor.submit(builder.create, environmentPath, finalPath)
+
+        goldenEnvironmentCache: GoldenEnvironmentCache = Fabricator.goldenEnvironmentCache(configurationTemplatePath=self._configurationTemplatePath,
+                                                                                           maximumBytes=self._goldenEnvironmentBytes)
+        return Fabricator._virtualEnvironmentExecutor.submit(goldenEnvironmentCache.cloneEnvironment,
+                                                             builder,
+                                                             self._templateSource.content(REQUIREMENTS_TEMPLATE),
+                                                             environmentPath,
+                                                             finalPath,
+                                                             self._outputPolicy)
+
+    def _finishVirtualEnvironment(self, virtualEnvironment: Future):
         """
-        try:
-            self._progressCallback(f'Attempting creation of virtual environment for {self._projectDetails.pythonVersion}')
-            virtualEnv: str = ExternalCommands.createVirtualEnvironment(version=self._projectDetails.pythonVersion, projectDirectory=self._projectPath)
-
-            self._progressCallback(f'Created virtual environment for {self._projectDetails.pythonVersion}')
-            self._progressCallback(f'{virtualEnv}')
-        except UnableToCreateVirtualEnvironment as e:
-            self.logger.error(f'Error in virtual environment creation')
-            self.logger.error(f'{e.stderr}')
-            dlg = MessageDialog(parent=None, message=f'{e.stderr}', caption='Venv Creation Error ', style=OK | CENTER)
-            dlg.ShowModal()
-            dlg.Destroy()
+        Waits for the environment;  A cancel still stops the fabrication within the poll interval
+        """
+        if self._createVirtualEnvironment is False:
+            return
+        with self._progressReporter.step(STEP_CREATE_VIRTUAL_ENVIRONMENT):
+            while virtualEnvironment.done() is False:
+                self._progressReporter.checkpoint()
+                wait([virtualEnvironment], timeout=VIRTUAL_ENVIRONMENT_POLL_INTERVAL)
+            try:
+                virtualEnvironment.result()
+            except VirtualEnvironmentCancelled:
+                raise FabricationCancelled()
+            except UnableToCreateVirtualEnvironment as e:
+                self.logger.error(f'{e.stderr}')
+                raise FabricationError(message=f'Venv Creation Error: {osLineSep.join(e.stderr)}')
+
+    def _abandonVirtualEnvironment(self, virtualEnvironment: Future):
+        """
+        The build is told to stop and any command it runs is killed;  It must be done writing
+        before its staging directory, the partial environment included, is removed
+        """
+        self._virtualEnvironmentAbandoned.set()
+        if virtualEnvironment.cancel() is False:
+            wait([virtualEnvironment])
 
     def _createVirtualEnvironmentScript(self):
         """
-        Modifies the createVirtualEnv.sh.template
-        Moves it to the project directory
-        Fixes the script permissions
+        Renders the createVirtualEnv.sh.template into the project directory
+        with its final, executable, permissions
+        """
+        destinationPath: Path = self._directories.projectPath / Path(VENV_CREATION_SCRIPT_TEMPLATE).stem
+
+        self._renderFile(destinationPath, templateName=VENV_CREATION_SCRIPT_TEMPLATE, tokens=self._tokenContext, mode=EXECUTION_PERMISSIONS)
 
+    def _copyTemplate(self, destinationPath: Path, templateName: str):
+        """
+        A customized template is copied from the configuration directory;  A bundled one is
+        written straight from the bundle
         """
-        templateScript:  Path = self._configurationTemplatePath / VENV_CREATION_SCRIPT_TEMPLATE
-        destinationPath: Path = self._directories.projectPath   / Path(VENV_CREATION_SCRIPT_TEMPLATE).stem
+        templatePath: Path = self._templateSource.customizedPath(templateName)
+        if templatePath is NO_PATH:
+            self._plan.writeFile(destinationPath, content=self._templateSource.content(templateName))
+        else:
+            self._plan.copyFile(destinationPath, sourcePath=templatePath)
 
-        destinationPath.write_bytes(templateScript.read_bytes())
-        self._progressCallback(f'Created {destinationPath}')
+        self._plan.useTemplate(templateName, contentHash=self._templateSource.contentHash(templateName))
 
-        today = datetime.now()
+    def _renderFile(self, destinationPath: Path, templateName: str, tokens: TokenDictionary, mode: int = DEFAULT_FILE_MODE):
 
-        tokenDict = {
-            TOKEN_PYTHON_VERSION:  self._projectDetails.pythonVersion,
-            TOKEN_DAY:             today.day,
-            TOKEN_MONTH_NAME_FULL: today.strftime("%B"),
-            TOKEN_YEAR:            today.year,
-        }
-        template: Template = Template(destinationPath.read_text())
-        result:   str = template.substitute(tokenDict)
-        #
-        # Write the result back
-        #
-        destinationPath.write_text(result)
+        templatePath: Path = self._templateSource.customizedPath(templateName)
+        if templatePath is NO_PATH:
+            templateBundle:   TemplateBundle   = self._templateSource.templateBundle
+            compiledTemplate: CompiledTemplate = self._templateCache.bundledTemplate(templateBundle=templateBundle, name=templateName)
+            templatePath = templateBundle.bundlePath / templateName
+        else:
+            compiledTemplate = self._templateCache.compiledTemplate(templatePath=templatePath)
 
-        self._progressCallback(f'Do not forget to execute: {destinationPath}')
+        self._plan.renderFile(destinationPath, templatePath=templatePath, compiledTemplate=compiledTemplate, tokens=tokens, mode=mode)
+        self._plan.useTemplate(templateName, contentHash=self._templateSource.contentHash(templateName))
 
-        destinationPath.chmod(mode=EXECUTION_PERMISSIONS)
-        self._progressCallback(f'Fixed permissions.')
+    @classmethod
+    def prepareTemplates(cls) -> Path:
+        """
+        Ensures the end user's template directory is in step with the packaged templates.  Only
+        the first call in a process synchronizes;  The packaged templates do not change while it runs
 
-    def _copyTemplatesToConfiguration(self, configurationTemplatePath: Path):
+        Returns:  The fully qualified path to the configuration templates directory
         """
-        Copy the templates to our configuration directory.  This allows end user/developer
-        customization, of a sort.
+        configurationTemplatePath: Path = cls.configurationTemplatePath()
+
+        if configurationTemplatePath not in cls._synchronizedPaths:
+            cls._copyTemplatesToConfiguration(configurationTemplatePath=configurationTemplatePath)
+            cls._synchronizedPaths.add(configurationTemplatePath)
 
-        Only copied if the template directory does not exist
+        return configurationTemplatePath
 
+    @classmethod
+    def configurationTemplatePath(cls) -> Path:
         """
-        self.logger.info(f'{configurationTemplatePath}')
+        Returns:  The fully qualified path to the configuration templates directory;  Nothing is synchronized
+        """
+        configurationLocator: ConfigurationLocator = ConfigurationLocator()
 
-        if configurationTemplatePath.exists() is False:
+        return configurationLocator.applicationPath(applicationName=APPLICATION_NAME) / TEMPLATES_DIRECTORY_NAME
 
-            configurationTemplatePath.mkdir(parents=True, exist_ok=True)
+    @classmethod
+    def templateCache(cls, configurationTemplatePath: Path) -> TemplateCache:
+        """
+        The compiled templates are cached alongside the configuration templates
 
-            resourcePath: Path = ResourceManager.computeResourcePath(resourcePath=TEMPLATE_RESOURCE_PATH, packageName=TEMPLATE_PACKAGE_NAME)
+        Args:
+            configurationTemplatePath:  As returned by `prepareTemplates`
+
+        Returns:  The process wide template cache
+        """
+        return TemplateCache.cacheFor(cacheDirectory=configurationTemplatePath.parent / CACHE_DIRECTORY_NAME)
+
+    @classmethod
+    def goldenEnvironmentCache(cls, configurationTemplatePath: Path, maximumBytes: int) -> GoldenEnvironmentCache:
+        """
+        The golden virtual environments are cached alongside the compiled templates
+
+        Args:
+            configurationTemplatePath:  As returned by `prepareTemplates`
+            maximumBytes:               The disk space the golden environments may use
+
+        Returns:  The process wide golden environment cache
+        """
+        cacheDirectory: Path = configurationTemplatePath.parent / CACHE_DIRECTORY_NAME / GOLDEN_ENVIRONMENTS_DIRECTORY_NAME
+
+        return GoldenEnvironmentCache.cacheFor(cacheDirectory=cacheDirectory, maximumBytes=maximumBytes)
+
+    @classmethod
+    def wheelhouse(cls, configurationTemplatePath: Path) -> Wheelhouse:
+        """
+        The wheelhouse is in the cache;  New wheels are dropped next to the configuration templates
+
+        Args:
+            configurationTemplatePath:  As returned by `prepareTemplates`
+
+        Returns:  The local wheelhouse
+        """
+        configurationPath: Path = configurationTemplatePath.parent
+
+        return Wheelhouse(wheelhousePath=configurationPath / CACHE_DIRECTORY_NAME / WHEELS_DIRECTORY_NAME, dropPath=configurationPath / DROP_WHEELS_DIRECTORY_NAME)
+
+    @classmethod
+    def templateSource(cls, configurationTemplatePath: Path) -> TemplateSource:
+        """
+
+        Args:
+            configurationTemplatePath:  As returned by `prepareTemplates`
+
+        Returns:  The customized templates backed by the packaged template bundle
+        """
+        return TemplateSource(configurationTemplatePath=configurationTemplatePath, templateBundle=cls.templateBundle())
 
-            for fqFileName in resourcePath.rglob('*.template'):
+    @classmethod
+    def templateBundle(cls) -> TemplateBundle:
+        """
+        Returns:  The packaged template bundle;  NO_TEMPLATE_BUNDLE if the installation does not have one
+        """
+        resourcePath: Path = ResourceManager.computeResourcePath(resourcePath=BUNDLE_RESOURCE_PATH, packageName=BUNDLE_PACKAGE_NAME)
+        bundlePath:   Path = resourcePath / BUNDLE_FILE_NAME
+        if bundlePath.is_file() is False:
+            return NO_TEMPLATE_BUNDLE
+
+        return TemplateBundle.bundleFor(bundlePath=bundlePath)
+
+    @classmethod
+    def customizeTemplate(cls, templateName: str) -> Path:
+        """
+        Copies a packaged template into the configuration directory;  From then on fabrication
+        uses that copy and updates never replace it
+
+        Args:
+            templateName:  The packaged template's name
+
+        Returns:  The template to change
+        """
+        packagedTemplates: PackagedTemplates = cls._packagedTemplates()
+        if templateName not in packagedTemplates:
+            raise FabricationError(message=f'No packaged template {templateName};  Choose one of {", ".join(sorted(packagedTemplates))}')
+
+        synchronizer: TemplateSynchronizer = TemplateSynchronizer(configurationTemplatePath=cls.configurationTemplatePath())
+
+        return synchronizer.customize(name=templateName, content=packagedTemplates[templateName])
+
+    @classmethod
+    def _copyTemplatesToConfiguration(cls, configurationTemplatePath: Path):
+        """
+        With a template bundle, fabrication reads the packaged templates from the bundle;  So, the
+        configuration directory only keeps the templates the user customized.  Without one, the
+        packaged templates are copied there;  Only new or changed ones.
+
+        Customized templates are never overwritten.  A failed synchronization is not fatal
+
+        """
+        cls.clsLogger.info(f'{configurationTemplatePath}')
+        try:
+            synchronizer: TemplateSynchronizer = TemplateSynchronizer(configurationTemplatePath=configurationTemplatePath)
+            synchronizer.synchronize(packagedTemplates=cls._packagedTemplates(),
+                                     releasedHashes=cls._releasedTemplateHashes(),
+                                     copyPackaged=cls.templateBundle() is NO_TEMPLATE_BUNDLE)
+        except OSError as e:
+            cls.clsLogger.warning(f'Templates not synchronized in {configurationTemplatePath}: {e}')
+
+    @classmethod
+    def _releasedTemplateHashes(cls) -> ReleasedHashes:
+        """
+        Shipped next to the template bundle
+        """
+        resourcePath: Path = ResourceManager.computeResourcePath(resourcePath=BUNDLE_RESOURCE_PATH, packageName=BUNDLE_PACKAGE_NAME)
+
+        return TemplateSynchronizer.releasedHashes(releasedHashesPath=resourcePath / RELEASED_HASHES_FILE_NAME)
+
+    @classmethod
+    def _packagedTemplates(cls) -> PackagedTemplates:
+        """
+        From the template bundle when the installation has one;  Otherwise, from the template resources
+        """
+        templateBundle: TemplateBundle = cls.templateBundle()
+        if templateBundle is NO_TEMPLATE_BUNDLE:
+            resourcePath: Path = ResourceManager.computeResourcePath(resourcePath=TEMPLATE_RESOURCE_PATH, packageName=TEMPLATE_PACKAGE_NAME)
 
-                destinationPath: Path = configurationTemplatePath / fqFileName.name
+            return {fqFileName.name: fqFileName.read_bytes() for fqFileName in sorted(resourcePath.rglob('*.template'))}
 
-                destinationPath.write_bytes(fqFileName.read_bytes())
+        return {name: templateBundle.read(name) for name in templateBundle.names}
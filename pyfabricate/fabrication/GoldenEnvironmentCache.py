@@ -0,0 +1,273 @@
+
+from typing import Dict
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+
+from hashlib import sha256
+
+from json import dumps as jsonDumps
+from json import loads as jsonLoads
+
+from os import link
+from os import readlink
+from os import rename
+from os import symlink
+from os import utime
+from os import walk
+
+from pathlib import Path
+
+from secrets import token_hex
+
+from shutil import copy2
+from shutil import copymode
+from shutil import rmtree
+
+from threading import RLock
+
+from pyfabricate.fabrication.OutputPolicy import OutputPolicy
+
+from pyfabricate.oswrapper.AdvisoryLock import AdvisoryLock
+from pyfabricate.oswrapper.ExternalCommands import UnableToCreateVirtualEnvironment
+from pyfabricate.oswrapper.FileCloner import FileCloner
+from pyfabricate.oswrapper.VirtualEnvironmentBuilder import VirtualEnvironmentBuilder
+
+MARKER_FILE_NAME:       str = '.pyfabricate-golden.json'
+REQUIREMENTS_FILE_NAME: str = 'requirements.txt'
+LOCK_FILE_NAME:         str = 'golden.lock'
+LOCK_SUFFIX:            str = '.lock'
+BUILDING_PREFIX:        str = '.building-'
+EVICTING_PREFIX:        str = '.evicting-'
+
+MEGABYTE: int = 1024 * 1024
+
+DEFAULT_MAXIMUM_BYTES: int = 2048 * MEGABYTE
+
+REQUIREMENTS_HASH_LENGTH: int = 16
+
+#
+# Files that hold the environment's absolute path;  Everything else is shared with the golden copy
+#
+RELOCATED_FILE_NAME:      str = 'pyvenv.cfg'
+RELOCATED_DIRECTORY_NAME: str = 'bin'
+
+
+@dataclass
+class GoldenEnvironment:
+    path:      Path
+    byteCount: int
+    lastUsed:  float
+
+
+class GoldenEnvironmentCache:
+    """
+    Fully populated virtual environments, one per interpreter version and requirements;  New
+    projects get a clone.  The files are cloned, hard linked or copied according to the output
+    policy;  Only the files that name the environment's location are rewritten.
+
+    Least recently used environments are evicted once the cache is over its size.  Each
+    environment has its own advisory lock;  It is held shared while cloning and exclusive while
+    building or evicting.  So, processes may share the cache and a long build only holds up the
+    fabrications that want the same environment.  The cache wide lock only serializes evictions;
+    An environment that is being cloned is not evicted
+    """
+    _caches: Dict[Path, 'GoldenEnvironmentCache'] = {}
+    _cachesLock: RLock = RLock()
+
+    @classmethod
+    def cacheFor(cls, cacheDirectory: Path, maximumBytes: int = DEFAULT_MAXIMUM_BYTES) -> 'GoldenEnvironmentCache':
+        """
+
+        Args:
+            cacheDirectory:  Typically, under the cache directory in the pyfabricate configuration directory
+            maximumBytes:    The disk space the golden environments may use
+
+        Returns:  The process wide cache for that directory
+        """
+        with cls._cachesLock:
+            if cacheDirectory not in cls._caches:
+                cls._caches[cacheDirectory] = GoldenEnvironmentCache(cacheDirectory=cacheDirectory)
+            goldenEnvironmentCache: GoldenEnvironmentCache = cls._caches[cacheDirectory]
+
+        goldenEnvironmentCache.maximumBytes = maximumBytes
+
+        return goldenEnvironmentCache
+
+    def __init__(self, cacheDirectory: Path, maximumBytes: int = DEFAULT_MAXIMUM_BYTES):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._cacheDirectory: Path = cacheDirectory
+        self._lockPath:       Path = cacheDirectory / LOCK_FILE_NAME
+
+        self.maximumBytes: int = maximumBytes
+
+    @classmethod
+    def requirementsHash(cls, requirements: bytes) -> str:
+        """
+        Comments, blank lines, order and spacing do not change the hash
+        """
+        lines: List[str] = []
+        for line in requirements.decode('utf-8').splitlines():
+            requirement: str = line.split('#', 1)[0].replace(' ', '')
+            if requirement != '':
+                lines.append(requirement)
+
+        return sha256('\n'.join(sorted(lines)).encode('utf-8')).hexdigest()[:REQUIREMENTS_HASH_LENGTH]
+
+    @property
+    def environments(self) -> List[GoldenEnvironment]:
+        """
+        Least recently used first
+        """
+        environments: List[GoldenEnvironment] = []
+        if self._cacheDirectory.exists() is False:
+            return environments
+
+        for markerPath in self._cacheDirectory.glob(f'*/{MARKER_FILE_NAME}'):
+            marker: Dict = jsonLoads(markerPath.read_text())
+            environments.append(GoldenEnvironment(path=markerPath.parent, byteCount=marker['byteCount'], lastUsed=markerPath.stat().st_mtime))
+
+        return sorted(environments, key=lambda environment: environment.lastUsed)
+
+    def cloneEnvironment(self, builder: VirtualEnvironmentBuilder, requirements: bytes, environmentPath: Path, finalPath: Path,
+                         outputPolicy: OutputPolicy = OutputPolicy.REFLINK_OR_HARDLINK) -> Path:
+        """
+        Builds the golden environment on first use;  If that fails, for example when offline, the
+        project gets a bare environment instead
+
+        Args:
+            builder:            Selects the interpreter and builds the golden environment
+            requirements:       What the golden environment has installed
+            environmentPath:    Where to put the clone
+            finalPath:          Where the clone will live
+            outputPolicy:       How to materialize the files
+
+        Returns:  The final path
+        """
+        goldenPath: Path = self._cacheDirectory / f'{builder.pythonVersion}-{GoldenEnvironmentCache.requirementsHash(requirements)}'
+
+        entryLockPath: Path = self._entryLockPath(goldenPath=goldenPath)
+        while True:
+            with AdvisoryLock.lock(lockPath=entryLockPath, exclusive=False):
+                if (goldenPath / MARKER_FILE_NAME).exists() is True:
+                    utime(goldenPath / MARKER_FILE_NAME)
+                    self._clone(goldenPath=goldenPath, environmentPath=environmentPath, finalPath=finalPath, outputPolicy=outputPolicy)
+                    return finalPath
+
+            built: bool = False
+            try:
+                with AdvisoryLock.lock(lockPath=entryLockPath, exclusive=True):
+                    if (goldenPath / MARKER_FILE_NAME).exists() is False:
+                        self._build(builder=builder, requirements=requirements, goldenPath=goldenPath)
+                        built = True
+            except UnableToCreateVirtualEnvironment as e:
+                self.logger.warning(f'No golden environment for {goldenPath.name}: {e.stderr}')
+                return builder.create(environmentPath=environmentPath, finalPath=finalPath)
+
+            if built is True:
+                self._evict(keep=goldenPath)
+
+    def _build(self, builder: VirtualEnvironmentBuilder, requirements: bytes, goldenPath: Path):
+        """
+        Built beside the cache entry and renamed into place, so an entry with a marker is complete
+        """
+        buildPath: Path = self._cacheDirectory / f'{BUILDING_PREFIX}{goldenPath.name}-{token_hex(4)}'
+        try:
+            builder.create(environmentPath=buildPath, finalPath=buildPath)
+
+            requirementsPath: Path = buildPath / REQUIREMENTS_FILE_NAME
+            requirementsPath.write_bytes(requirements)
+            builder.install(environmentPath=buildPath, requirementsPath=requirementsPath)
+            requirementsPath.unlink()
+
+            VirtualEnvironmentBuilder.relocate(environmentPath=buildPath, finalPath=goldenPath)
+
+            byteCount: int = sum(path.lstat().st_size for path in buildPath.rglob('*'))
+            (buildPath / MARKER_FILE_NAME).write_text(jsonDumps({'pythonVersion': str(builder.pythonVersion), 'byteCount': byteCount}))
+            rename(buildPath, goldenPath)
+        except BaseException:
+            rmtree(buildPath, ignore_errors=True)
+            raise
+
+        self.logger.info(f'Golden environment {goldenPath.name}: {byteCount / MEGABYTE:.1f} MB')
+
+    def _evict(self, keep: Path):
+        """
+        An environment is renamed out of the way before it is removed;  So, an interrupted
+        eviction never leaves a marked, incomplete environment.  Environments that are being
+        cloned are skipped
+        """
+        with AdvisoryLock.lock(lockPath=self._lockPath, exclusive=True):
+            environments: List[GoldenEnvironment] = self.environments
+            totalBytes:   int                     = sum(environment.byteCount for environment in environments)
+
+            for environment in environments:
+                if totalBytes <= self.maximumBytes:
+                    break
+                if environment.path == keep:
+                    continue
+                evictingPath: Path = self._cacheDirectory / f'{EVICTING_PREFIX}{environment.path.name}-{token_hex(4)}'
+                with AdvisoryLock.lock(lockPath=self._entryLockPath(goldenPath=environment.path), exclusive=True, blocking=False) as locked:
+                    if locked is False:
+                        continue
+                    self.logger.info(f'Evicting golden environment {environment.path.name}')
+                    rename(environment.path, evictingPath)
+
+                rmtree(evictingPath, ignore_errors=True)
+                totalBytes -= environment.byteCount
+
+    def _entryLockPath(self, goldenPath: Path) -> Path:
+        """
+        Beside the environment;  It outlives the environment, so every process always locks the same file
+        """
+        return goldenPath.with_name(f'{goldenPath.name}{LOCK_SUFFIX}')
+
+    def _clone(self, goldenPath: Path, environmentPath: Path, finalPath: Path, outputPolicy: OutputPolicy):
+
+        oldPath: bytes = str(goldenPath).encode()
+        newPath: bytes = str(finalPath).encode()
+
+        for directoryName, subdirectoryNames, fileNames in walk(goldenPath):
+            sourceDirectory:      Path = Path(directoryName)
+            destinationDirectory: Path = environmentPath / sourceDirectory.relative_to(goldenPath)
+            relocated:            bool = sourceDirectory == goldenPath / RELOCATED_DIRECTORY_NAME
+
+            destinationDirectory.mkdir(parents=True, exist_ok=True)
+            for name in list(subdirectoryNames):
+                if (sourceDirectory / name).is_symlink() is True:
+                    subdirectoryNames.remove(name)
+                    fileNames.append(name)
+
+            for fileName in fileNames:
+                sourcePath:      Path = sourceDirectory / fileName
+                destinationPath: Path = destinationDirectory / fileName
+                if sourcePath.is_symlink() is True:
+                    symlink(readlink(sourcePath), destinationPath)
+                elif fileName == MARKER_FILE_NAME:
+                    continue
+                elif relocated is True or (sourceDirectory == goldenPath and fileName == RELOCATED_FILE_NAME):
+                    content: bytes = sourcePath.read_bytes()
+                    destinationPath.write_bytes(content.replace(oldPath, newPath) if b'\0' not in content else content)
+                    copymode(sourcePath, destinationPath)
+                else:
+                    self._materialize(sourcePath=sourcePath, destinationPath=destinationPath, outputPolicy=outputPolicy)
+
+    def _materialize(self, sourcePath: Path, destinationPath: Path, outputPolicy: OutputPolicy):
+
+        if outputPolicy in (OutputPolicy.REFLINK, OutputPolicy.REFLINK_OR_HARDLINK):
+            if FileCloner.cloneFile(sourcePath=sourcePath, destinationPath=destinationPath) is True:
+                copymode(sourcePath, destinationPath)
+                return
+        if outputPolicy in (OutputPolicy.HARDLINK, OutputPolicy.REFLINK_OR_HARDLINK):
+            try:
+                link(sourcePath, destinationPath)
+                return
+            except OSError as e:
+                self.logger.debug(f'Cannot link {sourcePath}: {e}')
+
+        copy2(sourcePath, destinationPath)
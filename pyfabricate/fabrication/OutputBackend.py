@@ -0,0 +1,67 @@
+
+from logging import Logger
+from logging import getLogger
+
+from os import O_CREAT
+from os import O_TRUNC
+from os import O_WRONLY
+from os import close as osClose
+from os import fchmod as osFChmod
+from os import open as osOpen
+from os import write as osWrite
+
+from pathlib import Path
+
+from pyfabricate.fabrication.FabricationPlan import DEFAULT_FILE_MODE
+
+from pyfabricate.oswrapper.FileCopier import FileCopier
+
+
+class OutputBackend:
+    """
+    How plan executors put file content on disk.  This one writes every file in full;
+    Subclasses may materialize files differently.  Implementations must be thread safe,
+    the asynchronous executor calls them from a thread pool
+    """
+    def __init__(self):
+        self.logger: Logger = getLogger(__name__)
+
+    def writeFile(self, fullPath: Path, content: bytes, mode: int = DEFAULT_FILE_MODE):
+        """
+
+        Args:
+            fullPath:   Where
+            content:    What
+            mode:       The final file mode;  The default mode honors the umask
+        """
+        OutputBackend.writeBytes(fullPath=fullPath, content=content, mode=mode)
+
+    def copyFile(self, fullPath: Path, sourcePath: Path, mode: int = DEFAULT_FILE_MODE):
+        """
+        A verbatim copy of a template;  The content never passes through Python memory
+
+        Args:
+            fullPath:   Where
+            sourcePath: The template
+            mode:       The final file mode;  The default mode preserves the template's permissions
+        """
+        if mode == DEFAULT_FILE_MODE:
+            FileCopier.copyFile(sourcePath=sourcePath, destinationPath=fullPath)
+        else:
+            FileCopier.copyFile(sourcePath=sourcePath, destinationPath=fullPath, mode=mode)
+
+    @classmethod
+    def writeBytes(cls, fullPath: Path, content: bytes, mode: int = DEFAULT_FILE_MODE):
+        """
+        One open, as many writes as the kernel wants, an optional fchmod, one close
+        """
+        fd: int = osOpen(fullPath, O_WRONLY | O_CREAT | O_TRUNC, DEFAULT_FILE_MODE)
+        try:
+            view:    memoryview = memoryview(content)
+            written: int        = 0
+            while written < len(view):
+                written += osWrite(fd, view[written:])
+            if mode != DEFAULT_FILE_MODE:
+                osFChmod(fd, mode)
+        finally:
+            osClose(fd)
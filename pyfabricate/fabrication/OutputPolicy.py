@@ -0,0 +1,21 @@
+
+from enum import Enum
+
+
+class OutputPolicy(Enum):
+    """
+    How fabricated files are materialized
+
+    * PLAIN:               Every file is written in full;  No content store
+    * REFLINK:             Copy on write clones from the content store;  Plain writes where clones are not supported
+    * REFLINK_OR_HARDLINK: Clones;  Then hard links;  Then plain writes
+    * HARDLINK:            Hard links to the content store;  Then plain writes
+
+    Hard linked files share their inode with every other project;  Editing one in place
+    edits them all.  Clones do not have that problem.  The content store is in the cache
+    directory;  Projects on another volume are always written in full
+    """
+    PLAIN               = 'plain'
+    REFLINK             = 'reflink'
+    REFLINK_OR_HARDLINK = 'reflinkOrHardlink'
+    HARDLINK            = 'hardlink'
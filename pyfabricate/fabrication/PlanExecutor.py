@@ -0,0 +1,80 @@
+
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from pathlib import Path
+
+from time import perf_counter
+
+from pyfabricate.fabrication.FabricationPlan import CopyFile
+from pyfabricate.fabrication.FabricationPlan import FabricationPlan
+from pyfabricate.fabrication.FabricationPlan import MakeDirectory
+from pyfabricate.fabrication.FabricationPlan import PlanOperation
+from pyfabricate.fabrication.FabricationPlan import RenderFile
+from pyfabricate.fabrication.FabricationPlan import TouchFile
+from pyfabricate.fabrication.FabricationPlan import WriteFile
+from pyfabricate.fabrication.OutputBackend import OutputBackend
+from pyfabricate.fabrication.ProgressReporter import ProgressReporter
+
+NO_PATH:           Path          = cast(Path, None)
+NO_OUTPUT_BACKEND: OutputBackend = cast(OutputBackend, None)
+
+
+class PlanExecutor:
+    """
+    Executes a fabrication plan in a single pass.  Every file is written once by the
+    output backend and, when the plan asks for it, gets its final mode at the same time
+    """
+    def __init__(self, rootPath: Path, progressReporter: ProgressReporter, reportedRootPath: Path = NO_PATH, outputBackend: OutputBackend = NO_OUTPUT_BACKEND):
+        """
+
+        Args:
+            rootPath:           Where to materialize the plan's relative paths
+            progressReporter:   Somewhere to report our progress as we go along
+            reportedRootPath:   The root path to use in progress reports;  Defaults to `rootPath`
+            outputBackend:      How files are put on disk;  Defaults to writing every file in full
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._rootPath:         Path             = rootPath
+        self._progressReporter: ProgressReporter = progressReporter
+
+        if outputBackend is NO_OUTPUT_BACKEND:
+            self._outputBackend: OutputBackend = OutputBackend()
+        else:
+            self._outputBackend = outputBackend
+
+        if reportedRootPath is NO_PATH:
+            self._reportedRootPath: Path = rootPath
+        else:
+            self._reportedRootPath = reportedRootPath
+
+    def execute(self, plan: FabricationPlan):
+
+        for operation in plan.operations:
+            self.executeOperation(operation=operation)
+
+        self.logger.info(f'Plan executed: {len(plan.operations)} operations')
+
+    def executeOperation(self, operation: PlanOperation):
+
+        fullPath:  Path  = self._rootPath / operation.relativePath
+        startTime: float = perf_counter()
+
+        if isinstance(operation, MakeDirectory):
+            fullPath.mkdir(parents=True, exist_ok=True)
+            self._progressReporter.directoryCreated(path=self._reportedRootPath / operation.relativePath, startTime=startTime)
+            return
+
+        if isinstance(operation, TouchFile):
+            self._outputBackend.writeFile(fullPath=fullPath, content=b'', mode=operation.mode)
+        elif isinstance(operation, (WriteFile, RenderFile)):
+            self._outputBackend.writeFile(fullPath=fullPath, content=operation.content, mode=operation.mode)
+        elif isinstance(operation, CopyFile):
+            self._outputBackend.copyFile(fullPath=fullPath, sourcePath=operation.sourcePath, mode=operation.mode)
+        else:
+            assert False, f'Unknown plan operation: {operation}'
+
+        self._progressReporter.fileWritten(path=self._reportedRootPath / operation.relativePath, byteCount=operation.byteCount, startTime=startTime)
@@ -0,0 +1,261 @@
+
+from typing import Callable
+from typing import Iterator
+from typing import List
+from typing import NewType
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from contextlib import contextmanager
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from pathlib import Path
+
+from threading import Event
+from threading import RLock
+
+from time import perf_counter
+
+from pyfabricate.fabrication.FabricationCancelled import FabricationCancelled
+
+ProgressCallback = Callable[[str], None]
+
+NO_PATH: Path = cast(Path, None)
+
+#
+# Deliver every event as it happens;  Right for a person watching a console
+#
+IMMEDIATE_BATCH_SIZE: int = 1
+
+
+@dataclass
+class ProgressEvent:
+    """
+    Timestamps come from `time.perf_counter`;  They are monotonic but only comparable within a process
+    """
+    timestamp: float = field(default_factory=perf_counter)
+
+    def __str__(self) -> str:
+        return self.__class__.__name__
+
+
+@dataclass
+class StepStarted(ProgressEvent):
+    step: str = ''
+
+    def __str__(self) -> str:
+        return f'{self.step} ...'
+
+
+@dataclass
+class StepFinished(ProgressEvent):
+    step:    str   = ''
+    elapsed: float = 0.0
+
+    def __str__(self) -> str:
+        return f'{self.step} done in {self.elapsed * 1000:.1f} ms'
+
+
+@dataclass
+class FileWritten(ProgressEvent):
+    path:      Path  = NO_PATH
+    byteCount: int   = 0
+    duration:  float = 0.0
+    action:    str   = 'Created'
+
+    def __str__(self) -> str:
+        return f'{self.action}: {self.path}'
+
+
+@dataclass
+class DirectoryCreated(FileWritten):
+    """
+    Directories have no bytes
+    """
+
+
+@dataclass
+class MessageReported(ProgressEvent):
+    message: str = ''
+
+    def __str__(self) -> str:
+        return self.message
+
+
+@dataclass
+class WarningReported(MessageReported):
+
+    def __str__(self) -> str:
+        return f'Warning: {self.message}'
+
+
+@dataclass
+class ErrorReported(MessageReported):
+
+    def __str__(self) -> str:
+        return f'Error: {self.message}'
+
+
+ProgressEvents = NewType('ProgressEvents', List[ProgressEvent])
+
+EventSubscriber = Callable[[ProgressEvents], None]
+
+
+def progressEventsFactory() -> ProgressEvents:
+    return ProgressEvents([])
+
+
+@dataclass
+class ProgressSummary:
+    """
+    A subscriber that only aggregates;  Batch mode keeps one of these instead of a line per file
+    """
+    directoryCount: int   = 0
+    fileCount:      int   = 0
+    byteCount:      int   = 0
+    writeTime:      float = 0.0
+    warningCount:   int   = 0
+    errorCount:     int   = 0
+
+    def __call__(self, events: ProgressEvents):
+
+        for event in events:
+            if isinstance(event, DirectoryCreated):
+                self.directoryCount += 1
+                self.writeTime      += event.duration
+            elif isinstance(event, FileWritten):
+                self.fileCount += 1
+                self.byteCount += event.byteCount
+                self.writeTime += event.duration
+            elif isinstance(event, WarningReported):
+                self.warningCount += 1
+            elif isinstance(event, ErrorReported):
+                self.errorCount += 1
+
+
+class ProgressReporter:
+    """
+    Publishes typed progress events to any number of subscribers.  Events are buffered and
+    delivered in batches;  A batch goes out when it is full, when the oldest buffered event is
+    older than the batch interval, on `flush`, or right away for warnings and errors.  So high
+    rate producers do not pay a callback per file
+
+    The reporter is also where a run is cancelled;  `cancel` may be called from any thread and
+    the run stops at the next step boundary
+    """
+    def __init__(self, batchSize: int = IMMEDIATE_BATCH_SIZE, batchInterval: float = 0.0):
+        """
+
+        Args:
+            batchSize:      The number of events per delivery
+            batchInterval:  Seconds;  The longest an event waits for its batch to fill
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._batchSize:     int                   = max(1, batchSize)
+        self._batchInterval: float                 = batchInterval
+        self._subscribers:   List[EventSubscriber] = []
+        self._pending:       ProgressEvents        = progressEventsFactory()
+        self._cancelled:     Event                 = Event()
+        self._lock:          RLock                 = RLock()
+
+    @classmethod
+    def lineSubscriber(cls, progressCallback: ProgressCallback) -> EventSubscriber:
+        """
+        Adapts a consumer of text lines, like the application console
+        """
+        def subscriber(events: ProgressEvents):
+            for event in events:
+                progressCallback(str(event))
+
+        return subscriber
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def checkpoint(self):
+        """
+        Raises:  FabricationCancelled if the run was cancelled
+        """
+        if self._cancelled.is_set() is True:
+            raise FabricationCancelled()
+
+    def subscribe(self, subscriber: EventSubscriber):
+        self._subscribers.append(subscriber)
+
+    def publish(self, event: ProgressEvent):
+        """
+        Safe to call from several threads;  The virtual environment reports from its own
+        """
+        with self._lock:
+            self._pending.append(event)
+
+            if len(self._pending) >= self._batchSize or isinstance(event, (WarningReported, ErrorReported)):
+                self.flush()
+            elif event.timestamp - self._pending[0].timestamp >= self._batchInterval > 0.0:
+                self.flush()
+
+    def flush(self):
+
+        with self._lock:
+            if len(self._pending) == 0:
+                return
+
+            events: ProgressEvents = self._pending
+            self._pending = progressEventsFactory()
+            for subscriber in self._subscribers:
+                subscriber(events)
+
+    def message(self, message: str):
+        self.publish(MessageReported(message=message))
+
+    def warning(self, message: str):
+        self.publish(WarningReported(message=message))
+
+    def error(self, message: str):
+        self.publish(ErrorReported(message=message))
+
+    def fileWritten(self, path: Path, byteCount: int, startTime: float, action: str = 'Created'):
+        """
+        Args:
+            path:       What was written
+            byteCount:  How much
+            startTime:  The `perf_counter` value when the write started
+            action:     How the console describes the write
+        """
+        now: float = perf_counter()
+
+        self.publish(FileWritten(timestamp=now, path=path, byteCount=byteCount, duration=now - startTime, action=action))
+
+    def directoryCreated(self, path: Path, startTime: float):
+
+        now: float = perf_counter()
+
+        self.publish(DirectoryCreated(timestamp=now, path=path, duration=now - startTime))
+
+    @contextmanager
+    def step(self, step: str) -> Iterator[None]:
+        """
+        Brackets a fabrication step with started and finished events;  A step that raises
+        does not finish and a cancelled run does not start another
+        """
+        self.checkpoint()
+
+        started: StepStarted = StepStarted(step=step)
+
+        self.publish(started)
+        yield
+        finished: StepFinished = StepFinished(step=step)
+        finished.elapsed = finished.timestamp - started.timestamp
+        self.publish(finished)
+
+
+NO_PROGRESS_REPORTER: ProgressReporter = cast(ProgressReporter, None)
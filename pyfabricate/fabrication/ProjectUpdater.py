@@ -0,0 +1,223 @@
+
+from typing import List
+from typing import NewType
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from collections import Counter
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from enum import Enum
+
+from os import getpid as osGetPid
+from os import replace as osReplace
+
+from pathlib import Path
+
+from stat import S_IMODE
+
+from time import perf_counter
+
+from pyfabricate.fabrication.FabricationError import FabricationError
+from pyfabricate.fabrication.FabricationManifest import FabricationManifest
+from pyfabricate.fabrication.FabricationPlan import CopyFile
+from pyfabricate.fabrication.FabricationPlan import DEFAULT_FILE_MODE
+from pyfabricate.fabrication.FabricationPlan import FabricationPlan
+from pyfabricate.fabrication.FabricationPlan import FileOperation
+from pyfabricate.fabrication.FabricationPlan import MakeDirectory
+from pyfabricate.fabrication.FabricationPlan import outputContent
+from pyfabricate.fabrication.FabricationState import BaseContents
+from pyfabricate.fabrication.FabricationState import FabricationState
+from pyfabricate.fabrication.FabricationState import baseContentsFactory
+from pyfabricate.fabrication.OutputBackend import OutputBackend
+from pyfabricate.fabrication.ProgressReporter import ProgressReporter
+from pyfabricate.fabrication.ThreeWayMerge import MergeResult
+from pyfabricate.fabrication.ThreeWayMerge import ThreeWayMerge
+
+NO_CONTENT: bytes = cast(bytes, None)
+
+
+class UpdateAction(Enum):
+    """
+    * UNCHANGED:  The template output did not change or the project already has it
+    * CREATED:    A new template output
+    * UPDATED:    The user never touched the file;  It was replaced
+    * MERGED:     Both the user and the template changed the file;  The changes merged cleanly
+    * CONFLICT:   The merged file contains conflict markers
+    * SKIPPED:    The user deleted the file;  It stays deleted
+    """
+    UNCHANGED = 'unchanged'
+    CREATED   = 'created'
+    UPDATED   = 'updated'
+    MERGED    = 'merged'
+    CONFLICT  = 'conflict'
+    SKIPPED   = 'skipped'
+
+
+@dataclass
+class UpdateResult:
+    relativePath: Path
+    action:       UpdateAction
+
+
+UpdateResults = NewType('UpdateResults', List[UpdateResult])
+
+
+def updateResultsFactory() -> UpdateResults:
+    return UpdateResults([])
+
+
+@dataclass
+class UpdateReport:
+    projectPath: Path          = Path('')
+    results:     UpdateResults = field(default_factory=updateResultsFactory)
+
+    @property
+    def conflicts(self) -> UpdateResults:
+        return UpdateResults([result for result in self.results if result.action == UpdateAction.CONFLICT])
+
+    @property
+    def summary(self) -> str:
+        counts:  Counter = Counter(result.action for result in self.results)
+        actions: str     = ', '.join(f'{counts[action]} {action.value}' for action in UpdateAction)
+
+        return f'{self.projectPath}: {actions}'
+
+
+class ProjectUpdater:
+    """
+    Re-applies a freshly compiled plan to an existing project.  The base contents recorded at
+    the last fabrication are the common ancestor;  Files whose template output is unchanged are
+    not even read.  Every write goes to a temporary file that is renamed over the original so
+    that hard linked outputs in the content store are never modified in place.  The manifest
+    is rewritten;  Only files known to hold the template output keep stat data that vouches
+    for them
+    """
+    def __init__(self, projectPath: Path, progressReporter: ProgressReporter):
+        """
+
+        Args:
+            projectPath:        The existing project
+            progressReporter:   Somewhere to report our progress as we go along
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._projectPath:      Path             = projectPath
+        self._progressReporter: ProgressReporter = progressReporter
+
+        self._manifest:         FabricationManifest = FabricationManifest()
+        self._previousManifest: FabricationManifest = self._loadPreviousManifest()
+
+    def update(self, plan: FabricationPlan, fabricationState: FabricationState) -> UpdateReport:
+        """
+        Afterward, the fabrication state records the new template outputs as the base for the
+        next update
+
+        Args:
+            plan:               Compiled from the recorded project details
+            fabricationState:   As recorded in the project
+
+        Returns:  What happened to each file
+        """
+        report:          UpdateReport = UpdateReport(projectPath=self._projectPath)
+        newBaseContents: BaseContents = baseContentsFactory()
+
+        self._manifest.addTemplates(plan=plan)
+        for operation in plan.operations:
+            if isinstance(operation, MakeDirectory):
+                (self._projectPath / operation.relativePath).mkdir(parents=True, exist_ok=True)
+            elif isinstance(operation, FileOperation):
+                startTime:   float = perf_counter()
+                newContent:  bytes = outputContent(operation=operation)
+                baseContent: bytes = fabricationState.baseContents.get(operation.relativePath, NO_CONTENT)
+
+                action: UpdateAction = self._updateFile(operation=operation, baseContent=baseContent, newContent=newContent)
+
+                newBaseContents[operation.relativePath] = newContent
+                report.results.append(UpdateResult(relativePath=operation.relativePath, action=action))
+
+                if action != UpdateAction.UNCHANGED:
+                    self._progressReporter.fileWritten(path=self._projectPath / operation.relativePath,
+                                                       byteCount=len(newContent),
+                                                       startTime=startTime,
+                                                       action=action.value.capitalize())
+
+        fabricationState.baseContents = newBaseContents
+        fabricationState.save(projectPath=self._projectPath)
+        self._manifest.save(projectPath=self._projectPath)
+
+        self.logger.info(report.summary)
+
+        return report
+
+    def _updateFile(self, operation: FileOperation, baseContent: bytes, newContent: bytes) -> UpdateAction:
+
+        if newContent == baseContent:
+            self._manifest.carryOver(operation=operation, content=newContent, previous=self._previousManifest)
+            return UpdateAction.UNCHANGED
+
+        fullPath: Path = self._projectPath / operation.relativePath
+        try:
+            currentContent: bytes = fullPath.read_bytes()
+        except FileNotFoundError:
+            if baseContent is NO_CONTENT:
+                self._replaceFile(fullPath=fullPath, content=newContent, mode=self._fileMode(operation=operation))
+                self._manifest.addFile(operation=operation, content=newContent, fullPath=fullPath)
+                return UpdateAction.CREATED
+            self._manifest.addFile(operation=operation, content=newContent)
+            return UpdateAction.SKIPPED
+
+        if currentContent == newContent:
+            self._manifest.addFile(operation=operation, content=newContent, fullPath=fullPath)
+            return UpdateAction.UNCHANGED
+        if currentContent == baseContent:
+            self._replaceFile(fullPath=fullPath, content=newContent, mode=self._fileMode(operation=operation))
+            self._manifest.addFile(operation=operation, content=newContent, fullPath=fullPath)
+            return UpdateAction.UPDATED
+
+        self._manifest.addFile(operation=operation, content=newContent)
+
+        if baseContent is NO_CONTENT:
+            baseContent = b''
+        try:
+            mergeResult: MergeResult = ThreeWayMerge.merge(base=baseContent.decode(), ours=currentContent.decode(), theirs=newContent.decode())
+        except UnicodeDecodeError:
+            self.logger.warning(f'Cannot merge binary file {fullPath};  Left alone')
+            return UpdateAction.CONFLICT
+
+        self._replaceFile(fullPath=fullPath, content=mergeResult.text.encode(), mode=self._fileMode(operation=operation))
+        if mergeResult.conflicts > 0:
+            return UpdateAction.CONFLICT
+
+        return UpdateAction.MERGED
+
+    def _loadPreviousManifest(self) -> FabricationManifest:
+        """
+        Projects fabricated before manifests existed start with an empty one
+        """
+        try:
+            return FabricationManifest.load(projectPath=self._projectPath)
+        except FabricationError as fe:
+            self.logger.warning(fe.message)
+            return FabricationManifest()
+
+    def _fileMode(self, operation: FileOperation) -> int:
+        """
+        The same rule as OutputBackend.copyFile;  A verbatim copy with the default mode keeps
+        the template's permissions
+        """
+        if isinstance(operation, CopyFile) and operation.mode == DEFAULT_FILE_MODE:
+            return S_IMODE(operation.sourcePath.stat().st_mode)
+
+        return operation.mode
+
+    def _replaceFile(self, fullPath: Path, content: bytes, mode: int):
+
+        temporaryPath: Path = fullPath.with_name(f'.{fullPath.name}.{osGetPid()}')
+
+        OutputBackend.writeBytes(fullPath=temporaryPath, content=content, mode=mode)
+        osReplace(temporaryPath, fullPath)
@@ -0,0 +1,209 @@
+
+from typing import BinaryIO
+from typing import Dict
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+
+from hashlib import sha256
+
+from mmap import ACCESS_READ
+from mmap import mmap
+
+from os import replace as osReplace
+
+from pathlib import Path
+
+from struct import Struct
+
+from sys import argv
+
+from zipfile import ZIP_STORED
+from zipfile import BadZipFile
+from zipfile import ZipFile
+from zipfile import ZipInfo
+
+from pyfabricate.fabrication.FabricationError import FabricationError
+from pyfabricate.fabrication.TemplateSynchronizer import RELEASED_HASHES_FILE_NAME
+from pyfabricate.fabrication.TemplateSynchronizer import TemplateSynchronizer
+
+BUNDLE_FILE_NAME: str = 'templates.zip'
+TEMPLATE_SUFFIX:  str = '.template'
+
+#
+# The fixed part of a zip local file header:  signature, versions, flags, method, time,
+# date, crc, sizes, then the name and extra field lengths
+#
+LOCAL_HEADER:           Struct = Struct('<4s5H3L2H')
+LOCAL_HEADER_SIGNATURE: bytes  = b'PK\x03\x04'
+
+#
+# Every member gets the same timestamp so that rebuilding an unchanged bundle produces the same bytes
+#
+MEMBER_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+@dataclass
+class BundleEntry:
+    offset: int = 0
+    size:   int = 0
+    crc:    int = 0
+
+
+class TemplateBundle:
+    """
+    All the packaged templates in one uncompressed zip file.  The central directory is read
+    once when the bundle is opened;  After that any template is a slice of one memory mapped
+    file, so there is no directory walk and no per template open
+    """
+    _bundles: Dict[Path, 'TemplateBundle'] = {}
+
+    @classmethod
+    def bundleFor(cls, bundlePath: Path) -> 'TemplateBundle':
+        """
+
+        Args:
+            bundlePath:  Typically, the bundle in the package resources
+
+        Returns:  The process wide bundle for that path
+        """
+        if bundlePath not in cls._bundles:
+            cls._bundles[bundlePath] = TemplateBundle(bundlePath=bundlePath)
+
+        return cls._bundles[bundlePath]
+
+    def __init__(self, bundlePath: Path):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._bundlePath: Path = bundlePath
+
+        with bundlePath.open('rb') as bundleFile:
+            self._mmap: mmap = mmap(bundleFile.fileno(), 0, access=ACCESS_READ)
+
+        self._entries:       Dict[str, BundleEntry] = self._readIndex()
+        self._contentHashes: Dict[str, str]         = {}
+
+    @property
+    def bundlePath(self) -> Path:
+        return self._bundlePath
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._entries)
+
+    def contains(self, name: str) -> bool:
+        return name in self._entries
+
+    def read(self, name: str) -> bytes:
+        """
+        Args:
+            name:  The template file name
+
+        Returns:  The template content
+        """
+        entry: BundleEntry = self._entries[name]
+
+        return self._mmap[entry.offset:entry.offset + entry.size]
+
+    def contentHash(self, name: str) -> str:
+        """
+        Returns:  The SHA-256 of the template;  Computed once
+        """
+        if name not in self._contentHashes:
+            self._contentHashes[name] = sha256(self.read(name)).hexdigest()
+
+        return self._contentHashes[name]
+
+    def fingerprint(self, name: str) -> str:
+        """
+        Cheap;  Does not read the template
+
+        Returns:  The size and CRC from the central directory
+        """
+        entry: BundleEntry = self._entries[name]
+
+        return f'{entry.size}:{entry.crc:08x}'
+
+    def extractAll(self, directory: Path):
+        """
+        One write per template;  No reads beyond the memory map
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        for name in self._entries:
+            (directory / name).write_bytes(self.read(name))
+
+    @classmethod
+    def build(cls, templateDirectory: Path, bundlePath: Path):
+        """
+        Packs every template in the directory.  Members are stored, not compressed, so that
+        they can be read in place.  The hash of each template version the new bundle replaces is
+        recorded next to the bundle;  So, the synchronizer recognizes copies of earlier releases
+
+        Args:
+            templateDirectory:  Where the templates are
+            bundlePath:         The bundle to create or replace
+        """
+        previousHashes: Dict[str, str] = {}
+        if bundlePath.exists() is True:
+            with ZipFile(bundlePath) as previousBundle:
+                previousHashes = {name: sha256(previousBundle.read(name)).hexdigest() for name in previousBundle.namelist()}
+
+        contentHashes: Dict[str, str] = {}
+        temporaryPath: Path           = bundlePath.with_name(f'.{bundlePath.name}.tmp')
+        with ZipFile(temporaryPath, 'w', compression=ZIP_STORED) as bundle:
+            for templatePath in sorted(templateDirectory.glob(f'*{TEMPLATE_SUFFIX}')):
+                zipInfo: ZipInfo = ZipInfo(filename=templatePath.name, date_time=MEMBER_DATE_TIME)
+                zipInfo.external_attr = (templatePath.stat().st_mode & 0o777) << 16
+                content: bytes = templatePath.read_bytes()
+                bundle.writestr(zipInfo, content)
+                contentHashes[templatePath.name] = sha256(content).hexdigest()
+
+        osReplace(temporaryPath, bundlePath)
+
+        supersededHashes: Dict[str, str] = {name: contentHash for name, contentHash in previousHashes.items() if contentHashes.get(name) != contentHash}
+        if len(supersededHashes) > 0:
+            TemplateSynchronizer.recordReleasedHashes(releasedHashesPath=bundlePath.with_name(RELEASED_HASHES_FILE_NAME), supersededHashes=supersededHashes)
+
+    def _readIndex(self) -> Dict[str, BundleEntry]:
+        """
+        The central directory, read through the memory map, gives each member's local header
+        offset;  The data follows the local header and its variable length name and extra fields
+        """
+        entries: Dict[str, BundleEntry] = {}
+        try:
+            with ZipFile(cast(BinaryIO, self._mmap)) as bundle:
+                zipInfo: ZipInfo
+                for zipInfo in bundle.infolist():
+                    if zipInfo.compress_type != ZIP_STORED:
+                        raise FabricationError(message=f'{zipInfo.filename} is compressed in {self._bundlePath}')
+
+                    header = LOCAL_HEADER.unpack_from(self._mmap, zipInfo.header_offset)
+                    if header[0] != LOCAL_HEADER_SIGNATURE:
+                        raise FabricationError(message=f'Bad local header for {zipInfo.filename} in {self._bundlePath}')
+
+                    nameLength:  int = header[-2]
+                    extraLength: int = header[-1]
+                    offset:      int = zipInfo.header_offset + LOCAL_HEADER.size + nameLength + extraLength
+
+                    entries[zipInfo.filename] = BundleEntry(offset=offset, size=zipInfo.file_size, crc=zipInfo.CRC)
+        except BadZipFile as e:
+            raise FabricationError(message=f'Unreadable template bundle {self._bundlePath}: {e}')
+
+        self.logger.info(f'{len(entries)} templates in {self._bundlePath}')
+
+        return entries
+
+
+NO_TEMPLATE_BUNDLE: TemplateBundle = cast(TemplateBundle, None)
+
+#
+# Rebuild the packaged bundle after editing a template:
+#   python -m pyfabricate.fabrication.TemplateBundle pyfabricate/resources/templates pyfabricate/resources/templates.zip
+#
+if __name__ == '__main__':
+    TemplateBundle.build(templateDirectory=Path(argv[1]), bundlePath=Path(argv[2]))
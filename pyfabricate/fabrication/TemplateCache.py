@@ -0,0 +1,224 @@
+
+from typing import Any
+from typing import Dict
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+
+from hashlib import sha256
+
+from json import dumps as jsonDumps
+from json import loads as jsonLoads
+
+from os import getpid as osGetPid
+from os import replace as osReplace
+from os import stat_result
+
+from pathlib import Path
+
+from threading import RLock
+
+from pyfabricate.fabrication.CompiledTemplate import CompiledTemplate
+from pyfabricate.fabrication.TemplateBundle import TemplateBundle
+
+CACHE_FILE_NAME: str = 'compiledTemplates.json'
+CACHE_VERSION:   int = 2
+
+TEMPLATE_SUFFIX: str = '.template'
+
+
+@dataclass
+class CacheEntry:
+    """
+    The fingerprint of a template file plus its compiled form
+    """
+    size:             int              = 0
+    mtimeNs:          int              = 0
+    contentHash:      str              = ''
+    compiledTemplate: CompiledTemplate = cast(CompiledTemplate, None)
+
+
+class TemplateCache:
+    """
+    A persistent cache of compiled templates, keyed by template path, size, mtime and
+    content hash.
+
+    * When the size and mtime match, the template is not even read
+    * When they do not match but the content hash does (e.g. a `touch`), the template is read but not parsed
+    * Otherwise, the template is recompiled
+
+    There is one in-memory instance per cache directory per process;  Batch workers load
+    the on-disk cache once and then never parse again.  The instance may be shared by threads
+    """
+    _caches: Dict[Path, 'TemplateCache'] = {}
+
+    @classmethod
+    def cacheFor(cls, cacheDirectory: Path) -> 'TemplateCache':
+        """
+
+        Args:
+            cacheDirectory:  Typically, the cache directory under the pyfabricate configuration directory
+
+        Returns:  The process wide cache for that directory
+        """
+        if cacheDirectory not in cls._caches:
+            cls._caches[cacheDirectory] = TemplateCache(cacheDirectory=cacheDirectory)
+
+        return cls._caches[cacheDirectory]
+
+    def __init__(self, cacheDirectory: Path):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._cacheFilePath: Path                  = cacheDirectory / CACHE_FILE_NAME
+        self._entries:       Dict[str, CacheEntry] = self._load()
+        self._dirty:         bool                  = False
+        self._lock:          RLock                 = RLock()
+
+        self._hits:       int = 0
+        self._recompiles: int = 0
+
+    @property
+    def hits(self) -> int:
+        """
+        The number of lookups that did not parse the template
+        """
+        return self._hits
+
+    @property
+    def recompiles(self) -> int:
+        return self._recompiles
+
+    def compiledTemplate(self, templatePath: Path) -> CompiledTemplate:
+        with self._lock:
+            return self._compiledTemplate(templatePath=templatePath)
+
+    def _compiledTemplate(self, templatePath: Path) -> CompiledTemplate:
+
+        key:        str         = str(templatePath)
+        statResult: stat_result = templatePath.stat()
+        entry:      CacheEntry  = self._entries.get(key, cast(CacheEntry, None))
+
+        if entry is not None and entry.size == statResult.st_size and entry.mtimeNs == statResult.st_mtime_ns:
+            self._hits += 1
+            return entry.compiledTemplate
+
+        content:     bytes = templatePath.read_bytes()
+        contentHash: str   = sha256(content).hexdigest()
+
+        if entry is not None and entry.contentHash == contentHash:
+            self._hits += 1
+        else:
+            self._recompiles += 1
+            self.logger.info(f'Compiling {templatePath}')
+            entry = CacheEntry(contentHash=contentHash, compiledTemplate=CompiledTemplate.compile(content))
+
+        entry.size    = statResult.st_size
+        entry.mtimeNs = statResult.st_mtime_ns
+
+        self._entries[key] = entry
+        self._dirty        = True
+
+        return entry.compiledTemplate
+
+    def bundledTemplate(self, templateBundle: TemplateBundle, name: str) -> CompiledTemplate:
+        """
+        Bundled templates have no stat data of their own;  The content hash alone decides
+
+        Args:
+            templateBundle:  The packaged templates
+            name:            The template file name
+
+        Returns:  The compiled template
+        """
+        with self._lock:
+            return self._bundledTemplate(templateBundle=templateBundle, name=name)
+
+    def _bundledTemplate(self, templateBundle: TemplateBundle, name: str) -> CompiledTemplate:
+
+        key:         str        = str(templateBundle.bundlePath / name)
+        contentHash: str        = templateBundle.contentHash(name)
+        entry:       CacheEntry = self._entries.get(key, cast(CacheEntry, None))
+
+        if entry is not None and entry.contentHash == contentHash:
+            self._hits += 1
+            return entry.compiledTemplate
+
+        self._recompiles += 1
+        self.logger.info(f'Compiling {key}')
+        entry = CacheEntry(contentHash=contentHash, compiledTemplate=CompiledTemplate.compile(templateBundle.read(name)))
+
+        self._entries[key] = entry
+        self._dirty        = True
+
+        return entry.compiledTemplate
+
+    def warm(self, templateDirectory: Path):
+        """
+        Compile everything in the template directory and persist the result.  Templates that
+        are copied verbatim may not be valid `string.Template` text;  Those are skipped
+
+        Args:
+            templateDirectory:  Where the templates live
+        """
+        for templatePath in templateDirectory.glob(f'*{TEMPLATE_SUFFIX}'):
+            try:
+                self.compiledTemplate(templatePath=templatePath)
+            except ValueError as e:
+                self.logger.debug(f'Not a substitution template {templatePath}: {e}')
+
+        self.save()
+
+    def save(self):
+        """
+        Only writes when something changed.  Written to a process unique temporary file and then
+        renamed into place so that concurrent pyfabricate processes never see a partial cache
+        """
+        with self._lock:
+            if self._dirty is False:
+                return
+            self._save()
+
+    def _save(self):
+
+        document: Dict[str, Any] = {
+            'version': CACHE_VERSION,
+            'entries': {
+                key: {
+                    'size':             entry.size,
+                    'mtimeNs':          entry.mtimeNs,
+                    'contentHash':      entry.contentHash,
+                    'compiledTemplate': entry.compiledTemplate.toDictionary(),
+                }
+                for key, entry in self._entries.items()
+            }
+        }
+        self._cacheFilePath.parent.mkdir(parents=True, exist_ok=True)
+
+        temporaryPath: Path = self._cacheFilePath.with_name(f'{CACHE_FILE_NAME}.{osGetPid()}')
+        temporaryPath.write_text(jsonDumps(document))
+        osReplace(temporaryPath, self._cacheFilePath)
+
+        self._dirty = False
+
+    def _load(self) -> Dict[str, CacheEntry]:
+
+        entries: Dict[str, CacheEntry] = {}
+        try:
+            document: Dict[str, Any] = jsonLoads(self._cacheFilePath.read_text())
+            if document.get('version') == CACHE_VERSION:
+                for key, value in document['entries'].items():
+                    entries[key] = CacheEntry(size=value['size'],
+                                              mtimeNs=value['mtimeNs'],
+                                              contentHash=value['contentHash'],
+                                              compiledTemplate=CompiledTemplate.fromDictionary(value['compiledTemplate'])
+                                              )
+        except FileNotFoundError:
+            pass
+        except (ValueError, KeyError, TypeError) as e:
+            self.logger.warning(f'Ignoring unreadable template cache {self._cacheFilePath}: {e}')
+
+        return entries
@@ -0,0 +1,81 @@
+
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from hashlib import sha256
+
+from pathlib import Path
+
+from pyfabricate.fabrication.TemplateBundle import NO_TEMPLATE_BUNDLE
+from pyfabricate.fabrication.TemplateBundle import TemplateBundle
+
+NO_PATH: Path = cast(Path, None)
+
+
+class TemplateSource:
+    """
+    Resolves template names.  A template in the configuration directory wins, since that is
+    where users customize them;  Otherwise, it comes from the packaged template bundle.  So,
+    fabrication does not depend on the configuration directory copy
+    """
+    def __init__(self, configurationTemplatePath: Path, templateBundle: TemplateBundle = NO_TEMPLATE_BUNDLE):
+        """
+
+        Args:
+            configurationTemplatePath:  The user's template directory;  Need not exist
+            templateBundle:             The packaged templates, if there is a bundle
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._configurationTemplatePath: Path           = configurationTemplatePath
+        self._templateBundle:            TemplateBundle = templateBundle
+
+    @property
+    def templateBundle(self) -> TemplateBundle:
+        return self._templateBundle
+
+    def customizedPath(self, name: str) -> Path:
+        """
+        Returns:  The template in the configuration directory;  NO_PATH when the bundle supplies it
+        """
+        templatePath: Path = self._configurationTemplatePath / name
+        if templatePath.is_file() is True:
+            return templatePath
+        if self._templateBundle is NO_TEMPLATE_BUNDLE or self._templateBundle.contains(name) is False:
+            raise FileNotFoundError(f'No template {name} in {self._configurationTemplatePath} or the template bundle')
+
+        return NO_PATH
+
+    def displayPath(self, name: str) -> Path:
+        """
+        Returns:  Where the template comes from;  For bundled templates, a path inside the bundle
+        """
+        templatePath: Path = self.customizedPath(name)
+        if templatePath is NO_PATH:
+            return self._templateBundle.bundlePath / name
+
+        return templatePath
+
+    def content(self, name: str) -> bytes:
+
+        templatePath: Path = self.customizedPath(name)
+        if templatePath is NO_PATH:
+            return self._templateBundle.read(name)
+
+        return templatePath.read_bytes()
+
+    def contentHash(self, name: str) -> str:
+        """
+        Returns:  The SHA-256 of the template;  Empty when there is no such template
+        """
+        try:
+            templatePath: Path = self.customizedPath(name)
+        except FileNotFoundError:
+            return ''
+
+        if templatePath is NO_PATH:
+            return self._templateBundle.contentHash(name)
+
+        return sha256(templatePath.read_bytes()).hexdigest()
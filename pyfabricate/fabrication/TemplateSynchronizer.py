@@ -0,0 +1,295 @@
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from enum import Enum
+
+from hashlib import sha256
+
+from json import dumps as jsonDumps
+from json import loads as jsonLoads
+
+from os import getpid as osGetPid
+from os import replace as osReplace
+from os import stat_result
+
+from pathlib import Path
+
+from pyfabricate.oswrapper.AdvisoryLock import AdvisoryLock
+
+INDEX_FILE_NAME:           str = 'templateIndex.json'
+LOCK_FILE_NAME:            str = 'templates.lock'
+RELEASED_HASHES_FILE_NAME: str = 'releasedTemplates.json'
+INDEX_VERSION:             int = 1
+
+PackagedTemplates = Dict[str, bytes]
+#
+# The content hashes of the earlier versions of each packaged template
+#
+ReleasedHashes = Dict[str, List[str]]
+
+NO_RELEASED_HASHES: ReleasedHashes = cast(ReleasedHashes, None)
+
+
+class TemplateOrigin(Enum):
+    """
+    * PACKAGED:    The configuration directory holds the packaged template as pyfabricate copied it
+    * CUSTOMIZED:  The user changed the template, asked for a copy to change, or it predates the index and differs from every released version;  Never overwritten
+    """
+    PACKAGED   = 'packaged'
+    CUSTOMIZED = 'customized'
+
+
+@dataclass
+class IndexEntry:
+    """
+    The stat data vouches for the content hash;  When it matches, the template is not read
+    """
+    contentHash: str            = ''
+    origin:      TemplateOrigin = TemplateOrigin.PACKAGED
+    size:        int            = 0
+    mtimeNs:     int            = 0
+
+
+NO_INDEX_ENTRY: IndexEntry = cast(IndexEntry, None)
+
+
+@dataclass
+class SynchronizationReport:
+    added:      List[str] = field(default_factory=list)
+    updated:    List[str] = field(default_factory=list)
+    removed:    List[str] = field(default_factory=list)
+    customized: List[str] = field(default_factory=list)
+
+    @property
+    def changed(self) -> bool:
+        return len(self.added) > 0 or len(self.updated) > 0 or len(self.removed) > 0
+
+    def __str__(self) -> str:
+        return f'{len(self.added)} added, {len(self.updated)} updated, {len(self.removed)} removed, {len(self.customized)} customized'
+
+
+class TemplateSynchronizer:
+    """
+    Keeps the configuration template directory in step with the packaged templates.  An
+    index records each template's content hash and origin.  On every start:
+
+    * A template that is not in the directory is copied
+    * A template that pyfabricate copied and the user did not touch is replaced when the packaged one changed
+    * A template that predates the index is replaced when it is an earlier release of the packaged one
+    * A template the user customized is left alone
+
+    When fabrication reads the packaged templates from the template bundle, the directory only
+    holds customized templates;  Nothing is copied and the untouched copies are removed instead
+    of replaced.  `customize` copies a packaged template for the user to change
+
+    The whole synchronization holds an exclusive lock so that pyfabricate processes that start
+    together do not interleave;  Every file, including the index, is written to a temporary
+    file and renamed into place
+    """
+    def __init__(self, configurationTemplatePath: Path):
+        """
+
+        Args:
+            configurationTemplatePath:  The user's template directory;  Created if necessary
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._configurationTemplatePath: Path = configurationTemplatePath
+        self._indexPath:                 Path = configurationTemplatePath.parent / INDEX_FILE_NAME
+        self._lockPath:                  Path = configurationTemplatePath.parent / LOCK_FILE_NAME
+
+    @classmethod
+    def releasedHashes(cls, releasedHashesPath: Path) -> ReleasedHashes:
+        """
+        Args:
+            releasedHashesPath:  Typically, the file next to the packaged template bundle
+
+        Returns:  The hashes of the earlier releases of each template;  Empty if there is no file
+        """
+        try:
+            return dict(jsonLoads(releasedHashesPath.read_text())['templates'])
+        except FileNotFoundError:
+            return {}
+        except (ValueError, KeyError, TypeError) as e:
+            getLogger(__name__).warning(f'Ignoring unreadable released template hashes {releasedHashesPath}: {e}')
+            return {}
+
+    @classmethod
+    def recordReleasedHashes(cls, releasedHashesPath: Path, supersededHashes: Dict[str, str]):
+        """
+        Args:
+            releasedHashesPath:  The file to update
+            supersededHashes:    The hash of each template version that is no longer packaged
+        """
+        releasedHashes: ReleasedHashes = cls.releasedHashes(releasedHashesPath=releasedHashesPath)
+        for name, contentHash in supersededHashes.items():
+            if contentHash not in releasedHashes.setdefault(name, []):
+                releasedHashes[name].append(contentHash)
+
+        document: Dict[str, Any] = {'version': INDEX_VERSION, 'templates': dict(sorted(releasedHashes.items()))}
+
+        temporaryPath: Path = releasedHashesPath.with_name(f'.{RELEASED_HASHES_FILE_NAME}.{osGetPid()}')
+        temporaryPath.write_text(jsonDumps(document, indent=4))
+        osReplace(temporaryPath, releasedHashesPath)
+
+    def synchronize(self, packagedTemplates: PackagedTemplates, releasedHashes: ReleasedHashes = NO_RELEASED_HASHES, copyPackaged: bool = True) -> SynchronizationReport:
+        """
+
+        Args:
+            packagedTemplates:  The name and content of each packaged template
+            releasedHashes:     The hashes of the earlier releases of each packaged template
+            copyPackaged:       `False` when fabrication reads the packaged templates from elsewhere
+
+        Returns:  What was copied, removed and left alone
+        """
+        report: SynchronizationReport = SynchronizationReport()
+
+        if releasedHashes is NO_RELEASED_HASHES:
+            releasedHashes = {}
+
+        self._configurationTemplatePath.mkdir(parents=True, exist_ok=True)
+        with AdvisoryLock.lock(lockPath=self._lockPath, exclusive=True):
+            index:    Dict[str, IndexEntry] = self._loadIndex()
+            newIndex: Dict[str, IndexEntry] = {}
+            for name, content in packagedTemplates.items():
+                indexEntry: IndexEntry = self._synchronizeTemplate(name=name, content=content, previous=index.get(name, NO_INDEX_ENTRY),
+                                                                   releasedHashes=releasedHashes.get(name, []), copyPackaged=copyPackaged, report=report)
+                if indexEntry is not NO_INDEX_ENTRY:
+                    newIndex[name] = indexEntry
+
+            if newIndex != index:
+                self._saveIndex(index=newIndex)
+
+        if report.changed is True:
+            self.logger.info(f'Templates synchronized: {report}')
+
+        return report
+
+    def customize(self, name: str, content: bytes) -> Path:
+        """
+        An existing template is left as it is
+
+        Args:
+            name:     The packaged template's name
+            content:  The packaged template
+
+        Returns:  The template to change
+        """
+        templatePath: Path = self._configurationTemplatePath / name
+
+        self._configurationTemplatePath.mkdir(parents=True, exist_ok=True)
+        with AdvisoryLock.lock(lockPath=self._lockPath, exclusive=True):
+            index: Dict[str, IndexEntry] = self._loadIndex()
+            if templatePath.exists() is False:
+                self._write(templatePath=templatePath, content=content, contentHash=sha256(content).hexdigest())
+            index[name] = self._indexEntry(templatePath=templatePath, contentHash=sha256(templatePath.read_bytes()).hexdigest(), origin=TemplateOrigin.CUSTOMIZED)
+            self._saveIndex(index=index)
+
+        return templatePath
+
+    def _synchronizeTemplate(self, name: str, content: bytes, previous: IndexEntry, releasedHashes: List[str], copyPackaged: bool,
+                             report: SynchronizationReport) -> IndexEntry:
+        """
+        A template that is byte for byte an earlier release was copied by an earlier pyfabricate;
+        Whatever the index says, the user did not customize it
+
+        Returns:  The template's index entry;  NO_INDEX_ENTRY when the directory does not hold it
+        """
+
+        templatePath:  Path = self._configurationTemplatePath / name
+        packagedHash:  str  = sha256(content).hexdigest()
+        try:
+            currentHash: str = self._currentHash(templatePath=templatePath, previous=previous)
+        except FileNotFoundError:
+            if copyPackaged is False:
+                return NO_INDEX_ENTRY
+            report.added.append(name)
+            return self._write(templatePath=templatePath, content=content, contentHash=packagedHash)
+
+        if previous is not NO_INDEX_ENTRY and previous.origin == TemplateOrigin.CUSTOMIZED:
+            report.customized.append(name)
+            return self._indexEntry(templatePath=templatePath, contentHash=currentHash, origin=TemplateOrigin.CUSTOMIZED)
+
+        copiedUntouched: bool = previous is not NO_INDEX_ENTRY and previous.contentHash == currentHash
+        if copyPackaged is False and (currentHash == packagedHash or copiedUntouched is True or currentHash in releasedHashes):
+            report.removed.append(name)
+            templatePath.unlink()
+            return NO_INDEX_ENTRY
+
+        if currentHash == packagedHash:
+            return self._indexEntry(templatePath=templatePath, contentHash=currentHash, origin=TemplateOrigin.PACKAGED)
+
+        if copiedUntouched is True or currentHash in releasedHashes:
+            report.updated.append(name)
+            return self._write(templatePath=templatePath, content=content, contentHash=packagedHash)
+
+        report.customized.append(name)
+
+        return self._indexEntry(templatePath=templatePath, contentHash=currentHash, origin=TemplateOrigin.CUSTOMIZED)
+
+    def _currentHash(self, templatePath: Path, previous: IndexEntry) -> str:
+
+        statResult: stat_result = templatePath.stat()
+        if previous is not NO_INDEX_ENTRY and previous.size == statResult.st_size and previous.mtimeNs == statResult.st_mtime_ns:
+            return previous.contentHash
+
+        return sha256(templatePath.read_bytes()).hexdigest()
+
+    def _write(self, templatePath: Path, content: bytes, contentHash: str) -> IndexEntry:
+
+        temporaryPath: Path = templatePath.with_name(f'.{templatePath.name}.{osGetPid()}')
+        temporaryPath.write_bytes(content)
+        osReplace(temporaryPath, templatePath)
+
+        return self._indexEntry(templatePath=templatePath, contentHash=contentHash, origin=TemplateOrigin.PACKAGED)
+
+    def _indexEntry(self, templatePath: Path, contentHash: str, origin: TemplateOrigin) -> IndexEntry:
+
+        statResult: stat_result = templatePath.stat()
+
+        return IndexEntry(contentHash=contentHash, origin=origin, size=statResult.st_size, mtimeNs=statResult.st_mtime_ns)
+
+    def _loadIndex(self) -> Dict[str, IndexEntry]:
+
+        index: Dict[str, IndexEntry] = {}
+        try:
+            document: Dict[str, Any] = jsonLoads(self._indexPath.read_text())
+            if document.get('version') == INDEX_VERSION:
+                for name, value in document['templates'].items():
+                    index[name] = IndexEntry(contentHash=value['sha256'],
+                                             origin=TemplateOrigin(value['origin']),
+                                             size=value['size'],
+                                             mtimeNs=value['mtimeNs'])
+        except FileNotFoundError:
+            pass
+        except (ValueError, KeyError, TypeError) as e:
+            self.logger.warning(f'Ignoring unreadable template index {self._indexPath}: {e}')
+
+        return index
+
+    def _saveIndex(self, index: Dict[str, IndexEntry]):
+
+        document: Dict[str, Any] = {
+            'version': INDEX_VERSION,
+            'templates': {
+                name: {
+                    'sha256':  entry.contentHash,
+                    'origin':  entry.origin.value,
+                    'size':    entry.size,
+                    'mtimeNs': entry.mtimeNs,
+                }
+                for name, entry in sorted(index.items())
+            }
+        }
+        temporaryPath: Path = self._indexPath.with_name(f'{INDEX_FILE_NAME}.{osGetPid()}')
+        temporaryPath.write_text(jsonDumps(document, indent=4))
+        osReplace(temporaryPath, self._indexPath)
@@ -0,0 +1,130 @@
+
+from typing import List
+from typing import NewType
+from typing import Tuple
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from difflib import SequenceMatcher
+
+CONFLICT_START:     str = '<<<<<<< project\n'
+CONFLICT_SEPARATOR: str = '=======\n'
+CONFLICT_END:       str = '>>>>>>> template\n'
+
+Lines = NewType('Lines', List[str])
+
+#
+# base start, base end, ours start, theirs start;  The base range matches both sides
+#
+SyncRegion = Tuple[int, int, int, int]
+
+
+def linesFactory() -> Lines:
+    return Lines([])
+
+
+@dataclass
+class MergeResult:
+    lines:     Lines = field(default_factory=linesFactory)
+    conflicts: int   = 0
+
+    @property
+    def text(self) -> str:
+        return ''.join(self.lines)
+
+
+class ThreeWayMerge:
+    """
+    A line based diff3 style merge built on difflib.  Regions changed on only one side take
+    that side;  Regions changed identically on both sides are taken once;  Everything else is
+    a conflict and is marked the way git marks it
+    """
+    @classmethod
+    def merge(cls, base: str, ours: str, theirs: str) -> MergeResult:
+        """
+
+        Args:
+            base:    The common ancestor
+            ours:    The user's version
+            theirs:  The freshly rendered template
+
+        Returns:  The merged text and the number of conflicts
+        """
+        baseLines:   Lines = Lines(base.splitlines(keepends=True))
+        oursLines:   Lines = Lines(ours.splitlines(keepends=True))
+        theirsLines: Lines = Lines(theirs.splitlines(keepends=True))
+
+        result: MergeResult = MergeResult()
+
+        baseIndex:   int = 0
+        oursIndex:   int = 0
+        theirsIndex: int = 0
+        for baseStart, baseEnd, oursStart, theirsStart in cls._syncRegions(baseLines, oursLines, theirsLines):
+
+            baseChunk:   Lines = Lines(baseLines[baseIndex:baseStart])
+            oursChunk:   Lines = Lines(oursLines[oursIndex:oursStart])
+            theirsChunk: Lines = Lines(theirsLines[theirsIndex:theirsStart])
+
+            if oursChunk == theirsChunk:
+                result.lines.extend(oursChunk)
+            elif oursChunk == baseChunk:
+                result.lines.extend(theirsChunk)
+            elif theirsChunk == baseChunk:
+                result.lines.extend(oursChunk)
+            else:
+                result.conflicts += 1
+                result.lines.append(CONFLICT_START)
+                result.lines.extend(cls._terminated(oursChunk))
+                result.lines.append(CONFLICT_SEPARATOR)
+                result.lines.extend(cls._terminated(theirsChunk))
+                result.lines.append(CONFLICT_END)
+
+            matchLength: int = baseEnd - baseStart
+            result.lines.extend(baseLines[baseStart:baseEnd])
+
+            baseIndex   = baseEnd
+            oursIndex   = oursStart   + matchLength
+            theirsIndex = theirsStart + matchLength
+
+        return result
+
+    @classmethod
+    def _syncRegions(cls, baseLines: Lines, oursLines: Lines, theirsLines: Lines) -> List[SyncRegion]:
+        """
+        The base ranges that both sides left alone, intersected;  Always ends with an empty
+        region at the end of all three texts
+        """
+        oursMatches   = SequenceMatcher(None, baseLines, oursLines,   autojunk=False).get_matching_blocks()
+        theirsMatches = SequenceMatcher(None, baseLines, theirsLines, autojunk=False).get_matching_blocks()
+
+        regions:     List[SyncRegion] = []
+        oursIndex:   int              = 0
+        theirsIndex: int              = 0
+        while oursIndex < len(oursMatches) and theirsIndex < len(theirsMatches):
+
+            oursBase,   oursStart,   oursLength   = oursMatches[oursIndex]
+            theirsBase, theirsStart, theirsLength = theirsMatches[theirsIndex]
+
+            start: int = max(oursBase, theirsBase)
+            end:   int = min(oursBase + oursLength, theirsBase + theirsLength)
+            if start < end:
+                regions.append((start, end, oursStart + start - oursBase, theirsStart + start - theirsBase))
+
+            if oursBase + oursLength < theirsBase + theirsLength:
+                oursIndex += 1
+            else:
+                theirsIndex += 1
+
+        regions.append((len(baseLines), len(baseLines), len(oursLines), len(theirsLines)))
+
+        return regions
+
+    @classmethod
+    def _terminated(cls, lines: Lines) -> Lines:
+        """
+        Keeps the conflict markers on their own lines when a side lacks a final newline
+        """
+        if len(lines) > 0 and lines[-1].endswith('\n') is False:
+            return Lines(lines[:-1] + [f'{lines[-1]}\n'])
+        return lines
@@ -0,0 +1,177 @@
+
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import Mapping
+from typing import Set
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from json import loads as jsonLoads
+
+from os import environ as osEnvironment
+
+from pathlib import Path
+
+from subprocess import CalledProcessError
+from subprocess import run as subProcessRun
+
+from pyfabricate.fabrication.FabricationError import FabricationError
+
+TokenProvider  = Callable[[], object]
+TokenProviders = Dict[str, TokenProvider]
+
+#
+# Keys in the user token definitions file
+#
+PROVIDER_VALUE:       str = 'value'
+PROVIDER_ENVIRONMENT: str = 'environment'
+PROVIDER_GIT_CONFIG:  str = 'gitConfig'
+PROVIDER_DEFAULT:     str = 'default'
+
+GIT_COMMAND: str = 'git'
+
+NO_TOKEN_CONTEXT = cast('TokenContext', None)
+
+
+class TokenContext(Mapping[str, object]):
+    """
+    The token values for one fabrication.  Each token has a provider that is only called
+    when a template actually references the token;  The value is then remembered.  Scopes
+    override a few providers for some templates and share everything else, including the
+    remembered values, with their parent.
+
+    Iterating or sizing the context never calls a provider
+    """
+    def __init__(self, providers: TokenProviders, parent: 'TokenContext' = NO_TOKEN_CONTEXT):
+        """
+
+        Args:
+            providers:  Token name to provider
+            parent:     Where to look up tokens this context does not provide
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._providers: TokenProviders    = dict(providers)
+        self._parent:    TokenContext      = parent
+        self._values:    Dict[str, object] = {}
+
+    def __getitem__(self, name: str) -> object:
+
+        if name in self._values:
+            return self._values[name]
+
+        if name in self._providers:
+            value: object = self._providers[name]()
+            self._values[name] = value
+            self.logger.debug(f'Token {name} computed')
+            return value
+
+        if self._parent is not NO_TOKEN_CONTEXT:
+            return self._parent[name]
+
+        raise KeyError(name)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.names
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @property
+    def names(self) -> Set[str]:
+        names: Set[str] = set(self._providers)
+        if self._parent is not NO_TOKEN_CONTEXT:
+            names.update(self._parent.names)
+
+        return names
+
+    @property
+    def computedNames(self) -> Set[str]:
+        """
+        Returns:  The tokens whose providers have been called
+        """
+        names: Set[str] = set(self._values)
+        if self._parent is not NO_TOKEN_CONTEXT:
+            names.update(self._parent.computedNames)
+
+        return names
+
+    def addProvider(self, name: str, provider: TokenProvider):
+        """
+        Replaces any existing provider for the token and forgets its value
+        """
+        self._providers[name] = provider
+        self._values.pop(name, None)
+
+    def scope(self, providers: TokenProviders) -> 'TokenContext':
+        """
+
+        Args:
+            providers:  The providers to override
+
+        Returns:  A child context
+        """
+        return TokenContext(providers=providers, parent=self)
+
+    @classmethod
+    def environmentVariable(cls, variableName: str, default: str = '') -> TokenProvider:
+        return lambda: osEnvironment.get(variableName, default)
+
+    @classmethod
+    def gitConfiguration(cls, key: str, default: str = '') -> TokenProvider:
+        """
+        Only runs git if the token is used
+        """
+        def provider() -> object:
+            try:
+                return subProcessRun([GIT_COMMAND, 'config', '--get', key], capture_output=True, text=True, check=True).stdout.strip()
+            except (CalledProcessError, OSError):
+                return default
+
+        return provider
+
+    @classmethod
+    def loadUserProviders(cls, tokensFilePath: Path) -> TokenProviders:
+        """
+        The definitions file maps each token to one of:
+
+            {"value": "literal"}
+            {"environment": "VARIABLE_NAME", "default": "..."}
+            {"gitConfig": "user.name", "default": "..."}
+
+        Args:
+            tokensFilePath:  The user's token definitions;  Need not exist
+
+        Returns:  A provider for each definition
+        """
+        if tokensFilePath.exists() is False:
+            return {}
+        try:
+            definitions: Dict[str, Dict[str, Any]] = jsonLoads(tokensFilePath.read_text())
+
+            providers: TokenProviders = {}
+            for name, definition in definitions.items():
+                default: str = str(definition.get(PROVIDER_DEFAULT, ''))
+                if PROVIDER_VALUE in definition:
+                    providers[name] = cls._constant(value=definition[PROVIDER_VALUE])
+                elif PROVIDER_ENVIRONMENT in definition:
+                    providers[name] = cls.environmentVariable(variableName=definition[PROVIDER_ENVIRONMENT], default=default)
+                elif PROVIDER_GIT_CONFIG in definition:
+                    providers[name] = cls.gitConfiguration(key=definition[PROVIDER_GIT_CONFIG], default=default)
+                else:
+                    raise FabricationError(message=f'Token {name} has no provider in {tokensFilePath}')
+        except (ValueError, AttributeError) as e:
+            raise FabricationError(message=f'Unreadable token definitions {tokensFilePath}: {e}')
+
+        return providers
+
+    @classmethod
+    def _constant(cls, value: object) -> TokenProvider:
+        return lambda: value
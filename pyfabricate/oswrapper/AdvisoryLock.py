@@ -0,0 +1,45 @@
+
+from typing import Iterator
+
+from contextlib import contextmanager
+
+from pathlib import Path
+
+
+class AdvisoryLock:
+    """
+    Advisory file locks shared by the caches that processes share;  Where there is no fcntl,
+    there is no protection between processes
+    """
+    @classmethod
+    @contextmanager
+    def lock(cls, lockPath: Path, exclusive: bool, blocking: bool = True) -> Iterator[bool]:
+        """
+        Args:
+            lockPath:   The lock file;  Created with its directory if necessary
+            exclusive:  `True` for writers, `False` for readers
+            blocking:   `False` to give up at once when someone else holds the lock
+
+        Returns:  Whether the lock is held;  Always, when blocking
+        """
+        try:
+            from fcntl import LOCK_EX
+            from fcntl import LOCK_NB
+            from fcntl import LOCK_SH
+            from fcntl import LOCK_UN
+            from fcntl import flock
+        except ImportError:
+            yield True
+            return
+
+        lockPath.parent.mkdir(parents=True, exist_ok=True)
+        with lockPath.open('a') as lockFile:
+            try:
+                flock(lockFile.fileno(), (LOCK_EX if exclusive is True else LOCK_SH) | (0 if blocking is True else LOCK_NB))
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                flock(lockFile.fileno(), LOCK_UN)
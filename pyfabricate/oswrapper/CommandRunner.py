@@ -0,0 +1,217 @@
+
+from typing import Callable
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from asyncio import AbstractEventLoop
+from asyncio import Semaphore
+from asyncio import StreamReader
+from asyncio import Task
+from asyncio import TimeoutError as AsyncTimeoutError
+from asyncio import create_subprocess_exec
+from asyncio import create_task
+from asyncio import gather
+from asyncio import get_running_loop
+from asyncio import new_event_loop
+from asyncio import run_coroutine_threadsafe
+from asyncio import sleep as asyncioSleep
+from asyncio import wait_for
+from asyncio import wrap_future
+from asyncio.subprocess import PIPE
+from asyncio.subprocess import Process
+
+from enum import Enum
+
+from os import killpg
+
+from pathlib import Path
+
+from signal import SIGKILL
+
+from threading import RLock
+from threading import Thread
+from threading import current_thread
+
+from pyfabricate.oswrapper.CompletedData import CompletedData
+from pyfabricate.oswrapper.CompletedData import OutputLines
+from pyfabricate.oswrapper.CompletedData import StdErr
+from pyfabricate.oswrapper.CompletedData import StdOut
+
+DEFAULT_CONCURRENCY: int   = 4
+DEFAULT_TIMEOUT:     float = 60.0
+NO_TIMEOUT:          float = cast(float, None)
+
+LINE_LIMIT: int = 1024 * 1024
+
+CANCEL_POLL_INTERVAL: float = 0.1
+
+#
+# What a shell reports
+#
+COMMAND_NOT_FOUND_STATUS: int = 127
+NOT_EXECUTABLE_STATUS:    int = 126
+TIMED_OUT_STATUS:         int = -SIGKILL
+
+NO_PATH: Path = cast(Path, None)
+
+
+class OutputStream(Enum):
+    STDOUT = 'stdout'
+    STDERR = 'stderr'
+
+
+LineSubscriber = Callable[[OutputStream, str], None]
+Cancelled      = Callable[[], bool]
+
+
+class CommandRunner:
+    """
+    Runs commands without a shell;  The argument vector is executed directly.  Each command runs
+    in its own process group and is killed with the whole group when it runs past its timeout.
+    At most `concurrency` commands run at once.
+
+    Output lines go to the subscribers as they arrive, on the runner's event loop thread.  The
+    runner's loop is its own;  So, synchronous callers, other threads and other event loops all
+    share the one concurrency limit
+    """
+    _sharedRunner: 'CommandRunner | None' = None
+    _sharedLock:   RLock                  = RLock()
+
+    @classmethod
+    def sharedRunner(cls) -> 'CommandRunner':
+        """
+        Returns:  The process wide runner
+        """
+        with cls._sharedLock:
+            if cls._sharedRunner is None:
+                cls._sharedRunner = CommandRunner()
+
+            return cls._sharedRunner
+
+    def __init__(self, concurrency: int = DEFAULT_CONCURRENCY):
+        """
+
+        Args:
+            concurrency:  How many commands may run at once
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._subscribers: List[LineSubscriber] = []
+        self._loop:        AbstractEventLoop    = new_event_loop()
+        self._semaphore:   Semaphore            = Semaphore(concurrency)         # Bound to the runner's loop on first use
+        self._loopThread:  Thread               = Thread(target=self._loop.run_forever, name='CommandRunner', daemon=True)
+
+        self._loopThread.start()
+
+    def subscribe(self, subscriber: LineSubscriber):
+        """
+        Args:
+            subscriber:  Receives every output line of every command
+        """
+        self._subscribers.append(subscriber)
+
+    def unsubscribe(self, subscriber: LineSubscriber):
+        self._subscribers.remove(subscriber)
+
+    async def run(self, argv: List[str], timeout: float = DEFAULT_TIMEOUT, cwd: Path = NO_PATH, subscriber: LineSubscriber | None = None,
+                  cancelled: Cancelled | None = None) -> CompletedData:
+        """
+        Args:
+            argv:        The program and its arguments
+            timeout:     Seconds;  `NO_TIMEOUT` to wait as long as it takes
+            cwd:         Where to run it;  Defaults to the current directory
+            subscriber:  Receives this command's output lines in addition to the runner's subscribers
+            cancelled:   Polled while the command runs;  When it returns True the command is killed
+                         just as if it had timed out
+
+        Returns:  The status and every output line.  A program that cannot be started has the
+        shell's status for that;  A command that timed out or was cancelled has `TIMED_OUT_STATUS`
+        """
+        coroutine = self._run(argv=argv, timeout=timeout, cwd=cwd, subscriber=subscriber, cancelled=cancelled)
+        if get_running_loop() is self._loop:
+            return await coroutine
+
+        return await wrap_future(run_coroutine_threadsafe(coroutine, self._loop))
+
+    def runSync(self, argv: List[str], timeout: float = DEFAULT_TIMEOUT, cwd: Path = NO_PATH, subscriber: LineSubscriber | None = None,
+                cancelled: Cancelled | None = None) -> CompletedData:
+        """
+        `run` for callers without an event loop;  Blocks until the command is done.  Not for
+        subscribers, which run on the runner's loop
+        """
+        if current_thread() is self._loopThread:
+            raise RuntimeError('runSync would block the command runner;  Use run')
+
+        return run_coroutine_threadsafe(self._run(argv=argv, timeout=timeout, cwd=cwd, subscriber=subscriber, cancelled=cancelled), self._loop).result()
+
+    async def _run(self, argv: List[str], timeout: float, cwd: Path, subscriber: LineSubscriber | None, cancelled: Cancelled | None) -> CompletedData:
+
+        subscribers: List[LineSubscriber] = self._subscribers + ([] if subscriber is None else [subscriber])
+
+        async with self._semaphore:
+            try:
+                process: Process = await create_subprocess_exec(*argv, stdout=PIPE, stderr=PIPE, cwd=None if cwd is NO_PATH else cwd,
+                                                                start_new_session=True, limit=LINE_LIMIT)
+            except FileNotFoundError as e:
+                return CompletedData(status=COMMAND_NOT_FOUND_STATUS, stderr=StdErr([str(e)]))
+            except PermissionError as e:
+                return CompletedData(status=NOT_EXECUTABLE_STATUS, stderr=StdErr([str(e)]))
+
+            stdout:  StdOut      = StdOut([])
+            stderr:  StdErr      = StdErr([])
+            watcher: Task | None = None if cancelled is None else create_task(self._killWhenCancelled(process=process, cancelled=cancelled))
+            try:
+                await wait_for(gather(self._readLines(cast(StreamReader, process.stdout), OutputStream.STDOUT, stdout, subscribers),
+                                      self._readLines(cast(StreamReader, process.stderr), OutputStream.STDERR, stderr, subscribers),
+                                      process.wait()),
+                               timeout=timeout)
+            except AsyncTimeoutError:
+                self._killProcessGroup(process)
+                await process.wait()
+                stderr.append(f'Timed out after {timeout} seconds')
+                return CompletedData(status=TIMED_OUT_STATUS, stdout=stdout, stderr=stderr)
+            except BaseException:
+                self._killProcessGroup(process)
+                raise
+            finally:
+                if watcher is not None:
+                    watcher.cancel()
+
+        if cancelled is not None and cancelled() is True:
+            stderr.append('Cancelled')
+
+        return CompletedData(status=cast(int, process.returncode), stdout=stdout, stderr=stderr)
+
+    async def _readLines(self, reader: StreamReader, outputStream: OutputStream, lines: OutputLines, subscribers: List[LineSubscriber]):
+
+        while True:
+            line: bytes = await reader.readline()
+            if line == b'':
+                break
+            text: str = line.decode('utf-8', errors='replace').rstrip('\r\n')
+            lines.append(text)
+            for subscriber in subscribers:
+                try:
+                    subscriber(outputStream, text)
+                except Exception as e:
+                    self.logger.error(f'Line subscriber failed: {e}')
+
+    async def _killWhenCancelled(self, process: Process, cancelled: Cancelled):
+
+        while process.returncode is None:
+            if cancelled() is True:
+                self._killProcessGroup(process)
+                return
+            await asyncioSleep(CANCEL_POLL_INTERVAL)
+
+    def _killProcessGroup(self, process: Process):
+        """
+        The command and anything it started
+        """
+        try:
+            killpg(process.pid, SIGKILL)
+        except ProcessLookupError:
+            pass
@@ -6,25 +6,28 @@ from typing import NewType
 from logging import Logger
 from logging import getLogger
 
+from os import environ as osEnvironment
 from os import linesep as osLineSep
 from os import sep as osSep
 
 from pathlib import Path
 
-from subprocess import CompletedProcess
-
-from subprocess import run as subProcessRun
+from shlex import split as shlexSplit
 
 from platform import platform as osPlatform
 
 from semantic_version import Version as SemanticVersion
 
+from pyfabricate.oswrapper.CommandRunner import CommandRunner
+from pyfabricate.oswrapper.CommandRunner import DEFAULT_TIMEOUT
 from pyfabricate.oswrapper.CompletedData import CompletedData
 from pyfabricate.oswrapper.CompletedData import OutputLines
 from pyfabricate.oswrapper.CompletedData import StdErr
 from pyfabricate.oswrapper.CompletedData import StdOut
 
 from pyfabricate.Platform import NON_MAC_OS_PYENV_CMD
+from pyfabricate.Platform import PYENV_ROOT_DIRECTORY
+from pyfabricate.Platform import PYENV_ROOT_VARIABLE
 from pyfabricate.Platform import THE_GREAT_MAC_PLATFORM
 
 SemanticVersions = NewType('SemanticVersions', List[SemanticVersion])
@@ -45,6 +48,8 @@ DEFAULT_PYTHON_VERSION_INDICATOR: str = '*'     # Maybe be global or set as loca
 
 CmdOutput = NewType('CmdOutput', List[str])
 
+VIRTUAL_ENVIRONMENT_TIMEOUT: float = 9.0
+
 DEFAULT_PYTHON_VERSION_IDX: int = 1
 
 
@@ -82,7 +87,7 @@ class ExternalCommands:
     @classmethod
     def createVirtualEnvironment(cls, version: SemanticVersion, projectDirectory: Path) -> str | None:
         """
-        Special call for creating the virtual environment;  Will let the subProcessRun change to the project
+        Special call for creating the virtual environment;  Runs the pyenv shim in the project
         directory
 
         Since we are using pyenv to manage Python, this method assumes that .createApplicationSpecificPythonVersion()
@@ -114,25 +119,39 @@ class ExternalCommands:
             cmd:        str  = f'{homeDir}{osSep}{MAC_OS_PYTHON_SHIM} {subdirName}'
             ExternalCommands.clsLogger.info(f'{cmd=}')
 
-            completedProcess: CompletedProcess = subProcessRun([cmd],
-                                                               shell=True,
-                                                               cwd=projectDirectory,
-                                                               capture_output=True,
-                                                               text=True,
-                                                               check=False,
-                                                               timeout=9)
-            ExternalCommands.clsLogger.info(f'{completedProcess.returncode=}')
-            if completedProcess.returncode == 0:
+            completedData: CompletedData = CommandRunner.sharedRunner().runSync(argv=shlexSplit(cmd), timeout=VIRTUAL_ENVIRONMENT_TIMEOUT, cwd=projectDirectory)
+            ExternalCommands.clsLogger.info(f'{completedData.status=}')
+            if completedData.status == 0:
                 pass
             else:
-                raise UnableToCreateVirtualEnvironment(stderr=CmdOutput(completedProcess.stderr))
+                raise UnableToCreateVirtualEnvironment(stderr=CmdOutput(completedData.stderr))
         else:
             assert False, 'Oops, I only work on Mac OS'
 
         return subdirName
 
+    @classmethod
+    def pyenvRoot(cls) -> Path:
+        """
+        Returns:  Where pyenv keeps its versions;  `$PYENV_ROOT` or pyenv's default
+        """
+        return Path(osEnvironment.get(PYENV_ROOT_VARIABLE, Path.home() / PYENV_ROOT_DIRECTORY))
+
+    @classmethod
+    def isPyenvVersion(cls, pythonVersion: SemanticVersion) -> bool:
+        """
+        Args:
+            pythonVersion:  A version
+
+        Returns:  True if pyenv can resolve the version in a `.python-version` file
+        """
+        return (cls.pyenvRoot() / 'versions' / str(pythonVersion)).is_dir()
+
     @classmethod
     def getPythonVersions(cls) -> SemanticVersions:
+        """
+        Asks pyenv;  Runs pyenv every time, through the shared command runner.  See `PythonVersionCache`
+        """
 
         pythonVersions: SemanticVersions = SemanticVersions([])
 
@@ -170,28 +189,37 @@ class ExternalCommands:
         return ans
 
     @classmethod
-    def runCommand(cls, programToRun: str) -> int:
+    def runCommand(cls, programToRun: str, timeout: float = DEFAULT_TIMEOUT) -> int:
         """
+        A synchronous wrapper around the shared `CommandRunner`
 
         Args:
-            programToRun:  What must be executed
+            programToRun:  What must be executed;  Split into arguments the way a shell would, but not run by one
+            timeout:       Seconds before it and everything it started is killed
 
         Returns:  The status return of the executed program
         """
-        completedProcess: CompletedProcess = subProcessRun([programToRun], shell=True, capture_output=True, text=True, check=False)
-        return completedProcess.returncode
+        return CommandRunner.sharedRunner().runSync(argv=shlexSplit(programToRun), timeout=timeout).status
 
     @classmethod
-    def runCommandReturnOutput(cls, programToRun: str) -> CompletedData:
+    def runCommandReturnOutput(cls, programToRun: str, timeout: float = DEFAULT_TIMEOUT) -> CompletedData:
+        """
+        A synchronous wrapper around the shared `CommandRunner`
 
-        completedProcess: CompletedProcess = subProcessRun([programToRun], shell=True, capture_output=True, text=True, check=False)
-        if completedProcess.returncode == 0:
-            stdout: StdOut = ExternalCommands.toStdOut(completedProcess.stdout)
+        Args:
+            programToRun:  What must be executed;  Split into arguments the way a shell would, but not run by one
+            timeout:       Seconds before it and everything it started is killed
+
+        Returns:  The non empty lines of stdout on success, else of stderr
+        """
+        completedData: CompletedData = CommandRunner.sharedRunner().runSync(argv=shlexSplit(programToRun), timeout=timeout)
+        if completedData.status == 0:
+            stdout: StdOut = StdOut([line for line in completedData.stdout if len(line) > 0])
             return CompletedData(status=0, stdout=stdout)
 
         else:
-            stderr: StdErr = ExternalCommands.toStdErr(completedProcess.stderr)
-            return CompletedData(status=completedProcess.returncode, stderr=stderr)
+            stderr: StdErr = StdErr([line for line in completedData.stderr if len(line) > 0])
+            return CompletedData(status=completedData.status, stderr=stderr)
 
     @classmethod
     def toStdOut(cls, cmdOutput: str) -> StdOut:
@@ -0,0 +1,103 @@
+
+from typing import Set
+
+from logging import Logger
+from logging import getLogger
+
+from errno import EINVAL
+from errno import ENOSYS
+from errno import ENOTSUP
+from errno import ENOTTY
+from errno import EOPNOTSUPP
+from errno import EXDEV
+
+from os import O_CREAT
+from os import O_EXCL
+from os import O_RDONLY
+from os import O_WRONLY
+from os import close as osClose
+from os import fsencode as osFsEncode
+from os import open as osOpen
+from os import unlink as osUnlink
+
+from pathlib import Path
+
+from sys import platform as sysPlatform
+
+# Linux ioctl request number;  _IOW(0x94, 9, int)
+FICLONE: int = 0x40049409
+
+DEFAULT_CREATION_MODE: int = 0o666       # Subject to the umask
+
+DARWIN_PLATFORM: str = 'darwin'
+LINUX_PLATFORM:  str = 'linux'
+
+#
+# The file system or kernel cannot clone this file;  Callers should fall back
+#
+UNSUPPORTED_ERRORS: Set[int] = {EINVAL, ENOSYS, ENOTSUP, ENOTTY, EOPNOTSUPP, EXDEV}
+
+
+class FileCloner:
+    """
+    Copy on write file clones;  FICLONE on Linux (btrfs, XFS, bcachefs), clonefile(2) on
+    Mac OS X (APFS).  A clone shares the source's data blocks until either file is written
+    """
+    clsLogger: Logger = getLogger(__name__)
+
+    @classmethod
+    def cloneFile(cls, sourcePath: Path, destinationPath: Path) -> bool:
+        """
+        The destination must not exist
+
+        Args:
+            sourcePath:         The file to clone
+            destinationPath:    The new file
+
+        Returns:  `True` if the file was cloned;  `False` if this platform or file system does not support clones
+        """
+        try:
+            if sysPlatform.startswith(LINUX_PLATFORM):
+                cls._linuxClone(sourcePath=sourcePath, destinationPath=destinationPath)
+            elif sysPlatform == DARWIN_PLATFORM:
+                cls._darwinClone(sourcePath=sourcePath, destinationPath=destinationPath)
+            else:
+                return False
+        except OSError as e:
+            if e.errno in UNSUPPORTED_ERRORS:
+                cls.clsLogger.debug(f'Cannot clone {sourcePath}: {e}')
+                return False
+            raise
+
+        return True
+
+    @classmethod
+    def _linuxClone(cls, sourcePath: Path, destinationPath: Path):
+
+        from fcntl import ioctl
+
+        sourceFd: int = osOpen(sourcePath, O_RDONLY)
+        try:
+            destinationFd: int = osOpen(destinationPath, O_WRONLY | O_CREAT | O_EXCL, DEFAULT_CREATION_MODE)
+            try:
+                ioctl(destinationFd, FICLONE, sourceFd)
+            except OSError:
+                osClose(destinationFd)
+                osUnlink(destinationPath)
+                raise
+            osClose(destinationFd)
+        finally:
+            osClose(sourceFd)
+
+    @classmethod
+    def _darwinClone(cls, sourcePath: Path, destinationPath: Path):
+
+        from ctypes import CDLL
+        from ctypes import get_errno
+        from ctypes.util import find_library
+
+        libc = CDLL(find_library('c'), use_errno=True)
+
+        if libc.clonefile(osFsEncode(sourcePath), osFsEncode(destinationPath), 0) != 0:
+            errorNumber: int = get_errno()
+            raise OSError(errorNumber, f'clonefile failed for {sourcePath}')
@@ -0,0 +1,173 @@
+
+from typing import Set
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from errno import EBADF
+from errno import EINVAL
+from errno import ENOSYS
+from errno import ENOTSOCK
+from errno import ENOTSUP
+from errno import EOPNOTSUPP
+from errno import EPERM
+from errno import EXDEV
+
+from os import O_CREAT
+from os import O_RDONLY
+from os import O_TRUNC
+from os import O_WRONLY
+from os import SEEK_CUR
+from os import SEEK_SET
+from os import close as osClose
+from os import fchmod as osFChmod
+from os import fstat as osFStat
+from os import lseek as osLSeek
+from os import open as osOpen
+from os import read as osRead
+from os import stat_result
+from os import write as osWrite
+
+from pathlib import Path
+
+from stat import S_IMODE
+
+DEFAULT_CREATION_MODE: int = 0o666          # Subject to the umask
+PRESERVE_MODE:         int = cast(int, None)
+
+FALLBACK_BUFFER_SIZE: int = 1024 * 1024
+
+#
+# The kernel cannot do an in kernel copy between these two files;  Try the next primitive
+#
+ZERO_COPY_UNSUPPORTED_ERRORS: Set[int] = {EBADF, EINVAL, ENOSYS, ENOTSOCK, ENOTSUP, EOPNOTSUPP, EPERM, EXDEV}
+
+
+class FileCopier:
+    """
+    Copies files without pulling them into Python memory.  In order of preference:
+
+    * `os.copy_file_range` (Linux);  May even share blocks on file systems that support it
+    * `os.sendfile` (Linux allows a regular file as the destination)
+    * A bounded read/write loop
+
+    Each primitive is tried once per copy and we fall back cleanly when the kernel or
+    file system refuses
+    """
+    clsLogger: Logger = getLogger(__name__)
+
+    @classmethod
+    def copyFile(cls, sourcePath: Path, destinationPath: Path, mode: int = PRESERVE_MODE):
+        """
+
+        Args:
+            sourcePath:         The file to copy
+            destinationPath:    Created or truncated
+            mode:               The destination mode;  By default, the source's permissions are preserved
+        """
+        sourceFd: int = osOpen(sourcePath, O_RDONLY)
+        try:
+            sourceStat:    stat_result = osFStat(sourceFd)
+            destinationFd: int         = osOpen(destinationPath, O_WRONLY | O_CREAT | O_TRUNC, DEFAULT_CREATION_MODE)
+            try:
+                cls._copyContent(sourceFd=sourceFd, destinationFd=destinationFd, byteCount=sourceStat.st_size)
+                if mode is PRESERVE_MODE:
+                    osFChmod(destinationFd, S_IMODE(sourceStat.st_mode))
+                else:
+                    osFChmod(destinationFd, mode)
+            finally:
+                osClose(destinationFd)
+        finally:
+            osClose(sourceFd)
+
+    @classmethod
+    def _copyContent(cls, sourceFd: int, destinationFd: int, byteCount: int):
+        """
+        A primitive may fail part way;  Each fallback resumes from what actually reached the
+        destination
+        """
+        try:
+            if cls._copyFileRange(sourceFd=sourceFd, destinationFd=destinationFd, byteCount=byteCount) >= byteCount:
+                return
+        except OSError as e:
+            if e.errno not in ZERO_COPY_UNSUPPORTED_ERRORS:
+                raise
+            cls.clsLogger.debug(f'copy_file_range unavailable: {e}')
+
+        try:
+            if cls._sendFile(sourceFd=sourceFd, destinationFd=destinationFd, offset=cls._resume(sourceFd, destinationFd), byteCount=byteCount) >= byteCount:
+                return
+        except OSError as e:
+            if e.errno not in ZERO_COPY_UNSUPPORTED_ERRORS:
+                raise
+            cls.clsLogger.debug(f'sendfile unavailable: {e}')
+
+        cls._readWrite(sourceFd=sourceFd, destinationFd=destinationFd, offset=cls._resume(sourceFd, destinationFd))
+
+    @classmethod
+    def _resume(cls, sourceFd: int, destinationFd: int) -> int:
+        """
+        Every primitive writes at the destination's offset;  `sendfile` leaves the source's offset
+        alone and `copy_file_range` moves both.  So, the destination's offset is the truth and the
+        source is put there too
+
+        Returns:  The number of bytes already copied
+        """
+        copied: int = osLSeek(destinationFd, 0, SEEK_CUR)
+
+        osLSeek(sourceFd, copied, SEEK_SET)
+
+        return copied
+
+    @classmethod
+    def _copyFileRange(cls, sourceFd: int, destinationFd: int, byteCount: int) -> int:
+        """
+        Returns:  The number of bytes copied
+        """
+        try:
+            from os import copy_file_range
+        except ImportError:
+            raise OSError(ENOSYS, 'copy_file_range is only available on Linux')
+
+        copied: int = 0
+        while copied < byteCount:
+            sent: int = copy_file_range(sourceFd, destinationFd, byteCount - copied)
+            if sent == 0:
+                break
+            copied += sent
+
+        return copied
+
+    @classmethod
+    def _sendFile(cls, sourceFd: int, destinationFd: int, offset: int, byteCount: int) -> int:
+
+        try:
+            from os import sendfile
+        except ImportError:
+            raise OSError(ENOSYS, 'sendfile is not available on this platform')
+
+        copied: int = offset
+        while copied < byteCount:
+            sent: int = sendfile(destinationFd, sourceFd, copied, byteCount - copied)
+            if sent == 0:
+                break
+            copied += sent
+
+        return copied
+
+    @classmethod
+    def _readWrite(cls, sourceFd: int, destinationFd: int, offset: int):
+        """
+        The last resort;  Bounded buffers so large binary assets never sit in memory whole
+        """
+        osLSeek(sourceFd, offset, SEEK_SET)
+        osLSeek(destinationFd, offset, SEEK_SET)
+        while True:
+            buffer: bytes = osRead(sourceFd, FALLBACK_BUFFER_SIZE)
+            if len(buffer) == 0:
+                break
+            view:    memoryview = memoryview(buffer)
+            written: int        = 0
+            while written < len(view):
+                written += osWrite(destinationFd, view[written:])
@@ -0,0 +1,276 @@
+
+from typing import Dict
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from concurrent.futures import ThreadPoolExecutor
+
+from dataclasses import asdict
+from dataclasses import dataclass
+
+from json import JSONDecodeError
+from json import dumps as jsonDumps
+from json import loads as jsonLoads
+
+from os import X_OK
+from os import access
+from os import environ as osEnvironment
+from os import pathsep as osPathSep
+from os import replace as osReplace
+
+from pathlib import Path
+
+from re import Pattern
+from re import compile as regExCompile
+
+from secrets import token_hex
+
+from threading import RLock
+
+from semantic_version import Version as SemanticVersion
+
+from codeallybasic.ConfigurationLocator import ConfigurationLocator
+
+from pyfabricate.Constants import APPLICATION_NAME
+from pyfabricate.Constants import CACHE_DIRECTORY_NAME
+from pyfabricate.Constants import INTERPRETERS_FILE_NAME
+
+from pyfabricate.oswrapper.AdvisoryLock import AdvisoryLock
+from pyfabricate.oswrapper.CommandRunner import CommandRunner
+from pyfabricate.oswrapper.CompletedData import CompletedData
+from pyfabricate.oswrapper.ExternalCommands import ExternalCommands
+
+LOCK_SUFFIX: str = '.lock'
+
+#
+# python, python3, python3.12 and free threaded python3.13t;  Not python3-config
+#
+INTERPRETER_PATTERN: Pattern = regExCompile(r'^python(\d+(\.\d+)?t?)?$')
+
+SYSTEM_DIRECTORIES: List[Path] = [Path('/usr/bin'), Path('/usr/local/bin')]
+
+PYENV_SHIMS_DIRECTORY: str = 'shims'
+
+PROBE_WORKERS: int   = 8
+PROBE_TIMEOUT: float = 10.0
+
+CPYTHON: str = 'cpython'
+
+NO_PATH: Path = cast(Path, None)
+
+#
+# Runs in the candidate;  So, Python 2 syntax and options too
+#
+PROBE_SCRIPT: str = """
+import json, platform, sys, sysconfig
+try:
+    from importlib.util import find_spec
+    venv, ensurePip = find_spec('venv') is not None, find_spec('ensurepip') is not None
+except ImportError:
+    venv, ensurePip = False, False
+print(json.dumps({
+    'version':        '%d.%d.%d' % tuple(sys.version_info[:3]),
+    'implementation': platform.python_implementation().lower(),
+    'abiFlags':       getattr(sys, 'abiflags', ''),
+    'freeThreaded':   sysconfig.get_config_var('Py_GIL_DISABLED') == 1,
+    'supportsVenv':   venv,
+    'hasEnsurePip':   ensurePip,
+}))
+"""
+
+
+@dataclass
+class Interpreter:
+    path:           str
+    version:        str
+    implementation: str
+    abiFlags:       str
+    freeThreaded:   bool
+    supportsVenv:   bool
+    hasEnsurePip:   bool
+
+    @property
+    def semanticVersion(self) -> SemanticVersion:
+        return SemanticVersion(self.version)
+
+
+Interpreters = List[Interpreter]
+
+
+class InterpreterDiscovery:
+    """
+    Finds the Python interpreters on this machine;  pyenv's versions, the `PATH`, the system
+    directories and any configured directories.  Each interpreter is run once to ask what it is;
+    The candidates are probed in parallel.
+
+    Probe results are cached by the interpreter's real path, modification time and size in a
+    file shared by every pyfabricate process;  Later discoveries only list directories and stat
+    files
+    """
+    _caches:     Dict[Path, 'InterpreterDiscovery'] = {}
+    _cachesLock: RLock                              = RLock()
+
+    @classmethod
+    def cacheFor(cls, cachePath: Path = NO_PATH) -> 'InterpreterDiscovery':
+        """
+        Args:
+            cachePath:  The cache file;  Defaults to one in the configuration cache directory
+
+        Returns:  The process wide discovery for that file;  It also searches the configured
+        interpreter directories
+        """
+        from pyfabricate.Settings import Settings          # Settings needs the virtual environment builder, which needs this module
+
+        if cachePath is NO_PATH:
+            configurationLocator: ConfigurationLocator = ConfigurationLocator()
+            cachePath = configurationLocator.applicationPath(applicationName=APPLICATION_NAME) / CACHE_DIRECTORY_NAME / INTERPRETERS_FILE_NAME
+
+        with cls._cachesLock:
+            if cachePath not in cls._caches:
+                directories: List[Path] = [Path(directory) for directory in Settings().interpreterDirectories.split(osPathSep) if directory != '']
+                cls._caches[cachePath] = InterpreterDiscovery(cachePath=cachePath, directories=directories)
+
+            return cls._caches[cachePath]
+
+    def __init__(self, cachePath: Path, pyenvRoot: Path = NO_PATH, searchPath: str | None = None, directories: List[Path] | None = None):
+        """
+
+        Args:
+            cachePath:    The cache file
+            pyenvRoot:    Defaults to pyenv's root
+            searchPath:   Defaults to `$PATH`
+            directories:  More directories to search;  Defaults to none
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._cachePath:   Path       = cachePath
+        self._lockPath:    Path       = cachePath.with_name(f'{cachePath.name}{LOCK_SUFFIX}')
+        self._pyenvRoot:   Path       = pyenvRoot
+        self._searchPath:  str | None = searchPath
+        self._directories: List[Path] = [] if directories is None else directories
+
+    @property
+    def interpreters(self) -> Interpreters:
+        """
+        Every interpreter that answered its probe, oldest version first
+        """
+        candidates:   List[Path]           = self._candidates()
+        cachedProbes: Dict[str, Dict]      = self._readCache()
+        interpreters: Interpreters         = []
+        unprobed:     List[Path]           = []
+        fingerprints: Dict[str, List[int]] = {str(candidate): self._fingerprint(candidate) for candidate in candidates}
+
+        for candidate in candidates:
+            cachedProbe: Dict | None = cachedProbes.get(str(candidate))
+            if cachedProbe is not None and cachedProbe['fingerprint'] == fingerprints[str(candidate)]:
+                if cachedProbe['interpreter'] is not None:
+                    interpreters.append(Interpreter(**cachedProbe['interpreter']))
+            else:
+                unprobed.append(candidate)
+
+        if len(unprobed) > 0:
+            with ThreadPoolExecutor(max_workers=PROBE_WORKERS, thread_name_prefix='InterpreterProbe') as executor:
+                probes: List[Interpreter | None] = list(executor.map(self._probe, unprobed))
+
+            interpreters.extend(probe for probe in probes if probe is not None)
+            self._writeCache({str(candidate): {'fingerprint': fingerprints[str(candidate)], 'interpreter': None if probe is None else asdict(probe)}
+                              for candidate, probe in zip(unprobed, probes)})
+
+        return sorted(interpreters, key=lambda interpreter: (interpreter.semanticVersion, interpreter.freeThreaded, interpreter.path))
+
+    @property
+    def usableInterpreters(self) -> Interpreters:
+        """
+        The CPython interpreters that can create virtual environments;  What fabrication can use
+        """
+        return [interpreter for interpreter in self.interpreters if interpreter.implementation == CPYTHON and interpreter.supportsVenv is True]
+
+    def interpreterFor(self, pythonVersion: SemanticVersion) -> Path:
+        """
+        Args:
+            pythonVersion:  The wanted version
+
+        Returns:  A CPython interpreter of that version that can create virtual environments;
+        NO_PATH if there is none.  Builds with the interpreter lock are preferred
+        """
+        for interpreter in self.usableInterpreters:
+            if interpreter.semanticVersion == pythonVersion:
+                return Path(interpreter.path)
+
+        return NO_PATH
+
+    def _candidates(self) -> List[Path]:
+        """
+        Returns:  The real paths of the executables named like interpreters;  Each only once
+        """
+        pyenvRoot:   Path       = ExternalCommands.pyenvRoot() if self._pyenvRoot is NO_PATH else self._pyenvRoot
+        searchPath:  str        = osEnvironment.get('PATH', '') if self._searchPath is None else self._searchPath
+        directories: List[Path] = [versionPath / 'bin' for versionPath in sorted((pyenvRoot / 'versions').glob('*'))]
+
+        directories.extend(Path(directory) for directory in searchPath.split(osPathSep) if directory != '')
+        directories.extend(SYSTEM_DIRECTORIES)
+        directories.extend(self._directories)
+
+        candidates: Dict[Path, None] = {}
+        for directory in dict.fromkeys(directories):
+            if directory == pyenvRoot / PYENV_SHIMS_DIRECTORY:
+                continue                    # Shims start pyenv;  The versions are scanned directly
+            try:
+                entries: List[Path] = [entry for entry in directory.iterdir() if INTERPRETER_PATTERN.match(entry.name) is not None]
+            except OSError:
+                continue
+            for entry in entries:
+                realPath: Path = entry.resolve()
+                if realPath.is_file() is True and access(realPath, X_OK) is True:
+                    candidates[realPath] = None
+
+        return list(candidates)
+
+    def _probe(self, candidate: Path) -> Interpreter | None:
+        """
+        Through the shared command runner;  A candidate that hangs is killed with whatever it started
+        """
+        completedData: CompletedData = CommandRunner.sharedRunner().runSync(argv=[str(candidate), '-E', '-s', '-c', PROBE_SCRIPT], timeout=PROBE_TIMEOUT)
+        if completedData.status != 0:
+            self.logger.info(f'{candidate} is not usable: {" ".join(completedData.stderr).strip()}')
+            return None
+
+        try:
+            return Interpreter(path=str(candidate), **jsonLoads(''.join(completedData.stdout)))
+        except (JSONDecodeError, TypeError) as e:
+            self.logger.info(f'Unexpected probe output from {candidate}: {e}')
+            return None
+
+    def _fingerprint(self, candidate: Path) -> List[int]:
+
+        try:
+            return [candidate.stat().st_mtime_ns, candidate.stat().st_size]
+        except OSError:
+            return []
+
+    def _readCache(self) -> Dict[str, Dict]:
+
+        with AdvisoryLock.lock(lockPath=self._lockPath, exclusive=False):
+            try:
+                return jsonLoads(self._cachePath.read_text())
+            except (OSError, JSONDecodeError):
+                return {}
+
+    def _writeCache(self, probes: Dict[str, Dict]):
+        """
+        Merged with what other processes have written since;  Interpreters that are gone are dropped
+        """
+        with AdvisoryLock.lock(lockPath=self._lockPath, exclusive=True):
+            try:
+                cachedProbes: Dict[str, Dict] = jsonLoads(self._cachePath.read_text())
+            except (OSError, JSONDecodeError):
+                cachedProbes = {}
+
+            cachedProbes = {path: probe for path, probe in cachedProbes.items() if Path(path).exists() is True} | probes
+
+            temporaryPath: Path = self._cachePath.with_name(f'.{self._cachePath.name}.{token_hex(4)}')
+            temporaryPath.write_text(jsonDumps(cachedProbes))
+            osReplace(temporaryPath, self._cachePath)
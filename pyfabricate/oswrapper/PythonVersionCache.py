@@ -0,0 +1,186 @@
+
+from typing import Dict
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from json import JSONDecodeError
+from json import dumps as jsonDumps
+from json import loads as jsonLoads
+
+from os import environ as osEnvironment
+from os import replace as osReplace
+
+from pathlib import Path
+
+from secrets import token_hex
+
+from threading import RLock
+
+from semantic_version import Version as SemanticVersion
+
+from codeallybasic.ConfigurationLocator import ConfigurationLocator
+
+from pyfabricate.Constants import APPLICATION_NAME
+from pyfabricate.Constants import CACHE_DIRECTORY_NAME
+from pyfabricate.Constants import PYTHON_VERSIONS_FILE_NAME
+
+from pyfabricate.oswrapper.AdvisoryLock import AdvisoryLock
+from pyfabricate.oswrapper.ExternalCommands import ExternalCommands
+from pyfabricate.oswrapper.ExternalCommands import SemanticVersions
+
+LOCK_SUFFIX: str = '.lock'
+
+PYENV_VERSIONS_DIRECTORY: str = 'versions'
+PYENV_GLOBAL_VERSION:     str = 'version'
+PYTHON_VERSION_FILE:      str = '.python-version'
+PYENV_VERSION_VARIABLE:   str = 'PYENV_VERSION'
+
+NO_PATH:      Path = cast(Path, None)
+NOT_PRESENT:  int  = 0
+
+Fingerprint = Dict[str, int | str]
+
+
+class PythonVersionCache:
+    """
+    The installed Python versions, without starting pyenv.  The versions are the directory names
+    in `$PYENV_ROOT/versions`;  Only when that directory is not there is pyenv asked.
+
+    The list is kept in a cache file shared by every pyfabricate process.  It is valid while the
+    modification times of the versions directory, the global version file and every
+    `.python-version` pyenv would look at are unchanged
+    """
+    _caches:     Dict[Path, 'PythonVersionCache'] = {}
+    _cachesLock: RLock                            = RLock()
+
+    @classmethod
+    def cacheFor(cls, cachePath: Path = NO_PATH) -> 'PythonVersionCache':
+        """
+        Args:
+            cachePath:  The cache file;  Defaults to one in the configuration cache directory
+
+        Returns:  The process wide cache for that file
+        """
+        if cachePath is NO_PATH:
+            configurationLocator: ConfigurationLocator = ConfigurationLocator()
+            cachePath = configurationLocator.applicationPath(applicationName=APPLICATION_NAME) / CACHE_DIRECTORY_NAME / PYTHON_VERSIONS_FILE_NAME
+
+        with cls._cachesLock:
+            if cachePath not in cls._caches:
+                cls._caches[cachePath] = PythonVersionCache(cachePath=cachePath)
+
+            return cls._caches[cachePath]
+
+    def __init__(self, cachePath: Path, pyenvRoot: Path = NO_PATH, workingDirectory: Path = NO_PATH):
+        """
+
+        Args:
+            cachePath:          The cache file
+            pyenvRoot:          Defaults to pyenv's root
+            workingDirectory:   Where pyenv would start looking for `.python-version`;  Defaults to the current directory
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._cachePath:        Path = cachePath
+        self._lockPath:         Path = cachePath.with_name(f'{cachePath.name}{LOCK_SUFFIX}')
+        self._pyenvRoot:        Path = pyenvRoot
+        self._workingDirectory: Path = workingDirectory
+
+        self._lock:        RLock            = RLock()
+        self._fingerprint: Fingerprint      = {}
+        self._versions:    SemanticVersions = SemanticVersions([])
+
+    @property
+    def pythonVersions(self) -> SemanticVersions:
+        """
+        Raises:  UnableToRetrievePythonVersionsException when pyenv has to be asked and fails
+        """
+        with self._lock:
+            fingerprint: Fingerprint = self._currentFingerprint()
+            if fingerprint != self._fingerprint:
+                self._versions    = self._cachedVersions(fingerprint=fingerprint)
+                self._fingerprint = fingerprint
+
+            return SemanticVersions(list(self._versions))
+
+    def _cachedVersions(self, fingerprint: Fingerprint) -> SemanticVersions:
+
+        with AdvisoryLock.lock(lockPath=self._lockPath, exclusive=False):
+            versions: SemanticVersions | None = self._readCache(fingerprint=fingerprint)
+        if versions is not None:
+            return versions
+
+        with AdvisoryLock.lock(lockPath=self._lockPath, exclusive=True):
+            versions = self._readCache(fingerprint=fingerprint)
+            if versions is None:
+                versions = self._discoverVersions()
+                self._writeCache(fingerprint=fingerprint, versions=versions)
+
+        return versions
+
+    def _discoverVersions(self) -> SemanticVersions:
+        """
+        Each directory in the versions directory is an installed version;  Names that are not
+        versions, like virtual environments or aliases, are not listed
+        """
+        versionsPath: Path = self._pyenvRootPath() / PYENV_VERSIONS_DIRECTORY
+        if versionsPath.is_dir() is False:
+            self.logger.info(f'No {versionsPath};  Asking pyenv')
+            return ExternalCommands.getPythonVersions()
+
+        versions: SemanticVersions = SemanticVersions([])
+        for versionPath in versionsPath.iterdir():
+            try:
+                version: SemanticVersion = SemanticVersion(versionPath.name)
+            except ValueError:
+                self.logger.debug(f'Not a Python version: {versionPath.name}')
+                continue
+            if versionPath.is_dir() is True:
+                versions.append(version)
+
+        return SemanticVersions(sorted(versions))
+
+    def _readCache(self, fingerprint: Fingerprint) -> SemanticVersions | None:
+
+        try:
+            cached: Dict = jsonLoads(self._cachePath.read_text())
+        except (OSError, JSONDecodeError):
+            return None
+
+        if cached.get('fingerprint') != fingerprint:
+            return None
+
+        return SemanticVersions([SemanticVersion(version) for version in cached['versions']])
+
+    def _writeCache(self, fingerprint: Fingerprint, versions: SemanticVersions):
+        """
+        Written beside the cache file and renamed over it
+        """
+        temporaryPath: Path = self._cachePath.with_name(f'.{self._cachePath.name}.{token_hex(4)}')
+        temporaryPath.write_text(jsonDumps({'fingerprint': fingerprint, 'versions': [str(version) for version in versions]}))
+        osReplace(temporaryPath, self._cachePath)
+
+    def _currentFingerprint(self) -> Fingerprint:
+        """
+        A `stat` per path;  Much cheaper than a shell
+        """
+        pyenvRoot:        Path       = self._pyenvRootPath()
+        workingDirectory: Path       = Path.cwd() if self._workingDirectory is NO_PATH else self._workingDirectory
+        paths:            List[Path] = [pyenvRoot / PYENV_VERSIONS_DIRECTORY, pyenvRoot / PYENV_GLOBAL_VERSION]
+
+        paths.extend(directory / PYTHON_VERSION_FILE for directory in [workingDirectory, *workingDirectory.parents])
+
+        fingerprint: Fingerprint = {PYENV_VERSION_VARIABLE: osEnvironment.get(PYENV_VERSION_VARIABLE, '')}
+        for path in paths:
+            try:
+                fingerprint[str(path)] = path.stat().st_mtime_ns
+            except OSError:
+                fingerprint[str(path)] = NOT_PRESENT
+
+        return fingerprint
+
+    def _pyenvRootPath(self) -> Path:
+        return ExternalCommands.pyenvRoot() if self._pyenvRoot is NO_PATH else self._pyenvRoot
@@ -0,0 +1,274 @@
+
+from typing import Callable
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from enum import Enum
+
+from pathlib import Path
+
+from shutil import copy2
+
+from sys import executable as sysExecutable
+from sys import version_info
+
+from time import perf_counter
+
+from venv import EnvBuilder
+
+import ensurepip
+
+from semantic_version import Version as SemanticVersion
+
+from pyfabricate.oswrapper.CommandRunner import CommandRunner
+from pyfabricate.oswrapper.CommandRunner import NO_TIMEOUT
+from pyfabricate.oswrapper.CompletedData import CompletedData
+from pyfabricate.oswrapper.ExternalCommands import CmdOutput
+from pyfabricate.oswrapper.ExternalCommands import ExternalCommands
+from pyfabricate.oswrapper.ExternalCommands import UnableToCreateVirtualEnvironment
+from pyfabricate.oswrapper.ExternalCommands import VIRTUAL_ENVIRONMENT_MARKER
+from pyfabricate.oswrapper.InterpreterDiscovery import InterpreterDiscovery
+from pyfabricate.oswrapper.WheelInstaller import UnableToInstallWheel
+from pyfabricate.oswrapper.WheelInstaller import WheelInstaller
+from pyfabricate.oswrapper.Wheelhouse import UnableToResolveRequirements
+from pyfabricate.oswrapper.Wheelhouse import WheelFile
+from pyfabricate.oswrapper.Wheelhouse import Wheelhouse
+
+VirtualEnvironmentCallback = Callable[[str], None]
+#
+# Asked while the environment is built;  True stops the build
+#
+CancelCheck = Callable[[], bool]
+
+PIP_WHEEL_PATTERN: str = 'pip-*-py3-none-any.whl'
+
+NO_PATH: Path = cast(Path, None)
+
+
+class VirtualEnvironmentCancelled(Exception):
+    """
+    The build stopped because it was cancelled;  What it built so far is incomplete
+    """
+    pass
+
+
+class PipPolicy(Enum):
+    """
+    How the new environment gets pip
+    """
+    ENSUREPIP    = 'ensurePip'          # The interpreter's own ensurepip;  Runs pip
+    CACHED_WHEEL = 'cachedWheel'        # Unpack a cached pip wheel;  Falls back to ensurepip without one
+    NONE         = 'none'
+
+
+class VirtualEnvironmentBuilder:
+    """
+    Creates a project's virtual environment with the project's interpreter.  The interpreter is
+    found by absolute path in the pyenv versions directory, else by interpreter discovery;  No
+    shell and no shims.  When that
+    interpreter is the one running us, the environment is built in process with `venv.EnvBuilder`,
+    otherwise with `<interpreter> -m venv`.
+
+    The environment may be built somewhere other than where it will live, for example in a staging
+    directory that is renamed later;  The absolute paths venv writes are then rewritten to the final
+    location.
+
+    Requirements are installed from the wheelhouse when it has every wheel they need;  Otherwise
+    by pip, which also looks in the wheelhouse.
+
+    A cancelled build stops between steps;  A running interpreter or pip is killed with
+    everything it started
+    """
+    def __init__(self, pythonVersion: SemanticVersion, wheelhouse: Wheelhouse, pipPolicy: PipPolicy = PipPolicy.CACHED_WHEEL,
+                 progressCallback: VirtualEnvironmentCallback = lambda message: None, cancelled: CancelCheck = lambda: False):
+        """
+
+        Args:
+            pythonVersion:      Selects the interpreter
+            wheelhouse:         The local wheels;  The pip wheel is cached here on first use
+            pipPolicy:          How to provide pip
+            progressCallback:   Receives a line per step and any interpreter output
+            cancelled:          Polled from another thread while a command runs
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._pythonVersion:    SemanticVersion            = pythonVersion
+        self._wheelhouse:       Wheelhouse                 = wheelhouse
+        self._pipPolicy:        PipPolicy                  = pipPolicy
+        self._progressCallback: VirtualEnvironmentCallback = progressCallback
+        self._cancelled:        CancelCheck                = cancelled
+
+    @property
+    def pythonVersion(self) -> SemanticVersion:
+        return self._pythonVersion
+
+    @property
+    def pipPolicy(self) -> PipPolicy:
+        return self._pipPolicy
+
+    @property
+    def environmentName(self) -> str:
+        return f'{VIRTUAL_ENVIRONMENT_MARKER}{self._pythonVersion}'
+
+    @classmethod
+    def interpreterPath(cls, pythonVersion: SemanticVersion) -> Path:
+        """
+        Args:
+            pythonVersion:  The wanted version
+
+        Returns:  The interpreter's absolute path
+
+        Raises:  UnableToCreateVirtualEnvironment if no interpreter has that version
+        """
+        pyenvRoot:   Path = ExternalCommands.pyenvRoot()
+        interpreter: Path = pyenvRoot / 'versions' / str(pythonVersion) / 'bin' / f'python{pythonVersion.major}.{pythonVersion.minor}'
+        if interpreter.exists() is True:
+            return interpreter
+
+        if tuple(version_info[:3]) == (pythonVersion.major, pythonVersion.minor, pythonVersion.patch):
+            return Path(sysExecutable)
+
+        discovered: Path = InterpreterDiscovery.cacheFor().interpreterFor(pythonVersion)
+        if discovered is not NO_PATH:
+            return discovered
+
+        raise UnableToCreateVirtualEnvironment(stderr=CmdOutput([f'No Python {pythonVersion} interpreter in {pyenvRoot} or elsewhere']))
+
+    @classmethod
+    def relocate(cls, environmentPath: Path, finalPath: Path):
+        """
+        venv writes its own absolute path into the activation scripts, the script shebangs and
+        `pyvenv.cfg`;  Point them at the final location
+        """
+        oldPath: bytes = str(environmentPath).encode()
+        newPath: bytes = str(finalPath).encode()
+
+        candidates: List[Path] = [environmentPath / 'pyvenv.cfg'] + [path for path in (environmentPath / 'bin').iterdir() if path.is_symlink() is False and path.is_file() is True]
+        for candidate in candidates:
+            content: bytes = candidate.read_bytes()
+            if oldPath in content and b'\0' not in content:
+                candidate.write_bytes(content.replace(oldPath, newPath))
+
+    def create(self, environmentPath: Path, finalPath: Path) -> Path:
+        """
+        Args:
+            environmentPath:  Where to build the environment
+            finalPath:        Where the environment will live
+
+        Returns:  The final path
+
+        Raises:  VirtualEnvironmentCancelled once cancelled
+        """
+        self._checkpoint()
+
+        startTime:   float = perf_counter()
+        interpreter: Path  = VirtualEnvironmentBuilder.interpreterPath(self._pythonVersion)
+        pipWheel:    Path  = self._pipWheel()
+        withPip:     bool  = self._pipPolicy == PipPolicy.ENSUREPIP or (self._pipPolicy == PipPolicy.CACHED_WHEEL and pipWheel is NO_PATH)
+
+        self._progressCallback(f'Creating virtual environment {self.environmentName} with {interpreter}')
+        if interpreter.resolve() == Path(sysExecutable).resolve():
+            EnvBuilder(symlinks=True, with_pip=withPip).create(environmentPath)
+        else:
+            self._runVenv(interpreter=interpreter, environmentPath=environmentPath, withPip=withPip)
+
+        self._checkpoint()
+        if pipWheel is not NO_PATH:
+            self._seedPip(pipWheel=pipWheel, environmentPath=environmentPath, finalPath=finalPath)
+
+        if environmentPath != finalPath:
+            VirtualEnvironmentBuilder.relocate(environmentPath=environmentPath, finalPath=finalPath)
+
+        self._progressCallback(f'Created virtual environment {self.environmentName} in {(perf_counter() - startTime) * 1000:.0f} ms')
+
+        return finalPath
+
+    def install(self, environmentPath: Path, requirementsPath: Path):
+        """
+        Installs a requirements file into an environment;  From the wheelhouse, without a network,
+        when it can, else with the environment's pip
+
+        Args:
+            environmentPath:    An environment;  It needs pip unless the wheelhouse has every wheel
+            requirementsPath:   The requirements file
+
+        Raises:  VirtualEnvironmentCancelled once cancelled
+        """
+        self._checkpoint()
+        self._progressCallback(f'Installing {requirementsPath.name} into {self.environmentName}')
+        self._wheelhouse.importWheels()
+        try:
+            wheels: List[WheelFile] = self._wheelhouse.resolve(requirements=Wheelhouse.parseRequirements(requirementsPath.read_text()), pythonVersion=self._pythonVersion)
+        except UnableToResolveRequirements as e:
+            self._progressCallback(f'Not in the wheelhouse: {e};  Using pip')
+            self._run(arguments=[str(environmentPath / 'bin' / 'python'), '-m', 'pip', 'install', '--disable-pip-version-check',
+                                 '--find-links', str(self._wheelhouse.path), '--requirement', str(requirementsPath)])
+            return
+
+        installer: WheelInstaller = WheelInstaller(environmentPath=environmentPath, pythonVersion=self._pythonVersion, progressCallback=self._progressCallback)
+        try:
+            installer.install(wheelPaths=[wheel.path for wheel in wheels])
+        except UnableToInstallWheel as e:
+            raise UnableToCreateVirtualEnvironment(stderr=CmdOutput([str(e)]))
+
+    def _runVenv(self, interpreter: Path, environmentPath: Path, withPip: bool):
+        """
+        Streams the interpreter's output;  There is no timeout since ensurepip may take a while
+        """
+        arguments: List[str] = [str(interpreter), '-m', 'venv', '--symlinks']
+        if withPip is False:
+            arguments.append('--without-pip')
+        arguments.append(str(environmentPath))
+
+        self._run(arguments=arguments)
+
+    def _run(self, arguments: List[str]):
+        """
+        Streams the command's output as progress.  The shared command runner kills the
+        command's process group on a cancel;  So, whatever it started goes too
+        """
+        completedData: CompletedData = CommandRunner.sharedRunner().runSync(argv=arguments,
+                                                                            timeout=NO_TIMEOUT,
+                                                                            subscriber=lambda outputStream, line: self._progressCallback(line.rstrip()),
+                                                                            cancelled=self._cancelled)
+        self._checkpoint()
+        if completedData.status != 0:
+            raise UnableToCreateVirtualEnvironment(stderr=CmdOutput([line.rstrip() for line in completedData.stdout + completedData.stderr]))
+
+    def _checkpoint(self):
+
+        if self._cancelled() is True:
+            raise VirtualEnvironmentCancelled(f'Virtual environment {self.environmentName} cancelled')
+
+    def _pipWheel(self) -> Path:
+        """
+        Returns:  The newest cached pip wheel;  Caches the one bundled with ensurepip when the cache
+        has none.  NO_PATH if there is no wheel at all
+        """
+        if self._pipPolicy != PipPolicy.CACHED_WHEEL:
+            return NO_PATH
+
+        cachedWheels: List[Path] = sorted(self._wheelhouse.path.glob(PIP_WHEEL_PATTERN), key=lambda wheel: wheel.stat().st_mtime)
+        if len(cachedWheels) > 0:
+            return cachedWheels[-1]
+
+        bundledWheels: List[Path] = sorted((Path(ensurepip.__file__).parent / '_bundled').glob(PIP_WHEEL_PATTERN))
+        if len(bundledWheels) == 0:
+            self.logger.warning('No pip wheel to cache;  Using ensurepip')
+            return NO_PATH
+
+        self._wheelhouse.path.mkdir(parents=True, exist_ok=True)
+
+        return Path(copy2(bundledWheels[-1], self._wheelhouse.path))
+
+    def _seedPip(self, pipWheel: Path, environmentPath: Path, finalPath: Path):
+        """
+        pip is a pure Python wheel;  Install it the way any other wheel from the wheelhouse is
+        installed, without starting pip
+        """
+        installer: WheelInstaller = WheelInstaller(environmentPath=environmentPath, pythonVersion=self._pythonVersion, finalPath=finalPath)
+
+        self._progressCallback(f'Seeded pip from {pipWheel.name}: {installer.installWheel(pipWheel)}')
@@ -0,0 +1,236 @@
+
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import NewType
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
+
+from configparser import ConfigParser
+
+from dataclasses import dataclass
+
+from os import chmod
+
+from pathlib import Path
+from pathlib import PurePosixPath
+
+from shutil import copyfileobj
+
+from time import perf_counter
+
+from zipfile import ZipFile
+from zipfile import ZipInfo
+
+from semantic_version import Version as SemanticVersion
+
+WheelInstallerCallback = Callable[[str], None]
+
+INSTALLER_NAME: str = 'pyfabricate'
+
+DEFAULT_WORKERS: int = 4
+
+SCRIPT_PERMISSIONS:  int = 0o755
+EXECUTE_PERMISSIONS: int = 0o111
+
+SCRIPT_SECTIONS: List[str] = ['console_scripts', 'gui_scripts']
+
+#
+# What pip writes;  The environment's interpreter is given by absolute path
+#
+CONSOLE_SCRIPT: str = """#!{python}
+import sys
+from {module} import {importName}
+if __name__ == '__main__':
+    sys.exit({function}())
+"""
+
+WHEEL_SHEBANG: bytes = b'#!python'
+
+NO_PATH: Path = cast(Path, None)
+
+
+class UnableToInstallWheel(Exception):
+
+    def __init__(self, wheelPath: Path, message: str):
+
+        self._wheelPath: Path = wheelPath
+        self._message:   str  = message
+
+    @property
+    def wheelPath(self) -> Path:
+        return self._wheelPath
+
+    def __str__(self) -> str:
+        return f'{self._wheelPath.name}: {self._message}'
+
+
+@dataclass
+class WheelTiming:
+    distribution: str
+    fileCount:    int
+    elapsed:      float
+
+    def __str__(self) -> str:
+        return f'Installed {self.distribution}: {self.fileCount} files in {self.elapsed * 1000:.1f} ms'
+
+
+WheelTimings = NewType('WheelTimings', List[WheelTiming])
+
+
+class WheelInstaller:
+    """
+    Installs wheels into a virtual environment without pip.  A wheel is a zip of the installed
+    files;  The files go into site-packages, the `.data` directories go to their install schemes
+    and the entry points become scripts in `bin`.
+
+    Wheels are installed at the same time, one per worker thread;  Decompression and file writes
+    release the interpreter lock.  Nothing is byte compiled;  The interpreter does that on first
+    import
+    """
+    def __init__(self, environmentPath: Path, pythonVersion: SemanticVersion, finalPath: Path = NO_PATH, workers: int = DEFAULT_WORKERS,
+                 progressCallback: WheelInstallerCallback = lambda message: None):
+        """
+
+        Args:
+            environmentPath:    The environment to install into
+            pythonVersion:      The environment's interpreter version;  Locates site-packages
+            finalPath:          Where the environment will live;  Defaults to the environment path
+            workers:            How many wheels to install at once
+            progressCallback:   Receives each wheel's timing
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._environmentPath:  Path                   = environmentPath
+        self._finalPath:        Path                   = environmentPath if finalPath is NO_PATH else finalPath
+        self._workers:          int                    = workers
+        self._progressCallback: WheelInstallerCallback = progressCallback
+
+        self._sitePackages: Path = environmentPath / 'lib' / f'python{pythonVersion.major}.{pythonVersion.minor}' / 'site-packages'
+        self._binPath:      Path = environmentPath / 'bin'
+        self._includePath:  Path = environmentPath / 'include' / 'site' / f'python{pythonVersion.major}.{pythonVersion.minor}'
+
+    def install(self, wheelPaths: List[Path]) -> WheelTimings:
+        """
+        Args:
+            wheelPaths:  The wheels;  Their dependencies must already be in the list or the environment
+
+        Returns:  A timing per wheel, in the order the wheels were finished
+
+        Raises:  UnableToInstallWheel
+        """
+        startTime: float        = perf_counter()
+        timings:   WheelTimings = WheelTimings([])
+
+        with ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix='WheelInstaller') as executor:
+            futures: List[Future] = [executor.submit(self.installWheel, wheelPath) for wheelPath in wheelPaths]
+            for future in as_completed(futures):
+                timing: WheelTiming = future.result()
+                timings.append(timing)
+                self._progressCallback(str(timing))
+
+        self._progressCallback(f'Installed {len(timings)} wheels in {(perf_counter() - startTime) * 1000:.0f} ms')
+
+        return timings
+
+    def installWheel(self, wheelPath: Path) -> WheelTiming:
+        """
+        Args:
+            wheelPath:  A wheel;  Its dependencies are not installed
+
+        Returns:  How long it took
+        """
+        startTime:    float     = perf_counter()
+        recordLines:  List[str] = []
+
+        with ZipFile(wheelPath) as wheel:
+            distInfo:  str = self._distInfo(wheelPath=wheelPath, wheel=wheel)
+            dataName:  str = f'{distInfo.removesuffix(".dist-info")}.data'
+            distName:  str = distInfo.split('-')[0]
+            fileCount: int = len(wheel.infolist())
+            schemes:   Dict[str, Path] = {
+                'purelib': self._sitePackages,
+                'platlib': self._sitePackages,
+                'scripts': self._binPath,
+                'headers': self._includePath / distName,
+                'data':    self._environmentPath,
+            }
+            for info in wheel.infolist():
+                if info.is_dir() is True:
+                    continue
+                memberPath: PurePosixPath = PurePosixPath(info.filename)
+                if memberPath.is_absolute() is True or '..' in memberPath.parts:
+                    raise UnableToInstallWheel(wheelPath=wheelPath, message=f'Unsafe path {info.filename}')
+
+                if memberPath.parts[0] == dataName:
+                    if len(memberPath.parts) < 3 or memberPath.parts[1] not in schemes:
+                        raise UnableToInstallWheel(wheelPath=wheelPath, message=f'Unknown scheme in {info.filename}')
+                    targetPath: Path = schemes[memberPath.parts[1]].joinpath(*memberPath.parts[2:])
+                    self._extract(wheel=wheel, info=info, targetPath=targetPath, isScript=memberPath.parts[1] == 'scripts')
+                    recordLines.append(f'{self._recordPath(targetPath)},,')
+                else:
+                    self._extract(wheel=wheel, info=info, targetPath=self._sitePackages.joinpath(*memberPath.parts), isScript=False)
+
+        distInfoPath: Path = self._sitePackages / distInfo
+        self._binPath.mkdir(parents=True, exist_ok=True)
+        for scriptName, entryPoint in self._entryPoints(distInfoPath / 'entry_points.txt').items():
+            module, function = entryPoint.split(':')
+            function = function.strip().split()[0]
+            scriptPath: Path = self._binPath / scriptName
+            scriptPath.write_text(CONSOLE_SCRIPT.format(python=self._finalPath / 'bin' / 'python', module=module.strip(), importName=function.split('.')[0], function=function))
+            chmod(scriptPath, SCRIPT_PERMISSIONS)
+            recordLines.append(f'{self._recordPath(scriptPath)},,')
+
+        (distInfoPath / 'INSTALLER').write_text(f'{INSTALLER_NAME}\n')
+        with (distInfoPath / 'RECORD').open('a') as record:
+            record.writelines(f'{line}\n' for line in recordLines + [f'{distInfo}/INSTALLER,,'])
+
+        return WheelTiming(distribution=distInfo.removesuffix('.dist-info'), fileCount=fileCount, elapsed=perf_counter() - startTime)
+
+    def _distInfo(self, wheelPath: Path, wheel: ZipFile) -> str:
+
+        distInfos: List[str] = sorted({name.split('/')[0] for name in wheel.namelist() if name.split('/')[0].endswith('.dist-info')})
+        if len(distInfos) != 1:
+            raise UnableToInstallWheel(wheelPath=wheelPath, message=f'Expected one .dist-info directory, found {len(distInfos)}')
+
+        return distInfos[0]
+
+    def _extract(self, wheel: ZipFile, info: ZipInfo, targetPath: Path, isScript: bool):
+
+        targetPath.parent.mkdir(parents=True, exist_ok=True)
+        with wheel.open(info) as source, targetPath.open('wb') as destination:
+            if isScript is True:
+                firstLine: bytes = source.readline()
+                if firstLine.startswith(WHEEL_SHEBANG) is True:
+                    firstLine = f'#!{self._finalPath / "bin" / "python"}'.encode() + firstLine[len(WHEEL_SHEBANG):]
+                destination.write(firstLine)
+            copyfileobj(source, destination)
+
+        permissions: int = info.external_attr >> 16
+        if isScript is True or permissions & EXECUTE_PERMISSIONS != 0:
+            chmod(targetPath, SCRIPT_PERMISSIONS)
+
+    def _recordPath(self, path: Path) -> str:
+        """
+        RECORD paths are relative to site-packages
+        """
+        return str(Path('..', '..', '..').joinpath(path.relative_to(self._environmentPath)))
+
+    def _entryPoints(self, entryPointsPath: Path) -> Dict[str, str]:
+
+        entryPoints: ConfigParser = ConfigParser(delimiters=('=',))
+        entryPoints.optionxform = str       # type: ignore[assignment,method-assign]
+        entryPoints.read(entryPointsPath)
+
+        scripts: Dict[str, str] = {}
+        for section in SCRIPT_SECTIONS:
+            if entryPoints.has_section(section) is True:
+                scripts.update(entryPoints.items(section))
+
+        return scripts
@@ -0,0 +1,262 @@
+
+from typing import Deque
+from typing import Dict
+from typing import FrozenSet
+from typing import List
+from typing import Set
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from collections import deque
+
+from dataclasses import dataclass
+
+from email.parser import HeaderParser
+
+from os import replace as osReplace
+
+from pathlib import Path
+
+from secrets import token_hex
+
+from shutil import copy2
+
+from zipfile import ZipFile
+
+from packaging.markers import default_environment
+from packaging.requirements import InvalidRequirement
+from packaging.requirements import Requirement
+from packaging.tags import Tag
+from packaging.tags import compatible_tags
+from packaging.tags import cpython_tags
+from packaging.utils import InvalidWheelFilename
+from packaging.utils import NormalizedName
+from packaging.utils import canonicalize_name
+from packaging.utils import parse_wheel_filename
+from packaging.version import Version
+
+from semantic_version import Version as SemanticVersion
+
+WHEEL_PATTERN:   str = '*.whl'
+METADATA_FILE:   str = 'METADATA'
+REQUIRES_DIST:   str = 'Requires-Dist'
+NO_EXTRA:        str = ''
+
+NO_PATH: Path = cast(Path, None)
+
+MarkerEnvironment = Dict[str, str]
+
+
+class UnableToResolveRequirements(Exception):
+
+    def __init__(self, unresolved: List[str]):
+
+        self._unresolved: List[str] = unresolved
+
+    @property
+    def unresolved(self) -> List[str]:
+        return self._unresolved
+
+    def __str__(self) -> str:
+        return ', '.join(self._unresolved)
+
+
+@dataclass
+class WheelFile:
+    path:    Path
+    name:    NormalizedName
+    version: Version
+    tags:    FrozenSet[Tag]
+
+    def requirements(self) -> List[Requirement]:
+        """
+        The wheel's own dependencies, from its METADATA
+        """
+        with ZipFile(self.path) as wheel:
+            metadataName: str = next(name for name in wheel.namelist() if name.count('/') == 1 and name.endswith(f'.dist-info/{METADATA_FILE}'))
+            metadata:     str = wheel.read(metadataName).decode('utf-8')
+
+        return [Requirement(requiresDist) for requiresDist in HeaderParser().parsestr(metadata).get_all(REQUIRES_DIST, [])]
+
+
+class Wheelhouse:
+    """
+    A managed directory of wheels;  It is filled from the wheels someone drops into the drop
+    directory, and it resolves a requirements file to wheels without a network.  Resolution is
+    for a target interpreter, which need not be the one running us
+
+    The resolver is greedy;  It takes the newest wheel that satisfies the first requirement that
+    names a project and reports a conflict if a later requirement disagrees
+    """
+    def __init__(self, wheelhousePath: Path, dropPath: Path = NO_PATH):
+        """
+
+        Args:
+            wheelhousePath: Where the managed wheels live
+            dropPath:       Where people put new wheels;  Optional
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._wheelhousePath: Path = wheelhousePath
+        self._dropPath:       Path = dropPath
+
+    @property
+    def path(self) -> Path:
+        return self._wheelhousePath
+
+    @property
+    def wheels(self) -> List[WheelFile]:
+
+        wheels: List[WheelFile] = []
+        if self._wheelhousePath.exists() is False:
+            return wheels
+
+        for wheelPath in sorted(self._wheelhousePath.glob(WHEEL_PATTERN)):
+            try:
+                name, version, _, tags = parse_wheel_filename(wheelPath.name)
+            except InvalidWheelFilename as e:
+                self.logger.warning(f'Ignoring {wheelPath.name}: {e}')
+                continue
+            wheels.append(WheelFile(path=wheelPath, name=name, version=version, tags=tags))
+
+        return wheels
+
+    @classmethod
+    def parseRequirements(cls, requirementsText: str) -> List[str]:
+        """
+        Comments, blank lines and pip options are dropped
+        """
+        requirements: List[str] = []
+        for line in requirementsText.splitlines():
+            requirement: str = line.split('#', 1)[0].strip()
+            if requirement != '' and requirement.startswith('-') is False:
+                requirements.append(requirement)
+
+        return requirements
+
+    def importWheels(self) -> List[Path]:
+        """
+        Copies any new wheel from the drop directory;  A wheel appears in the wheelhouse whole or
+        not at all
+
+        Returns:  The imported wheels
+        """
+        imported: List[Path] = []
+        if self._dropPath is NO_PATH or self._dropPath.exists() is False:
+            return imported
+
+        self._wheelhousePath.mkdir(parents=True, exist_ok=True)
+        for droppedPath in sorted(self._dropPath.glob(WHEEL_PATTERN)):
+            try:
+                parse_wheel_filename(droppedPath.name)
+            except InvalidWheelFilename as e:
+                self.logger.warning(f'Not importing {droppedPath.name}: {e}')
+                continue
+
+            wheelPath: Path = self._wheelhousePath / droppedPath.name
+            if wheelPath.exists() is True and wheelPath.stat().st_size == droppedPath.stat().st_size:
+                continue
+
+            temporaryPath: Path = self._wheelhousePath / f'.{droppedPath.name}.{token_hex(4)}'
+            copy2(droppedPath, temporaryPath)
+            osReplace(temporaryPath, wheelPath)
+            imported.append(wheelPath)
+
+        if len(imported) > 0:
+            self.logger.info(f'Imported {len(imported)} wheels from {self._dropPath}')
+
+        return imported
+
+    def resolve(self, requirements: List[str], pythonVersion: SemanticVersion) -> List[WheelFile]:
+        """
+        Args:
+            requirements:   Requirement specifiers, as in a requirements file
+            pythonVersion:  The interpreter the wheels are for
+
+        Returns:  A wheel for every requirement and every dependency
+
+        Raises:  UnableToResolveRequirements
+        """
+        supportedTags: Dict[Tag, int]                = self._supportedTags(pythonVersion)
+        environment:   MarkerEnvironment             = self._markerEnvironment(pythonVersion)
+        available:     Dict[str, List[WheelFile]]    = {}
+        chosen:        Dict[str, WheelFile]          = {}
+        chosenExtras:  Dict[str, Set[str]]           = {}
+        unresolved:    List[str]                     = []
+        pending:       Deque[Requirement]            = deque()
+
+        for wheel in self.wheels:
+            if len(wheel.tags & supportedTags.keys()) > 0:
+                available.setdefault(wheel.name, []).append(wheel)
+
+        for requirementText in requirements:
+            try:
+                requirement: Requirement = Requirement(requirementText)
+            except InvalidRequirement as e:
+                raise UnableToResolveRequirements(unresolved=[f'{requirementText}: {e}'])
+            if requirement.marker is None or requirement.marker.evaluate(environment | {'extra': NO_EXTRA}) is True:
+                pending.append(requirement)
+
+        while len(pending) > 0:
+            requirement = pending.popleft()
+            name: NormalizedName = canonicalize_name(requirement.name)
+
+            if name in chosen:
+                if requirement.specifier.contains(chosen[name].version, prereleases=True) is False:
+                    unresolved.append(f'{requirement} conflicts with {name} {chosen[name].version}')
+                newExtras: Set[str] = set(requirement.extras) - chosenExtras[name]
+                if len(newExtras) > 0:
+                    chosenExtras[name] |= newExtras
+                    pending.extend(self._dependencies(wheel=chosen[name], extras=newExtras, environment=environment))
+                continue
+
+            candidates: Dict[Version, List[WheelFile]] = {}
+            for wheel in available.get(name, []):
+                candidates.setdefault(wheel.version, []).append(wheel)
+
+            versions: List[Version] = sorted(requirement.specifier.filter(candidates.keys()))
+            if len(versions) == 0:
+                unresolved.append(str(requirement))
+                continue
+
+            best: WheelFile = min(candidates[versions[-1]], key=lambda candidate: min(supportedTags.get(tag, len(supportedTags)) for tag in candidate.tags))
+
+            chosen[name]       = best
+            chosenExtras[name] = set(requirement.extras)
+            pending.extend(self._dependencies(wheel=best, extras={NO_EXTRA} | set(requirement.extras), environment=environment))
+
+        if len(unresolved) > 0:
+            raise UnableToResolveRequirements(unresolved=unresolved)
+
+        return list(chosen.values())
+
+    def _dependencies(self, wheel: WheelFile, extras: Set[str], environment: MarkerEnvironment) -> List[Requirement]:
+
+        dependencies: List[Requirement] = []
+        for requirement in wheel.requirements():
+            if requirement.marker is None or any(requirement.marker.evaluate(environment | {'extra': extra}) for extra in extras):
+                dependencies.append(requirement)
+
+        return dependencies
+
+    def _supportedTags(self, pythonVersion: SemanticVersion) -> Dict[Tag, int]:
+        """
+        Returns:  The target interpreter's tags, most preferred first, with their rank
+        """
+        pythonTuple: tuple     = (pythonVersion.major, pythonVersion.minor)
+        tags:        List[Tag] = list(cpython_tags(python_version=pythonTuple))
+        tags.extend(compatible_tags(python_version=pythonTuple, interpreter=f'cp{pythonVersion.major}{pythonVersion.minor}'))
+
+        return {tag: rank for rank, tag in reversed(list(enumerate(tags)))}
+
+    def _markerEnvironment(self, pythonVersion: SemanticVersion) -> MarkerEnvironment:
+
+        environment: MarkerEnvironment = cast(MarkerEnvironment, default_environment())
+
+        environment['python_version']         = f'{pythonVersion.major}.{pythonVersion.minor}'
+        environment['python_full_version']    = f'{pythonVersion.major}.{pythonVersion.minor}.{pythonVersion.patch}'
+        environment['implementation_version'] = environment['python_full_version']
+
+        return environment
@@ -16,8 +16,9 @@ from wx.lib.sized_controls import SizedPanel
 
 from semantic_version import Version as SemanticVersion
 
-from pyfabricate.oswrapper.ExternalCommands import ExternalCommands
 from pyfabricate.oswrapper.ExternalCommands import SemanticVersions
+from pyfabricate.oswrapper.InterpreterDiscovery import InterpreterDiscovery
+from pyfabricate.oswrapper.PythonVersionCache import PythonVersionCache
 
 from pyfabricate.steps.PageBase import PageBase
 
@@ -55,16 +56,21 @@ class PythonVersionStep(PageBase):
 
     def _getPythonVersions(self) -> List[str]:
         """
-        TODO:  We have to query pyenv
+        The pyenv versions from the shared version cache and every other CPython interpreter that
+        can create a virtual environment;  Both are cached, so only the first launch waits
 
         Returns:  A list of installed python versions
 
         """
-        pythonVersions: SemanticVersions = ExternalCommands.getPythonVersions()
+        pythonVersions: SemanticVersions = PythonVersionCache.cacheFor().pythonVersions
+
+        for interpreter in InterpreterDiscovery.cacheFor().usableInterpreters:
+            if interpreter.semanticVersion not in pythonVersions:
+                pythonVersions.append(interpreter.semanticVersion)
 
         strVersions: List[str] = []
 
-        for pythonVersion in pythonVersions:
+        for pythonVersion in sorted(pythonVersions):
             strVersions.append(str(pythonVersion))
 
         return strVersions
@@ -9,7 +9,15 @@ from setuptools import setup
 
 APP = ['pyfabricate/PyFabricateApp.py']
 
-DATA_FILES = [('pyfabricate/resources', ['pyfabricate/resources/loggingConfiguration.json']),]
+DATA_FILES = [('pyfabricate/resources', ['pyfabricate/resources/loggingConfiguration.json', 'pyfabricate/resources/templates.zip', 'pyfabricate/resources/releasedTemplates.json']),]
+
+#
+# glob does not match dot files;  So, the dot templates need their own pattern
+#
+PACKAGE_DATA = {
+    'pyfabricate.resources':           ['templates.zip', 'releasedTemplates.json'],
+    'pyfabricate.resources.templates': ['*.template', '.*.template'],
+}
 
 OPTIONS = {}
 
@@ -17,8 +25,9 @@ setup(
     name='PyFabricate',
     version=__version__,
     app=APP,
-    packages=find_packages(include=['pyfabricate.*', 'mage.*']),
+    packages=find_packages(include=['pyfabricate', 'pyfabricate.*', 'mage.*']),
     include_package_data=True,
+    package_data=PACKAGE_DATA,
     data_files=DATA_FILES,
     zip_safe=False,
     url='https://github.com/hasii2011/pyfabricate',
@@ -39,6 +48,12 @@ setup(
                     ),
             ),
     ),
+    entry_points={
+        'console_scripts': [
+            'pyfabricate=pyfabricate.PyFabricate:commandHandler',
+            'pyfabricated=pyfabricate.daemon.PyFabricated:pyfabricated',
+        ],
+    },
     setup_requires=['py2app'],
-    install_requires=['codeallybasic>=1.10.0', 'codeallyadvanced>=1.4.1', 'wxPython>=4.2.2', 'semantic-version>=2.10.0']
+    install_requires=['codeallybasic>=1.10.0', 'codeallyadvanced>=1.4.1', 'wxPython>=4.2.2', 'semantic-version>=2.10.0', 'click>=8.1.7', 'packaging>=24.0']
 )
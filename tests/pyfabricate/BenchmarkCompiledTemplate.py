@@ -0,0 +1,67 @@
+
+from typing import Callable
+from typing import Dict
+
+from pathlib import Path
+
+from string import Template
+
+from timeit import repeat
+
+from pyfabricate.fabrication.CompiledTemplate import CompiledTemplate
+
+TEMPLATES_PATH: Path = Path(__file__).parent.parent.parent / 'pyfabricate' / 'resources' / 'templates'
+
+BENCHMARK_TEMPLATES = [
+    'pyproject.toml.template',
+    'loggingConfiguration.json.template',
+]
+
+TOKENS: Dict[str, object] = {
+    'PROJECT_NAME': 'DemoProject',
+    'MODULE_NAME':  'demoproject',
+    'OWNER_NAME':   'Gato Malo',
+    'OWNER_EMAIL':  'gato.malo@gmail.com',
+    'DESCRIPTION':  'A demonstration project',
+    'KEYWORDS':     'demo,project',
+}
+
+NUMBER:  int = 10000
+REPEATS: int = 5
+
+
+def bestTime(statement: Callable[[], bytes]) -> float:
+    """
+    Returns:  The best per call time in microseconds
+    """
+    return min(repeat(statement, number=NUMBER, repeat=REPEATS)) / NUMBER * 1_000_000
+
+
+def benchmark(templateName: str):
+    """
+    The string.Template path is what fabrication used to do on every render:  Read the text,
+    scan it with the placeholder regular expression, substitute and encode the result
+    """
+    content: bytes = (TEMPLATES_PATH / templateName).read_bytes()
+    text:    str   = content.decode()
+
+    compiledTemplate: CompiledTemplate = CompiledTemplate.compile(content)
+
+    assert compiledTemplate.render(TOKENS) == Template(text).substitute(TOKENS).encode(), f'{templateName} renders differently'
+
+    stringTemplate: float = bestTime(lambda: Template(content.decode()).substitute(TOKENS).encode())
+    compiled:       float = bestTime(lambda: compiledTemplate.render(TOKENS))
+    compiling:      float = bestTime(lambda: CompiledTemplate.compile(content).render(TOKENS))
+
+    print(f'{templateName} ({len(content)} bytes, {len(compiledTemplate.identifiers)} tokens)')
+    print(f'    string.Template:           {stringTemplate:8.2f} µs')
+    print(f'    CompiledTemplate.render:   {compiled:8.2f} µs  ({stringTemplate / compiled:.1f}x)')
+    print(f'    compile + render:          {compiling:8.2f} µs')
+
+
+#
+# From the repository root:  python -m tests.pyfabricate.BenchmarkCompiledTemplate
+#
+if __name__ == '__main__':
+    for name in BENCHMARK_TEMPLATES:
+        benchmark(templateName=name)
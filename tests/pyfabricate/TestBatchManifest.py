@@ -0,0 +1,98 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from semantic_version import Version as SemanticVersion
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyfabricate.batch.BatchManifest import BatchManifest
+from pyfabricate.batch.BatchManifest import ProjectDetailsList
+
+from pyfabricate.fabrication.FabricationError import FabricationError
+
+MANIFEST_WITH_DEFAULTS: str = """
+{
+    "defaults": {"ownerName": "Gato Malo", "baseDirectory": "/tmp/batch", "pythonVersion": "3.12.4"},
+    "projects": [
+        {"name": "DemoProject1", "moduleName": "demoproject1"},
+        {"name": "DemoProject2", "moduleName": "demoproject2", "pythonVersion": "3.11.9"}
+    ]
+}
+"""
+
+BARE_LIST_MANIFEST: str = """
+[
+    {"name": "DemoProject1", "moduleName": "demoproject1", "pythonVersion": "3.12.4"}
+]
+"""
+
+
+class TestBatchManifest(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+        self._manifestPath:       Path               = Path(self._temporaryDirectory.name) / 'manifest.json'
+
+    def tearDown(self):
+        super().tearDown()
+        self._temporaryDirectory.cleanup()
+
+    def testDefaultsApplied(self):
+
+        self._manifestPath.write_text(MANIFEST_WITH_DEFAULTS)
+        projects: ProjectDetailsList = BatchManifest(manifestPath=self._manifestPath).projects
+
+        self.assertEqual(2, len(projects), 'Wrong project count')
+        self.assertEqual('Gato Malo', projects[1].ownerName, 'Default not applied')
+        self.assertEqual(Path('/tmp/batch'), projects[0].baseDirectory, 'Default not applied')
+
+    def testProjectOverridesDefault(self):
+
+        self._manifestPath.write_text(MANIFEST_WITH_DEFAULTS)
+        projects: ProjectDetailsList = BatchManifest(manifestPath=self._manifestPath).projects
+
+        self.assertEqual(SemanticVersion('3.12.4'), projects[0].pythonVersion, 'Should be the default')
+        self.assertEqual(SemanticVersion('3.11.9'), projects[1].pythonVersion, 'Should be overridden')
+
+    def testBareList(self):
+
+        self._manifestPath.write_text(BARE_LIST_MANIFEST)
+        projects: ProjectDetailsList = BatchManifest(manifestPath=self._manifestPath).projects
+
+        self.assertEqual(1, len(projects), 'Wrong project count')
+        self.assertEqual('demoproject1', projects[0].moduleName, 'Wrong module name')
+
+    def testInvalidManifest(self):
+
+        self._manifestPath.write_text('{ this is not json')
+
+        self.assertRaises(FabricationError, lambda: BatchManifest(manifestPath=self._manifestPath))
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestBatchManifest))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,117 @@
+
+from typing import List
+from typing import Tuple
+
+from asyncio import gather
+from asyncio import run as asyncioRun
+
+from pathlib import Path
+
+from sys import executable as sysExecutable
+
+from tempfile import TemporaryDirectory
+
+from threading import Event
+from threading import Timer
+
+from time import perf_counter
+from time import sleep
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyfabricate.oswrapper.CommandRunner import COMMAND_NOT_FOUND_STATUS
+from pyfabricate.oswrapper.CommandRunner import CommandRunner
+from pyfabricate.oswrapper.CommandRunner import NO_TIMEOUT
+from pyfabricate.oswrapper.CommandRunner import OutputStream
+from pyfabricate.oswrapper.CommandRunner import TIMED_OUT_STATUS
+from pyfabricate.oswrapper.CompletedData import CompletedData
+
+TALKER: str = 'import sys; print("out"); print("err", file=sys.stderr); sys.exit(3)'
+#
+# Starts a grandchild that would outlive a kill of only the command
+#
+SPAWNER: str = 'import subprocess, sys, time; child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"]); print(child.pid, flush=True); time.sleep(30)'
+
+
+class TestCommandRunner(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+    def testStreamsLinesWithoutAShell(self):
+
+        commandRunner: CommandRunner                  = CommandRunner()
+        lines:         List[Tuple[OutputStream, str]] = []
+
+        completedData: CompletedData = commandRunner.runSync(argv=[sysExecutable, '-c', TALKER], subscriber=lambda stream, line: lines.append((stream, line)))
+
+        self.assertEqual(3, completedData.status, 'The exit status should be returned')
+        self.assertEqual(['out'], completedData.stdout, 'Wrong stdout')
+        self.assertEqual(['err'], completedData.stderr, 'Wrong stderr')
+        self.assertEqual({(OutputStream.STDOUT, 'out'), (OutputStream.STDERR, 'err')}, set(lines), 'Lines should be streamed as they arrive')
+
+        with TemporaryDirectory() as temporaryDirectory:
+            notAShell: Path = Path(temporaryDirectory) / 'not;a shell'
+            self.assertEqual(COMMAND_NOT_FOUND_STATUS, commandRunner.runSync(argv=[str(notAShell)]).status, 'The argument vector should not go to a shell')
+
+    def testTimeoutKillsTheProcessGroupWithinTheLimit(self):
+
+        commandRunner: CommandRunner = CommandRunner(concurrency=1)
+
+        async def runBoth() -> List[CompletedData]:
+            return await gather(commandRunner.run(argv=[sysExecutable, '-c', SPAWNER], timeout=1.0),
+                                commandRunner.run(argv=[sysExecutable, '-c', SPAWNER], timeout=1.0))
+
+        startTime:      float               = perf_counter()
+        completedDatas: List[CompletedData] = asyncioRun(runBoth())
+        elapsed:        float               = perf_counter() - startTime
+
+        self.assertEqual([TIMED_OUT_STATUS, TIMED_OUT_STATUS], [completedData.status for completedData in completedDatas], 'Both should time out')
+        self.assertGreaterEqual(elapsed, 2.0, 'The second command should wait for the first')
+        for completedData in completedDatas:
+            self.assertFalse(self._isRunning(int(completedData.stdout[0])), 'The grandchild should be killed with its group')
+
+    def testCancelKillsTheProcessGroup(self):
+
+        commandRunner: CommandRunner = CommandRunner()
+        cancelEvent:   Event         = Event()
+
+        Timer(0.5, cancelEvent.set).start()
+        startTime:     float         = perf_counter()
+        completedData: CompletedData = commandRunner.runSync(argv=[sysExecutable, '-c', SPAWNER], timeout=NO_TIMEOUT, cancelled=cancelEvent.is_set)
+
+        self.assertLess(perf_counter() - startTime, 5.0, 'The cancel should stop the command')
+        self.assertEqual('Cancelled', completedData.stderr[-1], 'The cancel should be reported')
+        self.assertFalse(self._isRunning(int(completedData.stdout[0])), 'The grandchild should be killed with its group')
+
+    def _isRunning(self, pid: int) -> bool:
+        """
+        SIGKILL is delivered to the group asynchronously;  A killed process that nobody reaped yet
+        is a zombie
+        """
+        statusPath: Path  = Path(f'/proc/{pid}/status')
+        deadline:   float = perf_counter() + 5.0
+        while perf_counter() < deadline:
+            if statusPath.exists() is False or 'zombie' in statusPath.read_text():
+                return False
+            sleep(0.05)
+
+        return True
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestCommandRunner))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,82 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyfabricate.ConsoleLineStore import CHUNK_SIZE
+from pyfabricate.ConsoleLineStore import ConsoleLineStore
+from pyfabricate.ConsoleLineStore import LineFilter
+from pyfabricate.ConsoleLineStore import LineLevel
+
+MANY_PROJECTS: int = 70_000
+
+WARNINGS_AND_ERRORS: LineFilter = LineFilter(levels=frozenset({LineLevel.WARNING, LineLevel.ERROR}))
+
+
+class TestConsoleLineStore(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+    def testFilterByLevelAndProject(self):
+
+        lineStore: ConsoleLineStore = ConsoleLineStore()
+
+        for index in range(CHUNK_SIZE + 10):
+            level: LineLevel = LineLevel.WARNING if index % 10 == 0 else LineLevel.INFO
+            lineStore.append(text=f'Created: module{index}.py', level=level, project=f'Project{index % 2}')
+
+        lineStore.lineFilter = WARNINGS_AND_ERRORS
+        self.assertEqual(411, lineStore.visibleCount, 'Every tenth line is a warning')
+
+        lineStore.lineFilter = LineFilter(levels=WARNINGS_AND_ERRORS.levels, project='Project0', text='module40.py')
+        self.assertEqual(['Created: module40.py'], [lineStore.visibleLine(row).text for row in range(lineStore.visibleCount)], 'Narrowed incorrectly')
+        self.assertEqual(41, lineStore.visibleLine(0).number, 'Lines are numbered from one')
+
+        self.assertTrue(lineStore.append(text='Error: module40.py failed', level=LineLevel.ERROR, project='Project0'), 'A matching line should be in view')
+        self.assertFalse(lineStore.append(text='module40.py done', level=LineLevel.INFO, project='Project0'), 'An info line should be filtered')
+
+        lineStore.lineFilter = LineFilter()
+        self.assertEqual(lineStore.lineCount, lineStore.visibleCount, 'Every line should be back in view')
+
+    def testOldestLinesAreEvicted(self):
+
+        lineStore: ConsoleLineStore = ConsoleLineStore(maximumLines=2 * CHUNK_SIZE)
+
+        for index in range(3 * CHUNK_SIZE):
+            lineStore.append(text=f'line {index}')
+
+        self.assertEqual(2 * CHUNK_SIZE, lineStore.lineCount, 'The store should stay bounded')
+        self.assertEqual(lineStore.lineCount, lineStore.visibleCount, 'The view should follow the store')
+        self.assertEqual(f'line {CHUNK_SIZE}', lineStore.visibleLine(0).text, 'The oldest chunk should be gone')
+
+    def testManyProjectsAndClear(self):
+
+        lineStore: ConsoleLineStore = ConsoleLineStore()
+
+        for index in range(MANY_PROJECTS):
+            lineStore.append(text=f'Created: Project{index}', project=f'Project{index}')
+
+        self.assertEqual(MANY_PROJECTS, len(lineStore.projects), 'Project ids should not overflow')
+
+        lineStore.clear()
+        lineStore.append(text='After the clear', project='Project0')
+
+        self.assertEqual(1, lineStore.visibleLine(0).number, 'Numbering should start over')
+        self.assertEqual(['Project0'], lineStore.projects, 'Projects should be forgotten')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestConsoleLineStore))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,187 @@
+
+from typing import Any
+from typing import Callable
+from typing import List
+
+from asyncio import Task
+from asyncio import get_running_loop
+from asyncio import run as asyncioRun
+from asyncio import sleep
+from asyncio import wait_for
+
+from json import dumps as jsonDumps
+from json import loads as jsonLoads
+
+from os import getuid
+
+from pathlib import Path
+
+from socket import AF_UNIX
+from socket import SOCK_STREAM
+from socket import socket
+
+from tempfile import TemporaryDirectory
+
+from time import sleep as timeSleep
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+from unittest.mock import patch
+
+from semantic_version import Version as SemanticVersion
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyfabricate.ProjectDetails import ProjectDetails
+
+from pyfabricate.batch.BatchFabricator import FabricationResult
+
+from pyfabricate.daemon.DaemonClient import DaemonClient
+from pyfabricate.daemon.DaemonClient import DaemonResponses
+from pyfabricate.daemon.FabricationDaemon import FabricationDaemon
+from pyfabricate.daemon.FabricationDaemon import Priority
+
+SOCKET_NAME:  str   = 'pyfabricated.sock'
+STOP_TIMEOUT: float = 10.0
+#
+# How long a stand in fabrication takes
+#
+FABRICATION_TIME: float = 0.3
+
+
+class TestFabricationDaemon(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+    def setUp(self):
+        super().setUp()
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+
+        self._basePath: Path = Path(self._temporaryDirectory.name)
+
+    def tearDown(self):
+        super().tearDown()
+        self._temporaryDirectory.cleanup()
+
+    def testFabricateThroughDaemon(self):
+
+        projects = [
+            ProjectDetails(name=f'DaemonProject{index}', moduleName=f'daemonproject{index}', baseDirectory=self._basePath, pythonVersion=SemanticVersion('3.12.4'))
+            for index in range(3)
+        ]
+
+        responses: DaemonResponses = asyncioRun(self._serve(lambda daemonClient: daemonClient.fabricate(projects, Priority.BATCH)))
+
+        for projectDetails, response in zip(projects, responses):
+            self.assertTrue(response['success'], f'{projectDetails.name}: {response.get("message")}')
+            self.assertTrue((self._basePath / projectDetails.name / 'pyproject.toml').exists(), 'Project not fabricated')
+
+        self.assertFalse((self._basePath / SOCKET_NAME).exists(), 'Socket should be removed on stop')
+
+    def testMalformedRequestsAreAnswered(self):
+
+        requests: bytes = b'{"id": 1, "command": "fabricate"}\n{"id": 2, "priority": "urgent", "project": {}}\n[3]\n'
+
+        responses: DaemonResponses = asyncioRun(self._serve(lambda daemonClient: self._sendRaw(requests=requests, responseCount=3)))
+
+        self.assertEqual([False, False, False], [response['success'] for response in responses], 'Every malformed request gets an error response')
+        self.assertEqual({1, 2, None}, {response['id'] for response in responses}, 'Responses should carry the request ids')
+
+    def testForeignBaseDirectoryIsRejected(self):
+
+        request: bytes = jsonDumps({'id': 1, 'project': {'name': 'Intruder', 'baseDirectory': str(self._basePath / 'projects')}}).encode() + b'\n'
+
+        with patch.object(FabricationDaemon, '_peerUid', return_value=getuid() + 1):
+            responses: DaemonResponses = asyncioRun(self._serve(lambda daemonClient: self._sendRaw(requests=request, responseCount=1)))
+
+        self.assertFalse(responses[0]['success'], 'Another user must not fabricate into our directories')
+        self.assertFalse((self._basePath / 'projects').exists(), 'Nothing should be written')
+
+    def testIdleClientDoesNotDelayStop(self):
+
+        idleSocket: socket = socket(AF_UNIX, SOCK_STREAM)
+        try:
+            asyncioRun(self._serve(lambda daemonClient: idleSocket.connect(str(self._basePath / SOCKET_NAME))))
+        finally:
+            idleSocket.close()
+
+        self.assertFalse((self._basePath / SOCKET_NAME).exists(), 'The daemon should stop with a client still connected')
+
+    def testInteractiveRequestOvertakesQueuedBatchWork(self):
+
+        requests: bytes = b''.join(self._request(requestId=index, priority=Priority.BATCH) for index in range(6)) + self._request(requestId='now', priority=Priority.INTERACTIVE)
+
+        with patch('pyfabricate.daemon.FabricationDaemon.fabricateProject', side_effect=self._fabricateSlowly):
+            responses: DaemonResponses = asyncioRun(self._serve(lambda daemonClient: self._sendRaw(requests=requests, responseCount=7)))
+
+        self.assertLess([response['id'] for response in responses].index('now'), 3, 'The interactive request should not wait for the batch ahead of it')
+
+    def testJobsOfAClientThatWentAwayAreWithdrawn(self):
+
+        fabricated: List[str] = []
+
+        def abandon(daemonClient: DaemonClient):
+            with socket(AF_UNIX, SOCK_STREAM) as clientSocket:
+                clientSocket.connect(str(self._basePath / SOCKET_NAME))
+                clientSocket.sendall(b''.join(self._request(requestId=index, priority=Priority.BATCH) for index in range(3)))
+            timeSleep(FABRICATION_TIME * 5)
+
+        with patch('pyfabricate.daemon.FabricationDaemon.fabricateProject', side_effect=lambda projectDetails, outputPolicy: self._fabricateSlowly(projectDetails, outputPolicy, fabricated)):
+            asyncioRun(self._serve(abandon, workers=1, clientLimit=3))
+
+        self.assertLess(len(fabricated), 3, 'Queued jobs should not be fabricated for a client that went away')
+
+    def _request(self, requestId: Any, priority: Priority) -> bytes:
+
+        request: dict = {'id': requestId, 'priority': priority.value, 'project': {'name': f'Project{requestId}', 'baseDirectory': str(self._basePath)}}
+
+        return jsonDumps(request).encode() + b'\n'
+
+    def _fabricateSlowly(self, projectDetails: ProjectDetails, outputPolicy: Any, fabricated: List[str] | None = None) -> FabricationResult:
+
+        timeSleep(FABRICATION_TIME)
+        if fabricated is not None:
+            fabricated.append(projectDetails.name)
+
+        return FabricationResult(projectName=projectDetails.name)
+
+    def _sendRaw(self, requests: bytes, responseCount: int) -> DaemonResponses:
+
+        with socket(AF_UNIX, SOCK_STREAM) as clientSocket:
+            clientSocket.settimeout(10.0)
+            clientSocket.connect(str(self._basePath / SOCKET_NAME))
+            clientSocket.sendall(requests)
+            with clientSocket.makefile('rb') as responseFile:
+                return [jsonLoads(responseFile.readline()) for _ in range(responseCount)]
+
+    async def _serve(self, work: Callable[[DaemonClient], Any], workers: int = 2, clientLimit: int = 2) -> Any:
+        """
+        Runs the work in a thread while the daemon serves
+        """
+        daemon:       FabricationDaemon = FabricationDaemon(socketPath=self._basePath / SOCKET_NAME, workers=workers, clientLimit=clientLimit)
+        serveTask:    Task              = get_running_loop().create_task(daemon.serve())
+        daemonClient: DaemonClient      = DaemonClient(socketPath=daemon.socketPath, timeout=30.0)
+
+        while daemon.socketPath.exists() is False:
+            await sleep(0.01)
+        try:
+            return await get_running_loop().run_in_executor(None, work, daemonClient)
+        finally:
+            daemon.stop()
+            await wait_for(serveTask, timeout=STOP_TIMEOUT)
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestFabricationDaemon))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
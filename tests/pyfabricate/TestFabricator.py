@@ -0,0 +1,366 @@
+
+from typing import Dict
+from typing import List
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+from unittest.mock import patch
+
+from asyncio import run as asyncioRun
+
+from os import environ as osEnvironment
+
+from pathlib import Path
+
+from stat import S_IMODE
+
+from tempfile import TemporaryDirectory
+
+from threading import current_thread
+from threading import main_thread
+
+from semantic_version import Version as SemanticVersion
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyfabricate.Constants import CACHE_DIRECTORY_NAME
+from pyfabricate.ProjectDetails import ProjectDetails
+
+from pyfabricate.fabrication.DeduplicatingOutputBackend import STORE_DIRECTORY_NAME
+from pyfabricate.fabrication.DryRunExecutor import DryRunReport
+from pyfabricate.fabrication.DryRunExecutor import SYSCALL_CLOSE
+from pyfabricate.fabrication.DryRunExecutor import SYSCALL_COPY
+from pyfabricate.fabrication.DryRunExecutor import SYSCALL_RENAME
+from pyfabricate.fabrication.FabricationCancelled import FabricationCancelled
+from pyfabricate.fabrication.FabricationError import FabricationError
+from pyfabricate.fabrication.FabricationManifest import VerificationReport
+from pyfabricate.fabrication.FabricationPlan import FabricationPlan
+from pyfabricate.fabrication.FabricationPlan import FabricationPlanSummary
+from pyfabricate.fabrication.Fabricator import EXECUTION_PERMISSIONS
+from pyfabricate.fabrication.Fabricator import Fabricator
+from pyfabricate.fabrication.Fabricator import STEP_WRITE_FILES
+from pyfabricate.fabrication.OutputPolicy import OutputPolicy
+from pyfabricate.fabrication.ProgressReporter import ProgressEvents
+from pyfabricate.fabrication.ProgressReporter import ProgressReporter
+from pyfabricate.fabrication.ProgressReporter import StepStarted
+from pyfabricate.fabrication.ProjectUpdater import UpdateAction
+from pyfabricate.fabrication.ProjectUpdater import UpdateReport
+
+from pyfabricate.oswrapper.FileCloner import FileCloner
+
+XDG_CONFIG_HOME_ENV_VAR: str = 'XDG_CONFIG_HOME'
+PYENV_ROOT_ENV_VAR:      str = 'PYENV_ROOT'
+
+TEST_PROJECT_NAME: str = 'DemoProject'
+TEST_MODULE_NAME:  str = 'demoproject'
+
+TEMPLATE_PERMISSIONS: int = 0o754
+
+
+class TestFabricator(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+
+        temporaryPath: Path = Path(self._temporaryDirectory.name)
+
+        self._savedConfigHome: str | None = osEnvironment.get(XDG_CONFIG_HOME_ENV_VAR)
+        osEnvironment[XDG_CONFIG_HOME_ENV_VAR] = str(temporaryPath / 'config')
+
+        self._savedPyenvRoot: str | None = osEnvironment.get(PYENV_ROOT_ENV_VAR)
+        osEnvironment[PYENV_ROOT_ENV_VAR] = str(temporaryPath / 'pyenv')
+        (temporaryPath / 'pyenv' / 'versions' / '3.12.4').mkdir(parents=True)
+
+        self._projectDetails: ProjectDetails = ProjectDetails(name=TEST_PROJECT_NAME,
+                                                              moduleName=TEST_MODULE_NAME,
+                                                              ownerName='Gato Malo',
+                                                              ownerEmail='gato.malo@gmail.com',
+                                                              description='A test project',
+                                                              keywords='test',
+                                                              baseDirectory=temporaryPath / 'projects',
+                                                              pythonVersion=SemanticVersion('3.12.4'))
+        self._progress: List[str] = []
+
+    def tearDown(self):
+        super().tearDown()
+
+        if self._savedConfigHome is None:
+            del osEnvironment[XDG_CONFIG_HOME_ENV_VAR]
+        else:
+            osEnvironment[XDG_CONFIG_HOME_ENV_VAR] = self._savedConfigHome
+
+        if self._savedPyenvRoot is None:
+            del osEnvironment[PYENV_ROOT_ENV_VAR]
+        else:
+            osEnvironment[PYENV_ROOT_ENV_VAR] = self._savedPyenvRoot
+
+        self._temporaryDirectory.cleanup()
+
+    def testFabricate(self):
+
+        fabricator: Fabricator = Fabricator(projectDetails=self._projectDetails, progressCallback=self._progress.append)
+        fabricator.fabricate()
+
+        projectPath: Path = self._projectDetails.baseDirectory / TEST_PROJECT_NAME
+
+        moduleInit: Path = projectPath / 'src' / TEST_MODULE_NAME / '__init__.py'
+        self.assertEqual(f'from {TEST_MODULE_NAME}._version import __version__', moduleInit.read_text(), 'Version variable not set')
+
+        pyProject: str = (projectPath / 'pyproject.toml').read_text()
+        self.assertIn(TEST_MODULE_NAME, pyProject, 'Module name not substituted')
+        self.assertNotIn('${', pyProject, 'Left over tokens')
+
+        self.assertEqual('3.12.4', (projectPath / '.python-version').read_text(), 'Wrong python version')
+
+        scriptPath: Path = projectPath / 'createVirtualEnv.sh'
+        self.assertEqual(EXECUTION_PERMISSIONS, scriptPath.stat().st_mode & 0o777, 'Script mode not set')
+        self.assertIn('\npython -m venv', scriptPath.read_text(), 'A pyenv version should run the shim')
+
+    def testFabricateWithoutPyenv(self):
+
+        interpreterPath: Path = Path('/usr/bin/python3.12')
+
+        self._projectDetails.pythonVersion = SemanticVersion('3.12.5')
+        with patch('pyfabricate.fabrication.Fabricator.InterpreterDiscovery.cacheFor') as cacheFor:
+            cacheFor.return_value.interpreterFor.return_value = interpreterPath
+            Fabricator(projectDetails=self._projectDetails, progressCallback=self._progress.append).fabricate()
+
+        projectPath: Path = self._projectDetails.baseDirectory / TEST_PROJECT_NAME
+
+        self.assertFalse((projectPath / '.python-version').exists(), 'pyenv cannot resolve the version')
+        self.assertIn(f'\n{interpreterPath} -m venv', (projectPath / 'createVirtualEnv.sh').read_text(), 'The interpreter should be run by its path')
+
+    def testFabricateAsync(self):
+
+        fabricator: Fabricator = Fabricator(projectDetails=self._projectDetails, progressCallback=self._progress.append)
+        asyncioRun(fabricator.fabricateAsync(concurrency=4))
+
+        projectPath:     Path = self._projectDetails.baseDirectory / TEST_PROJECT_NAME
+        synchronousPath: Path = self._projectDetails.baseDirectory / 'Synchronous'
+
+        self._projectDetails.name = synchronousPath.name
+        Fabricator(projectDetails=self._projectDetails, progressCallback=self._progress.append).fabricate()
+
+        asyncFiles:       List[Path] = sorted(path.relative_to(projectPath)     for path in projectPath.rglob('*'))
+        synchronousFiles: List[Path] = sorted(path.relative_to(synchronousPath) for path in synchronousPath.rglob('*'))
+
+        self.assertEqual(synchronousFiles, asyncFiles, 'Both modes must produce the same skeleton')
+        self.assertEqual((synchronousPath / 'LICENSE').read_bytes(), (projectPath / 'LICENSE').read_bytes(), 'Copies differ')
+
+    def testFabricateAsyncKeepsTheLoopFree(self):
+
+        fabricator: Fabricator      = Fabricator(projectDetails=self._projectDetails, progressCallback=self._progress.append)
+        onLoop:     Dict[str, bool] = {}
+
+        def recordThread(name: str, method):
+            def recorded(*args, **kwargs):
+                onLoop[name] = current_thread() is main_thread()
+                return method(*args, **kwargs)
+            return recorded
+
+        with patch.object(fabricator, 'compilePlan', side_effect=recordThread('compilePlan', fabricator.compilePlan)), \
+                patch.object(fabricator, '_publish', side_effect=recordThread('_publish', fabricator._publish)):
+            asyncioRun(fabricator.fabricateAsync(concurrency=4))
+
+        self.assertEqual({'compilePlan': False, '_publish': False}, onLoop, 'Disk work should not run on the event loop')
+
+    def testHardLinkPolicyDeduplicates(self):
+
+        Fabricator(projectDetails=self._projectDetails, progressCallback=self._progress.append, outputPolicy=OutputPolicy.HARDLINK).fabricate()
+
+        firstPath: Path = self._projectDetails.baseDirectory / TEST_PROJECT_NAME
+        self._projectDetails.name = 'SecondProject'
+        Fabricator(projectDetails=self._projectDetails, progressCallback=self._progress.append, outputPolicy=OutputPolicy.HARDLINK).fabricate()
+
+        secondPath: Path = self._projectDetails.baseDirectory / 'SecondProject'
+
+        self.assertEqual((firstPath / 'LICENSE').stat().st_ino, (secondPath / 'LICENSE').stat().st_ino, 'Identical files should share an inode')
+        self.assertEqual(sorted([TEST_PROJECT_NAME, 'SecondProject']), sorted(path.name for path in self._projectDetails.baseDirectory.iterdir()), 'The store belongs in the cache')
+        self.assertNotEqual((firstPath / 'README.md').read_text(), (secondPath / 'README.md').read_text(), 'Rendered files differ')
+
+        scriptPath: Path = secondPath / 'createVirtualEnv.sh'
+        self.assertEqual(EXECUTION_PERMISSIONS, scriptPath.stat().st_mode & 0o777, 'Script mode not set')
+
+    def testReflinkPolicyFallsBack(self):
+
+        with patch.object(FileCloner, 'cloneFile', return_value=False):
+            Fabricator(projectDetails=self._projectDetails, progressCallback=self._progress.append, outputPolicy=OutputPolicy.REFLINK).fabricate()
+
+        projectPath: Path = self._projectDetails.baseDirectory / TEST_PROJECT_NAME
+        storePath:   Path = Fabricator.configurationTemplatePath().parent / CACHE_DIRECTORY_NAME / STORE_DIRECTORY_NAME
+
+        self.assertEqual(Fabricator.templateBundle().read('LICENSE.template'), (projectPath / 'LICENSE').read_bytes(), 'Written, the content must match')
+        self.assertEqual([], [path for path in storePath.rglob('*') if path.is_file()], 'Nothing should be stored when it cannot be cloned')
+
+    def testCompilePlanWritesNothing(self):
+
+        fabricator: Fabricator      = Fabricator(projectDetails=self._projectDetails, progressCallback=self._progress.append)
+        plan:       FabricationPlan = fabricator.compilePlan()
+
+        summary: FabricationPlanSummary = plan.summary
+
+        self.assertEqual(7, summary.directories, 'Wrong directory count')
+        self.assertEqual(1, summary.chmods,      'Only the script changes mode')
+        self.assertGreater(summary.byteCount, 0, 'Should have content')
+
+        projectPath: Path = self._projectDetails.baseDirectory / TEST_PROJECT_NAME
+        self.assertFalse(projectPath.exists(), 'Compiling should not write anything')
+
+    def testDryRun(self):
+
+        fabricator: Fabricator   = Fabricator(projectDetails=self._projectDetails, progressCallback=self._progress.append)
+        report:     DryRunReport = fabricator.dryRun()
+
+        self.assertFalse(self._projectDetails.baseDirectory.exists(), 'Dry run must not touch the target file system')
+        self.assertEqual(8, len(report.directories), 'Wrong directory count;  The state directory too')
+        self.assertEqual(1 + 3, report.syscalls[SYSCALL_RENAME], 'A real run publishes once and renames the state files and the manifest into place')
+        self.assertEqual(len(report.files), report.syscalls[SYSCALL_CLOSE] - report.syscalls.get(SYSCALL_COPY, 0), 'One close per output plus one per copy source')
+
+        fabricator.fabricate()
+
+        projectPath: Path = self._projectDetails.baseDirectory / TEST_PROJECT_NAME
+        actualBytes: int = sum(path.stat().st_size for path in projectPath.rglob('*') if path.is_file())
+
+        self.assertEqual(actualBytes, report.byteCount, 'Dry run byte count must match a real run')
+
+    def testFailedFabricationLeavesNothingBehind(self):
+
+        readMeTemplate: Path = Fabricator.customizeTemplate(templateName='README.md.template')
+        goodTemplate:   str  = readMeTemplate.read_text()
+
+        readMeTemplate.write_text(f'{goodTemplate} $NOT_A_TOKEN')
+
+        fabricator: Fabricator = Fabricator(projectDetails=self._projectDetails, progressCallback=self._progress.append)
+        self.assertRaises(KeyError, fabricator.fabricate)
+
+        self.assertEqual([], list(self._projectDetails.baseDirectory.iterdir()), 'Staging directory not cleaned up')
+
+        readMeTemplate.write_text(goodTemplate)
+
+        Fabricator(projectDetails=self._projectDetails, progressCallback=self._progress.append).fabricate()
+
+        projectPath: Path = self._projectDetails.baseDirectory / TEST_PROJECT_NAME
+        self.assertTrue((projectPath / 'README.md').exists(), 'Retry should succeed')
+
+    def testCancelledFabricationLeavesNothingBehind(self):
+
+        progressReporter: ProgressReporter = ProgressReporter()
+
+        def cancelWhileWriting(events: ProgressEvents):
+            for event in events:
+                if isinstance(event, StepStarted) and event.step == STEP_WRITE_FILES:
+                    progressReporter.cancel()
+
+        progressReporter.subscribe(cancelWhileWriting)
+
+        fabricator: Fabricator = Fabricator(projectDetails=self._projectDetails, progressReporter=progressReporter)
+        self.assertRaises(FabricationCancelled, fabricator.fabricate)
+
+        self.assertEqual([], list(self._projectDetails.baseDirectory.iterdir()), 'Staging directory not cleaned up')
+
+    def testCancelledFabricationDeliversBufferedProgress(self):
+
+        progressReporter: ProgressReporter = ProgressReporter(batchSize=10_000)
+        delivered:        ProgressEvents   = ProgressEvents([])
+
+        progressReporter.subscribe(delivered.extend)
+
+        fabricator: Fabricator = Fabricator(projectDetails=self._projectDetails, progressReporter=progressReporter)
+        with patch.object(fabricator, '_recordFabricationState', side_effect=FabricationCancelled()):
+            self.assertRaises(FabricationCancelled, fabricator.fabricate)
+
+        self.assertIn(STEP_WRITE_FILES, [event.step for event in delivered if isinstance(event, StepStarted)], 'Buffered progress should be delivered')
+
+    def testUpdate(self):
+
+        readMeTemplate:  Path = Fabricator.customizeTemplate(templateName='README.md.template')
+        licenseTemplate: Path = Fabricator.customizeTemplate(templateName='LICENSE.template')
+        licenseTemplate.chmod(TEMPLATE_PERMISSIONS)
+
+        Fabricator(projectDetails=self._projectDetails, progressCallback=self._progress.append).fabricate()
+
+        projectPath: Path = self._projectDetails.baseDirectory / TEST_PROJECT_NAME
+        readMe:      Path = projectPath / 'README.md'
+        license:     Path = projectPath / 'LICENSE'
+        pyProject:   Path = projectPath / 'pyproject.toml'
+
+        readMe.write_text(f'{readMe.read_text()}A line from the user\n')
+        license.write_text('The user replaced the license\n')
+        readMeTemplate.write_text(f'A line from the template\n{readMeTemplate.read_text()}')
+        licenseTemplate.write_text(f'{licenseTemplate.read_text()}A template change\n')
+        pyProject.unlink()
+
+        report: UpdateReport = Fabricator.forUpdate(projectPath=projectPath, progressCallback=self._progress.append).update()
+
+        actions: Dict[str, UpdateAction] = {str(result.relativePath): result.action for result in report.results}
+
+        self.assertEqual(UpdateAction.MERGED,    actions['README.md'],      'Disjoint edits should merge')
+        self.assertEqual(UpdateAction.CONFLICT,  actions['LICENSE'],        'Overlapping edits should conflict')
+        self.assertEqual(UpdateAction.UNCHANGED, actions['pyproject.toml'], 'Unchanged template output is skipped')
+        self.assertFalse(pyProject.exists(), 'Deleted files stay deleted')
+        self.assertEqual(TEMPLATE_PERMISSIONS, S_IMODE(license.stat().st_mode), 'A replaced copy should keep the template permissions')
+
+        mergedReadMe: str = readMe.read_text()
+        self.assertTrue(mergedReadMe.startswith('A line from the template'), 'Template change missing')
+        self.assertTrue(mergedReadMe.endswith('A line from the user\n'),    'User change missing')
+
+        report = Fabricator.forUpdate(projectPath=projectPath, progressCallback=self._progress.append).update()
+        self.assertEqual(0, len(report.conflicts), 'The base moves forward after an update')
+
+    def testVerify(self):
+
+        Fabricator(projectDetails=self._projectDetails, progressCallback=self._progress.append).fabricate()
+
+        projectPath: Path = self._projectDetails.baseDirectory / TEST_PROJECT_NAME
+
+        report: VerificationReport = Fabricator.verify(projectPath=projectPath)
+        self.assertTrue(report.isClean, 'A fresh project matches its templates')
+        self.assertEqual(0, report.hashedCount, 'Nothing should be hashed when the stat data matches')
+
+        (projectPath / 'LICENSE').touch()
+        (projectPath / 'README.md').write_text('Edited')
+        (projectPath / '.python-version').unlink()
+        (Fabricator.prepareTemplates() / 'requirements.txt.template').write_text('click\n')
+
+        report = Fabricator.verify(projectPath=projectPath)
+
+        self.assertEqual([Path('README.md')],           report.modified,         'Only real edits are modifications')
+        self.assertEqual([Path('.python-version')],     report.missing,          'Deleted file not reported')
+        self.assertEqual(['requirements.txt.template'], report.changedTemplates, 'Changed template not reported')
+        self.assertEqual(2, report.hashedCount, 'Only the files whose stat data changed are hashed')
+
+        osEnvironment[XDG_CONFIG_HOME_ENV_VAR] = str(Path(self._temporaryDirectory.name) / 'unsynchronized')
+        Fabricator.verify(projectPath=projectPath)
+        self.assertFalse(Fabricator.configurationTemplatePath().exists(), 'Verifying should not synchronize the templates')
+
+    def testExistingProjectRejected(self):
+
+        projectPath: Path = self._projectDetails.baseDirectory / TEST_PROJECT_NAME
+        projectPath.mkdir(parents=True)
+
+        self.assertRaises(FabricationError, lambda: Fabricator(projectDetails=self._projectDetails, progressCallback=self._progress.append))
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestFabricator))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
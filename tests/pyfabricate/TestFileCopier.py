@@ -0,0 +1,89 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+from unittest.mock import patch
+
+from errno import ENOSYS
+from errno import EXDEV
+
+from os import read as osRead
+from os import write as osWrite
+
+from pathlib import Path
+
+from stat import S_IMODE
+
+from tempfile import TemporaryDirectory
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyfabricate.oswrapper.FileCopier import FALLBACK_BUFFER_SIZE
+from pyfabricate.oswrapper.FileCopier import FileCopier
+
+
+class TestFileCopier(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+    def setUp(self):
+        super().setUp()
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+
+        self._sourcePath:      Path  = Path(self._temporaryDirectory.name) / 'source.template'
+        self._destinationPath: Path  = Path(self._temporaryDirectory.name) / 'destination'
+        self._content:         bytes = bytes(range(256)) * (FALLBACK_BUFFER_SIZE // 100)
+
+        self._sourcePath.write_bytes(self._content)
+        self._sourcePath.chmod(0o754)
+
+    def tearDown(self):
+        super().tearDown()
+        self._temporaryDirectory.cleanup()
+
+    def testCopyPreservesPermissions(self):
+
+        FileCopier.copyFile(sourcePath=self._sourcePath, destinationPath=self._destinationPath)
+
+        self.assertEqual(self._content, self._destinationPath.read_bytes(), 'Content should match')
+        self.assertEqual(0o754, S_IMODE(self._destinationPath.stat().st_mode), 'Mode should be preserved')
+
+    def testExplicitMode(self):
+
+        FileCopier.copyFile(sourcePath=self._sourcePath, destinationPath=self._destinationPath, mode=0o600)
+
+        self.assertEqual(0o600, S_IMODE(self._destinationPath.stat().st_mode), 'Mode should be the requested one')
+
+    def testFallBackToReadWrite(self):
+
+        unsupported: OSError = OSError(ENOSYS, 'Not here')
+        with patch.object(FileCopier, '_copyFileRange', side_effect=unsupported), patch.object(FileCopier, '_sendFile', side_effect=unsupported):
+            FileCopier.copyFile(sourcePath=self._sourcePath, destinationPath=self._destinationPath)
+
+        self.assertEqual(self._content, self._destinationPath.read_bytes(), 'Fallback content should match')
+
+    def testFallBackResumesAfterAPartialCopy(self):
+
+        def partialCopy(sourceFd: int, destinationFd: int, byteCount: int) -> int:
+            osWrite(destinationFd, osRead(sourceFd, FALLBACK_BUFFER_SIZE // 3))
+            raise OSError(EXDEV, 'Gave up part way')
+
+        with patch.object(FileCopier, '_copyFileRange', side_effect=partialCopy):
+            FileCopier.copyFile(sourcePath=self._sourcePath, destinationPath=self._destinationPath)
+
+        self.assertEqual(self._content, self._destinationPath.read_bytes(), 'The fallback should continue where the copy stopped')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestFileCopier))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,114 @@
+
+from typing import List
+
+from pathlib import Path
+
+from sys import version_info
+
+from tempfile import TemporaryDirectory
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+import ensurepip
+
+from semantic_version import Version as SemanticVersion
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyfabricate.fabrication.GoldenEnvironmentCache import GoldenEnvironment
+from pyfabricate.fabrication.GoldenEnvironmentCache import GoldenEnvironmentCache
+from pyfabricate.fabrication.OutputPolicy import OutputPolicy
+
+from pyfabricate.oswrapper.AdvisoryLock import AdvisoryLock
+from pyfabricate.oswrapper.VirtualEnvironmentBuilder import VirtualEnvironmentBuilder
+from pyfabricate.oswrapper.Wheelhouse import Wheelhouse
+
+RUNNING_VERSION: SemanticVersion = SemanticVersion(f'{version_info.major}.{version_info.minor}.{version_info.micro}')
+#
+# Installable without a network
+#
+BUNDLED_WHEELS: List[Path] = sorted((Path(ensurepip.__file__).parent / '_bundled').glob('*.whl'))
+
+
+class TestGoldenEnvironmentCache(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+    def setUp(self):
+        super().setUp()
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+
+        self._basePath: Path = Path(self._temporaryDirectory.name)
+
+    def tearDown(self):
+        super().tearDown()
+        self._temporaryDirectory.cleanup()
+
+    def testRequirementsHashIgnoresFormatting(self):
+
+        self.assertEqual(GoldenEnvironmentCache.requirementsHash(b'wheel==0.43.0\nbuild == 1.2.2\n'),
+                         GoldenEnvironmentCache.requirementsHash(b'# Tools\nbuild==1.2.2\n\nwheel == 0.43.0  # Packaging\n'),
+                         'Formatting should not change the hash')
+
+    def testCloneAndEvict(self):
+
+        goldenEnvironmentCache: GoldenEnvironmentCache    = GoldenEnvironmentCache(cacheDirectory=self._basePath / 'golden', maximumBytes=1)
+        builder:                VirtualEnvironmentBuilder = VirtualEnvironmentBuilder(pythonVersion=RUNNING_VERSION, wheelhouse=Wheelhouse(wheelhousePath=self._basePath / 'wheels'))
+
+        firstPath: Path = self._clone(goldenEnvironmentCache, builder, requirements=f'{BUNDLED_WHEELS[0]}\n'.encode(), projectName='first')
+        clonePath: Path = self._clone(goldenEnvironmentCache, builder, requirements=f'{BUNDLED_WHEELS[0]}\n'.encode(), projectName='second')
+
+        self.assertIn(str(clonePath), (clonePath / 'pyvenv.cfg').read_text(), 'pyvenv.cfg not relocated')
+        self.assertIn(str(clonePath), (clonePath / 'bin' / 'pip').read_text(), 'Shebang not relocated')
+        self.assertEqual((firstPath / 'bin' / 'python').resolve(), (clonePath / 'bin' / 'python').resolve(), 'Same interpreter')
+
+        sitePackages: Path = clonePath / 'lib' / f'python{version_info.major}.{version_info.minor}' / 'site-packages'
+        self.assertGreater(next(sitePackages.glob('pip/__init__.py')).stat().st_nlink, 1, 'Clones should share files with the golden environment')
+
+        self._clone(goldenEnvironmentCache, builder, requirements=f'{BUNDLED_WHEELS[-1]}\n'.encode(), projectName='third')
+
+        environments: List[GoldenEnvironment] = goldenEnvironmentCache.environments
+        self.assertEqual(1, len(environments), 'The least recently used golden environment should be evicted')
+        self.assertTrue((firstPath / 'bin' / 'pip').exists(), 'Eviction should not disturb existing clones')
+
+    def testEnvironmentsInUseAreNotEvicted(self):
+
+        goldenEnvironmentCache: GoldenEnvironmentCache    = GoldenEnvironmentCache(cacheDirectory=self._basePath / 'golden', maximumBytes=1)
+        builder:                VirtualEnvironmentBuilder = VirtualEnvironmentBuilder(pythonVersion=RUNNING_VERSION, wheelhouse=Wheelhouse(wheelhousePath=self._basePath / 'wheels'))
+
+        self._clone(goldenEnvironmentCache, builder, requirements=f'{BUNDLED_WHEELS[0]}\n'.encode(), projectName='first')
+        firstGoldenPath: Path = goldenEnvironmentCache.environments[0].path
+        #
+        # As another process that is cloning it
+        #
+        with AdvisoryLock.lock(lockPath=firstGoldenPath.with_name(f'{firstGoldenPath.name}.lock'), exclusive=False):
+            self._clone(goldenEnvironmentCache, builder, requirements=f'{BUNDLED_WHEELS[-1]}\n'.encode(), projectName='second')
+
+        self.assertEqual(2, len(goldenEnvironmentCache.environments), 'A golden environment that is being cloned should not be evicted')
+
+    def _clone(self, goldenEnvironmentCache: GoldenEnvironmentCache, builder: VirtualEnvironmentBuilder, requirements: bytes, projectName: str) -> Path:
+
+        environmentPath: Path = self._basePath / projectName / builder.environmentName
+
+        return goldenEnvironmentCache.cloneEnvironment(builder=builder,
+                                                       requirements=requirements,
+                                                       environmentPath=environmentPath,
+                                                       finalPath=environmentPath,
+                                                       outputPolicy=OutputPolicy.HARDLINK)
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestGoldenEnvironmentCache))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,118 @@
+
+from typing import List
+
+from os import chmod
+from os import stat_result
+from os import symlink
+from os import utime
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from semantic_version import Version as SemanticVersion
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyfabricate.oswrapper.InterpreterDiscovery import Interpreter
+from pyfabricate.oswrapper.InterpreterDiscovery import InterpreterDiscovery
+
+#
+# Answers the probe and counts how often it was asked
+#
+FAKE_INTERPRETER: str = """#!/bin/sh
+echo probed >> "$(dirname "$0")/probes.txt"
+echo '{"version": "3.99.1", "implementation": "cpython", "abiFlags": "", "freeThreaded": false, "supportsVenv": true, "hasEnsurePip": false}'
+"""
+FAKE_PYPY: str = """#!/bin/sh
+echo '{"version": "3.98.1", "implementation": "pypy", "abiFlags": "", "freeThreaded": false, "supportsVenv": true, "hasEnsurePip": false}'
+"""
+
+
+class TestInterpreterDiscovery(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+    def setUp(self):
+        super().setUp()
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+
+        self._basePath:        Path = Path(self._temporaryDirectory.name)
+        self._binPath:         Path = self._basePath / 'bin'
+        self._interpreterPath: Path = self._binPath / 'python3.99'
+
+        self._binPath.mkdir()
+        self._interpreterPath.write_text(FAKE_INTERPRETER)
+        chmod(self._interpreterPath, 0o755)
+        symlink(self._interpreterPath.name, self._binPath / 'python3')
+
+    def tearDown(self):
+        super().tearDown()
+        self._temporaryDirectory.cleanup()
+
+    def testProbesAreCachedByModificationTime(self):
+
+        interpreters: List[Interpreter] = self._discover()
+        self.assertIn(str(self._interpreterPath), [interpreter.path for interpreter in interpreters], 'The fake interpreter should be found')
+        self.assertEqual(1, self._probeCount(), 'A symbolic link should not be probed again')
+
+        self._discover()
+        self.assertEqual(1, self._probeCount(), 'A new discovery should use the shared cache file')
+
+        interpreterStat: stat_result = self._interpreterPath.stat()
+        utime(self._interpreterPath, ns=(interpreterStat.st_atime_ns, interpreterStat.st_mtime_ns + 1_000_000_000))
+        self._discover()
+        self.assertEqual(2, self._probeCount(), 'A changed interpreter should be probed again')
+
+        interpreterDiscovery: InterpreterDiscovery = InterpreterDiscovery(cachePath=self._basePath / 'cache' / 'interpreters.json',
+                                                                          pyenvRoot=self._basePath / 'pyenv',
+                                                                          searchPath=str(self._binPath))
+        self.assertEqual(self._interpreterPath, interpreterDiscovery.interpreterFor(SemanticVersion('3.99.1')), 'Wrong interpreter')
+
+    def testConfiguredDirectoriesAndUsableInterpreters(self):
+
+        extraPath: Path = self._basePath / 'extra'
+        pypyPath:  Path = extraPath / 'python3.98'
+
+        extraPath.mkdir()
+        pypyPath.write_text(FAKE_PYPY)
+        chmod(pypyPath, 0o755)
+
+        interpreterDiscovery: InterpreterDiscovery = InterpreterDiscovery(cachePath=self._basePath / 'cache' / 'interpreters.json',
+                                                                          pyenvRoot=self._basePath / 'pyenv',
+                                                                          searchPath=str(self._binPath),
+                                                                          directories=[extraPath])
+
+        self.assertIn(str(pypyPath), [interpreter.path for interpreter in interpreterDiscovery.interpreters], 'Configured directories should be searched')
+        self.assertNotIn(str(pypyPath), [interpreter.path for interpreter in interpreterDiscovery.usableInterpreters], 'Only CPython should be usable')
+
+    def _discover(self) -> List[Interpreter]:
+        """
+        A new discovery each time, as another process would have
+        """
+        interpreterDiscovery: InterpreterDiscovery = InterpreterDiscovery(cachePath=self._basePath / 'cache' / 'interpreters.json',
+                                                                          pyenvRoot=self._basePath / 'pyenv',
+                                                                          searchPath=str(self._binPath))
+        return interpreterDiscovery.interpreters
+
+    def _probeCount(self) -> int:
+        return len((self._binPath / 'probes.txt').read_text().splitlines())
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestInterpreterDiscovery))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
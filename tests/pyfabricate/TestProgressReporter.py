@@ -0,0 +1,76 @@
+
+from typing import List
+
+from pathlib import Path
+
+from time import perf_counter
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyfabricate.fabrication.ProgressReporter import ProgressEvents
+from pyfabricate.fabrication.ProgressReporter import ProgressReporter
+from pyfabricate.fabrication.ProgressReporter import ProgressSummary
+
+PROJECT_PATH: Path = Path('/tmp/DemoProject')
+
+
+class TestProgressReporter(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+    def testEventsAreBatched(self):
+
+        batches:          List[ProgressEvents] = []
+        progressSummary:  ProgressSummary      = ProgressSummary()
+        progressReporter: ProgressReporter     = ProgressReporter(batchSize=3)
+
+        progressReporter.subscribe(batches.append)
+        progressReporter.subscribe(progressSummary)
+
+        progressReporter.directoryCreated(path=PROJECT_PATH, startTime=perf_counter())
+        progressReporter.fileWritten(path=PROJECT_PATH / 'README.md', byteCount=100, startTime=perf_counter())
+        self.assertEqual(0, len(batches), 'Nothing should be delivered before the batch fills')
+
+        progressReporter.fileWritten(path=PROJECT_PATH / 'LICENSE', byteCount=50, startTime=perf_counter())
+        self.assertEqual(1, len(batches), 'A full batch should be delivered')
+
+        progressReporter.message('Almost done')
+        progressReporter.error('Out of space')
+        self.assertEqual(2, len(batches), 'Errors should not wait for a full batch')
+
+        self.assertEqual(1,   progressSummary.directoryCount, 'Incorrect directory count')
+        self.assertEqual(2,   progressSummary.fileCount,      'Incorrect file count')
+        self.assertEqual(150, progressSummary.byteCount,      'Incorrect byte count')
+        self.assertEqual(1,   progressSummary.errorCount,     'Incorrect error count')
+
+    def testLineSubscriber(self):
+
+        lines:            List[str]        = []
+        progressReporter: ProgressReporter = ProgressReporter()
+
+        progressReporter.subscribe(ProgressReporter.lineSubscriber(progressCallback=lines.append))
+
+        with progressReporter.step('Writing files'):
+            progressReporter.fileWritten(path=PROJECT_PATH / 'README.md', byteCount=100, startTime=perf_counter())
+
+        self.assertEqual(3, len(lines), 'One line per event')
+        self.assertEqual(f'Created: {PROJECT_PATH / "README.md"}', lines[1], 'The console text should not change')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestProgressReporter))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,82 @@
+
+from typing import List
+
+from os import stat_result
+from os import utime
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyfabricate.oswrapper.PythonVersionCache import PythonVersionCache
+
+INSTALLED_VERSIONS: List[str] = ['3.12.1', '3.9.16', '3.11.7']
+
+
+class TestPythonVersionCache(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+    def setUp(self):
+        super().setUp()
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+
+        self._basePath:     Path = Path(self._temporaryDirectory.name)
+        self._pyenvRoot:    Path = self._basePath / 'pyenv'
+        self._projectPath:  Path = self._basePath / 'project'
+        self._versionsPath: Path = self._pyenvRoot / 'versions'
+
+        for version in INSTALLED_VERSIONS + ['miniconda3-latest']:
+            (self._versionsPath / version).mkdir(parents=True)
+        self._projectPath.mkdir()
+
+    def tearDown(self):
+        super().tearDown()
+        self._temporaryDirectory.cleanup()
+
+    def testVersionsAreSharedUntilPyenvChanges(self):
+
+        self.assertEqual(['3.9.16', '3.11.7', '3.12.1'], self._versions(), 'Only versions, in version order')
+
+        versionsStat: stat_result = self._versionsPath.stat()
+        (self._versionsPath / '3.13.0').mkdir()
+        utime(self._versionsPath, ns=(versionsStat.st_atime_ns, versionsStat.st_mtime_ns))
+        self.assertNotIn('3.13.0', self._versions(), 'A new cache should use the shared cache file')
+
+        utime(self._versionsPath, ns=(versionsStat.st_atime_ns, versionsStat.st_mtime_ns + 1_000_000_000))
+        self.assertIn('3.13.0', self._versions(), 'A newer versions directory should invalidate the cache')
+
+        (self._versionsPath / '3.14.0').mkdir()
+        (self._projectPath / '.python-version').write_text('3.14.0\n')
+        utime(self._versionsPath, ns=(versionsStat.st_atime_ns, versionsStat.st_mtime_ns + 1_000_000_000))
+        self.assertIn('3.14.0', self._versions(), 'A new .python-version should invalidate the cache')
+
+    def _versions(self) -> List[str]:
+        """
+        A new cache each time, as another process would have
+        """
+        pythonVersionCache: PythonVersionCache = PythonVersionCache(cachePath=self._basePath / 'cache' / 'pythonVersions.json',
+                                                                    pyenvRoot=self._pyenvRoot,
+                                                                    workingDirectory=self._projectPath)
+        return [str(version) for version in pythonVersionCache.pythonVersions]
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestPythonVersionCache))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
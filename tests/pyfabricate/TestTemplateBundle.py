@@ -0,0 +1,70 @@
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyfabricate.fabrication.TemplateBundle import BUNDLE_FILE_NAME
+from pyfabricate.fabrication.TemplateBundle import TemplateBundle
+from pyfabricate.fabrication.TemplateSource import NO_PATH
+from pyfabricate.fabrication.TemplateSource import TemplateSource
+
+RESOURCES_PATH: Path = Path(__file__).parent.parent.parent / 'pyfabricate' / 'resources'
+TEMPLATES_PATH: Path = RESOURCES_PATH / 'templates'
+
+LICENSE_TEMPLATE: str = 'LICENSE.template'
+
+
+class TestTemplateBundle(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+    def testBundleMatchesTemplates(self):
+        """
+        Fails when a template is edited without rebuilding the bundle
+        """
+        templateBundle: TemplateBundle = TemplateBundle(bundlePath=RESOURCES_PATH / BUNDLE_FILE_NAME)
+
+        templatePaths = sorted(TEMPLATES_PATH.glob('*.template'))
+
+        self.assertEqual([templatePath.name for templatePath in templatePaths], sorted(templateBundle.names), 'Bundle is missing templates')
+        for templatePath in templatePaths:
+            self.assertEqual(templatePath.read_bytes(), templateBundle.read(templatePath.name), f'Rebuild the bundle;  {templatePath.name} changed')
+
+    def testCustomizedTemplateWins(self):
+
+        templateBundle: TemplateBundle = TemplateBundle.bundleFor(bundlePath=RESOURCES_PATH / BUNDLE_FILE_NAME)
+
+        with TemporaryDirectory() as directoryName:
+            configurationTemplatePath: Path           = Path(directoryName)
+            templateSource:            TemplateSource = TemplateSource(configurationTemplatePath=configurationTemplatePath, templateBundle=templateBundle)
+
+            self.assertIs(NO_PATH, templateSource.customizedPath(LICENSE_TEMPLATE), 'Should come from the bundle')
+            self.assertEqual(templateBundle.read(LICENSE_TEMPLATE), templateSource.content(LICENSE_TEMPLATE), 'Bundled content expected')
+
+            customizedPath: Path = configurationTemplatePath / LICENSE_TEMPLATE
+            customizedPath.write_bytes(b'My license\n')
+
+            self.assertEqual(customizedPath, templateSource.customizedPath(LICENSE_TEMPLATE), 'Customized template should win')
+            self.assertEqual(b'My license\n', templateSource.content(LICENSE_TEMPLATE), 'Customized content expected')
+            self.assertEqual('', templateSource.contentHash('NoSuch.template'), 'Unknown templates have no hash')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestTemplateBundle))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
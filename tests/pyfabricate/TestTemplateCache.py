@@ -0,0 +1,106 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from os import utime as osUTime
+
+from pathlib import Path
+
+from string import Template
+
+from tempfile import TemporaryDirectory
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyfabricate.fabrication.CompiledTemplate import CompiledTemplate
+from pyfabricate.fabrication.TemplateCache import TemplateCache
+
+TEMPLATE_TEXT: str = 'name=$PROJECT_NAME module=${MODULE_NAME}_x cost=$$5 again=$PROJECT_NAME señor=€'
+
+TOKENS = {
+    'PROJECT_NAME': 'DemoProject',
+    'MODULE_NAME':  'demoproject',
+}
+
+
+class TestTemplateCache(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+        self._temporaryPath:      Path               = Path(self._temporaryDirectory.name)
+        self._templatePath:       Path               = self._temporaryPath / 'test.txt.template'
+
+        self._templatePath.write_bytes(TEMPLATE_TEXT.encode())
+
+    def tearDown(self):
+        super().tearDown()
+        self._temporaryDirectory.cleanup()
+
+    def testRenderMatchesStringTemplate(self):
+
+        compiledTemplate: CompiledTemplate = CompiledTemplate.compile(TEMPLATE_TEXT.encode())
+
+        self.assertEqual(Template(TEMPLATE_TEXT).substitute(TOKENS).encode(), compiledTemplate.render(TOKENS), 'Must match string.Template')
+        self.assertEqual({'PROJECT_NAME', 'MODULE_NAME'}, compiledTemplate.identifierSet, 'Wrong identifiers')
+        self.assertEqual(3, len(compiledTemplate.tokenPositions), 'Wrong token count')
+
+    def testMissingTokenRaises(self):
+
+        compiledTemplate: CompiledTemplate = CompiledTemplate.compile(TEMPLATE_TEXT.encode())
+
+        self.assertRaises(KeyError, lambda: compiledTemplate.render({'PROJECT_NAME': 'DemoProject'}))
+
+    def testInvalidPlaceholderRaises(self):
+
+        self.assertRaises(ValueError, lambda: CompiledTemplate.compile(b'bad $ placeholder'))
+
+    def testPersistentCacheSkipsParsing(self):
+
+        cacheDirectory: Path = self._temporaryPath / 'cache'
+
+        firstCache: TemplateCache = TemplateCache(cacheDirectory=cacheDirectory)
+        firstCache.compiledTemplate(templatePath=self._templatePath)
+        firstCache.save()
+        self.assertEqual(1, firstCache.recompiles, 'First lookup compiles')
+
+        secondCache: TemplateCache = TemplateCache(cacheDirectory=cacheDirectory)
+        secondCache.compiledTemplate(templatePath=self._templatePath)
+        self.assertEqual(0, secondCache.recompiles, 'Should have come from disk')
+        self.assertEqual(1, secondCache.hits, 'Should have come from disk')
+
+    def testEditedTemplateRecompiles(self):
+
+        cache: TemplateCache = TemplateCache(cacheDirectory=self._temporaryPath / 'cache')
+        cache.compiledTemplate(templatePath=self._templatePath)
+
+        self._templatePath.write_text('only $MODULE_NAME now')
+        osUTime(self._templatePath, ns=(1, 1))
+
+        compiledTemplate: CompiledTemplate = cache.compiledTemplate(templatePath=self._templatePath)
+
+        self.assertEqual(2, cache.recompiles, 'Edited template must be recompiled')
+        self.assertEqual(b'only demoproject now', compiledTemplate.render(TOKENS), 'Stale compiled template')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestTemplateCache))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
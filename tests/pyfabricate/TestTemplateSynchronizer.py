@@ -0,0 +1,107 @@
+
+from hashlib import sha256
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyfabricate.fabrication.TemplateSynchronizer import SynchronizationReport
+from pyfabricate.fabrication.TemplateSynchronizer import TemplateSynchronizer
+
+LICENSE_TEMPLATE: str = 'LICENSE.template'
+README_TEMPLATE:  str = 'README.md.template'
+
+
+class TestTemplateSynchronizer(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+    def setUp(self):
+        super().setUp()
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+
+        self._templatePath: Path                 = Path(self._temporaryDirectory.name) / 'templates'
+        self._synchronizer: TemplateSynchronizer = TemplateSynchronizer(configurationTemplatePath=self._templatePath)
+
+    def tearDown(self):
+        super().tearDown()
+        self._temporaryDirectory.cleanup()
+
+    def testNewTemplatesArrive(self):
+
+        self._synchronizer.synchronize(packagedTemplates={LICENSE_TEMPLATE: b'License\n'})
+
+        report: SynchronizationReport = self._synchronizer.synchronize(packagedTemplates={LICENSE_TEMPLATE: b'License\n', README_TEMPLATE: b'Read me\n'})
+
+        self.assertEqual([README_TEMPLATE], report.added, 'Only the new template should be copied')
+        self.assertEqual(b'Read me\n', (self._templatePath / README_TEMPLATE).read_bytes(), 'New template not copied')
+
+    def testUntouchedTemplatesUpdate(self):
+
+        self._synchronizer.synchronize(packagedTemplates={LICENSE_TEMPLATE: b'License\n'})
+
+        report: SynchronizationReport = self._synchronizer.synchronize(packagedTemplates={LICENSE_TEMPLATE: b'License v2\n'})
+
+        self.assertEqual([LICENSE_TEMPLATE], report.updated, 'Untouched template should be updated')
+        self.assertEqual(b'License v2\n', (self._templatePath / LICENSE_TEMPLATE).read_bytes(), 'Packaged template not copied')
+
+    def testCustomizedTemplatesStay(self):
+
+        self._synchronizer.synchronize(packagedTemplates={LICENSE_TEMPLATE: b'License\n'})
+        (self._templatePath / LICENSE_TEMPLATE).write_bytes(b'My license\n')
+
+        report: SynchronizationReport = self._synchronizer.synchronize(packagedTemplates={LICENSE_TEMPLATE: b'License v2\n'})
+
+        self.assertEqual([LICENSE_TEMPLATE], report.customized, 'Customization should be detected')
+        self.assertEqual(b'My license\n', (self._templatePath / LICENSE_TEMPLATE).read_bytes(), 'Customized template overwritten')
+
+    def testEarlierReleasesWithoutAnIndexUpdate(self):
+
+        self._templatePath.mkdir()
+        (self._templatePath / LICENSE_TEMPLATE).write_bytes(b'License\n')
+        (self._templatePath / README_TEMPLATE).write_bytes(b'My read me\n')
+
+        report: SynchronizationReport = self._synchronizer.synchronize(packagedTemplates={LICENSE_TEMPLATE: b'License v2\n', README_TEMPLATE: b'Read me v2\n'},
+                                                                       releasedHashes={LICENSE_TEMPLATE: [sha256(b'License\n').hexdigest()],
+                                                                                       README_TEMPLATE:  [sha256(b'Read me\n').hexdigest()]})
+
+        self.assertEqual([LICENSE_TEMPLATE], report.updated,    'A copy of an earlier release should be updated')
+        self.assertEqual([README_TEMPLATE],  report.customized, 'Anything else predating the index is customized')
+        self.assertEqual(b'License v2\n', (self._templatePath / LICENSE_TEMPLATE).read_bytes(), 'Packaged template not copied')
+
+    def testWithoutCopiesOnlyCustomizedTemplatesStay(self):
+
+        self._synchronizer.synchronize(packagedTemplates={LICENSE_TEMPLATE: b'License\n', README_TEMPLATE: b'Read me\n'})
+        (self._templatePath / README_TEMPLATE).write_bytes(b'My read me\n')
+
+        report: SynchronizationReport = self._synchronizer.synchronize(packagedTemplates={LICENSE_TEMPLATE: b'License\n', README_TEMPLATE: b'Read me\n'}, copyPackaged=False)
+
+        self.assertEqual([LICENSE_TEMPLATE], report.removed,    'The untouched copy should be removed')
+        self.assertEqual([README_TEMPLATE],  report.customized, 'The customized template should stay')
+
+        licensePath: Path = self._synchronizer.customize(name=LICENSE_TEMPLATE, content=b'License\n')
+        report = self._synchronizer.synchronize(packagedTemplates={LICENSE_TEMPLATE: b'License v2\n', README_TEMPLATE: b'Read me\n'}, copyPackaged=False)
+
+        self.assertEqual([], report.removed, 'A template copied to be customized should stay')
+        self.assertEqual(b'License\n', licensePath.read_bytes(), 'A template copied to be customized is never overwritten')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestTemplateSynchronizer))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,61 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyfabricate.fabrication.ThreeWayMerge import CONFLICT_START
+from pyfabricate.fabrication.ThreeWayMerge import MergeResult
+from pyfabricate.fabrication.ThreeWayMerge import ThreeWayMerge
+
+BASE: str = 'one\ntwo\nthree\nfour\n'
+
+
+class TestThreeWayMerge(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+    def testDisjointChangesMerge(self):
+
+        ours:   str = 'one\ntwo\nthree\nfour\nfive\n'
+        theirs: str = 'zero\none\ntwo\nthree\nfour\n'
+
+        result: MergeResult = ThreeWayMerge.merge(base=BASE, ours=ours, theirs=theirs)
+
+        self.assertEqual(0, result.conflicts, 'Should merge cleanly')
+        self.assertEqual('zero\none\ntwo\nthree\nfour\nfive\n', result.text, 'Both changes expected')
+
+    def testIdenticalChangesMerge(self):
+
+        changed: str = 'one\n2\nthree\nfour\n'
+
+        result: MergeResult = ThreeWayMerge.merge(base=BASE, ours=changed, theirs=changed)
+
+        self.assertEqual(0, result.conflicts, 'Same change on both sides is not a conflict')
+        self.assertEqual(changed, result.text, 'The change should appear once')
+
+    def testOverlappingChangesConflict(self):
+
+        ours:   str = 'one\nTWO\nthree\nfour'
+        theirs: str = 'one\n2\nthree\nfour\n'
+
+        result: MergeResult = ThreeWayMerge.merge(base=BASE, ours=ours, theirs=theirs)
+
+        self.assertEqual(1, result.conflicts, 'One conflicting region')
+        self.assertIn(f'{CONFLICT_START}TWO\n=======\n2\n>>>>>>> template\n', result.text, 'Conflict not marked')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestThreeWayMerge))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
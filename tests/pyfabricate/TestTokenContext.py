@@ -0,0 +1,96 @@
+
+from typing import List
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from os import environ as osEnvironment
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyfabricate.fabrication.CompiledTemplate import CompiledTemplate
+from pyfabricate.fabrication.FabricationError import FabricationError
+from pyfabricate.fabrication.TokenContext import TokenContext
+from pyfabricate.fabrication.TokenContext import TokenProviders
+
+TEST_ENVIRONMENT_VARIABLE: str = 'PYFABRICATE_TEST_TOKEN'
+
+
+class TestTokenContext(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+    def setUp(self):
+        super().setUp()
+
+        self._calls: List[str] = []
+
+        providers: TokenProviders = {
+            'PROJECT_NAME': lambda: self._provide('PROJECT_NAME', 'DemoProject'),
+            'EXPENSIVE':    lambda: self._provide('EXPENSIVE', 'costly'),
+        }
+        self._tokenContext: TokenContext = TokenContext(providers=providers)
+
+    def testOnlyReferencedTokensAreComputed(self):
+
+        compiledTemplate: CompiledTemplate = CompiledTemplate.compile(b'$PROJECT_NAME and ${PROJECT_NAME}')
+
+        self.assertEqual(b'DemoProject and DemoProject', compiledTemplate.render(self._tokenContext), 'Wrong rendering')
+        self.assertEqual(['PROJECT_NAME'], self._calls, 'Providers are lazy and memoized')
+        self.assertIn('EXPENSIVE', self._tokenContext, 'Membership must not compute')
+        self.assertEqual(['PROJECT_NAME'], self._calls, 'Membership must not compute')
+
+    def testScopeOverridesAndSharesValues(self):
+
+        self._tokenContext['EXPENSIVE']
+
+        scope: TokenContext = self._tokenContext.scope({'PROJECT_NAME': lambda: 'demoproject'})
+
+        self.assertEqual('demoproject', scope['PROJECT_NAME'], 'Scope should override')
+        self.assertEqual('costly',      scope['EXPENSIVE'],    'Scope should fall back to its parent')
+        self.assertEqual(['EXPENSIVE'], self._calls,           'Parent values are shared')
+        self.assertRaises(KeyError, lambda: scope['NOT_A_TOKEN'])
+
+    def testUserProviders(self):
+
+        osEnvironment[TEST_ENVIRONMENT_VARIABLE] = 'fromEnvironment'
+        with TemporaryDirectory() as directoryName:
+            tokensFilePath: Path = Path(directoryName) / 'tokens.json'
+            tokensFilePath.write_text(
+                f'{{"LITERAL": {{"value": "literal"}}, "ENVIRONMENT": {{"environment": "{TEST_ENVIRONMENT_VARIABLE}"}}}}'
+            )
+            providers: TokenProviders = TokenContext.loadUserProviders(tokensFilePath=tokensFilePath)
+
+            tokensFilePath.write_text('{"BROKEN": {"unknown": 1}}')
+            self.assertRaises(FabricationError, lambda: TokenContext.loadUserProviders(tokensFilePath=tokensFilePath))
+
+        del osEnvironment[TEST_ENVIRONMENT_VARIABLE]
+
+        tokenContext: TokenContext = TokenContext(providers=providers)
+
+        self.assertEqual('literal', tokenContext['LITERAL'],     'Literal provider')
+        self.assertEqual('',        tokenContext['ENVIRONMENT'], 'Environment providers are evaluated when used')
+
+    def _provide(self, name: str, value: str) -> str:
+        self._calls.append(name)
+        return value
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestTokenContext))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,107 @@
+
+from os import chmod
+
+from pathlib import Path
+
+from subprocess import CompletedProcess
+from subprocess import run as subProcessRun
+
+from sys import version_info
+
+from threading import Event
+from threading import Timer
+
+from time import perf_counter
+
+from tempfile import TemporaryDirectory
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from semantic_version import Version as SemanticVersion
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyfabricate.oswrapper.VirtualEnvironmentBuilder import PipPolicy
+from pyfabricate.oswrapper.VirtualEnvironmentBuilder import VirtualEnvironmentBuilder
+from pyfabricate.oswrapper.VirtualEnvironmentBuilder import VirtualEnvironmentCancelled
+from pyfabricate.oswrapper.Wheelhouse import Wheelhouse
+
+RUNNING_VERSION: SemanticVersion = SemanticVersion(f'{version_info.major}.{version_info.minor}.{version_info.micro}')
+
+#
+# An environment whose pip never finishes
+#
+STUCK_INTERPRETER: str = '#!/bin/sh\nsleep 30\n'
+
+
+class TestVirtualEnvironmentBuilder(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+    def setUp(self):
+        super().setUp()
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+
+        self._basePath: Path = Path(self._temporaryDirectory.name)
+
+    def tearDown(self):
+        super().tearDown()
+        self._temporaryDirectory.cleanup()
+
+    def testBuildElsewhereAndRelocate(self):
+
+        builder: VirtualEnvironmentBuilder = VirtualEnvironmentBuilder(pythonVersion=RUNNING_VERSION, wheelhouse=Wheelhouse(wheelhousePath=self._basePath / 'wheels'), pipPolicy=PipPolicy.CACHED_WHEEL)
+
+        stagingPath: Path = self._basePath / 'staging'
+        finalPath:   Path = self._basePath / 'final'
+
+        stagingPath.mkdir()
+        builder.create(environmentPath=stagingPath / builder.environmentName, finalPath=finalPath / builder.environmentName)
+        stagingPath.rename(finalPath)
+
+        environmentPath: Path = finalPath / builder.environmentName
+        for scriptPath in (environmentPath / 'bin').iterdir():
+            if scriptPath.is_symlink() is False:
+                self.assertNotIn(str(stagingPath), scriptPath.read_text(), f'{scriptPath.name} not relocated')
+
+        completedProcess: CompletedProcess = subProcessRun([environmentPath / 'bin' / 'pip', '--version'], capture_output=True, text=True, check=False)
+        self.assertEqual(0, completedProcess.returncode, completedProcess.stderr)
+        self.assertIn(str(environmentPath), completedProcess.stdout, 'pip should run from the relocated environment')
+        self.assertEqual(1, len(list((self._basePath / 'wheels').glob('pip-*.whl'))), 'The pip wheel should be cached')
+
+    def testCancelKillsTheRunningCommand(self):
+
+        cancelEvent:     Event = Event()
+        environmentPath: Path  = self._basePath / 'stuck'
+        interpreterPath: Path  = environmentPath / 'bin' / 'python'
+        requirements:    Path  = self._basePath / 'requirements.txt'
+
+        interpreterPath.parent.mkdir(parents=True)
+        interpreterPath.write_text(STUCK_INTERPRETER)
+        chmod(interpreterPath, 0o755)
+        requirements.write_text('not-in-the-wheelhouse\n')
+
+        builder: VirtualEnvironmentBuilder = VirtualEnvironmentBuilder(pythonVersion=RUNNING_VERSION, wheelhouse=Wheelhouse(wheelhousePath=self._basePath / 'wheels'),
+                                                                       cancelled=cancelEvent.is_set)
+        Timer(0.5, cancelEvent.set).start()
+
+        startTime: float = perf_counter()
+        self.assertRaises(VirtualEnvironmentCancelled, lambda: builder.install(environmentPath=environmentPath, requirementsPath=requirements))
+        self.assertLess(perf_counter() - startTime, 5.0, 'The command should be killed, not waited for')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestVirtualEnvironmentBuilder))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
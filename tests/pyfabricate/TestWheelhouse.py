@@ -0,0 +1,115 @@
+
+from typing import List
+
+from pathlib import Path
+
+from shutil import copy2
+
+from sys import version_info
+
+from tempfile import TemporaryDirectory
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from zipfile import ZipFile
+
+import ensurepip
+
+from semantic_version import Version as SemanticVersion
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyfabricate.oswrapper.WheelInstaller import WheelInstaller
+from pyfabricate.oswrapper.WheelInstaller import WheelTimings
+from pyfabricate.oswrapper.Wheelhouse import UnableToResolveRequirements
+from pyfabricate.oswrapper.Wheelhouse import WheelFile
+from pyfabricate.oswrapper.Wheelhouse import Wheelhouse
+
+RUNNING_VERSION: SemanticVersion = SemanticVersion(f'{version_info.major}.{version_info.minor}.{version_info.micro}')
+#
+# Installable without a network
+#
+BUNDLED_WHEELS: List[Path] = sorted((Path(ensurepip.__file__).parent / '_bundled').glob('*.whl'))
+
+
+class TestWheelhouse(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+    def setUp(self):
+        super().setUp()
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+
+        self._basePath: Path = Path(self._temporaryDirectory.name)
+        self._dropPath: Path = self._basePath / 'drop'
+
+        self._dropPath.mkdir()
+
+    def tearDown(self):
+        super().tearDown()
+        self._temporaryDirectory.cleanup()
+
+    def testResolveFollowsDependenciesAndMarkers(self):
+
+        self._makeWheel(name='alpha', version='1.0', requiresDist=['beta>=2.0', 'gamma; extra == "docs"', 'delta; python_version < "3"'])
+        self._makeWheel(name='beta',  version='1.0', requiresDist=[])
+        self._makeWheel(name='beta',  version='2.1', requiresDist=[])
+        self._makeWheel(name='gamma', version='1.0', requiresDist=[])
+
+        wheelhouse: Wheelhouse = Wheelhouse(wheelhousePath=self._basePath / 'wheels', dropPath=self._dropPath)
+
+        self.assertEqual(4, len(wheelhouse.importWheels()), 'Every dropped wheel should be imported')
+        self.assertEqual(0, len(wheelhouse.importWheels()), 'Imported wheels should not be imported again')
+
+        wheels: List[WheelFile] = wheelhouse.resolve(requirements=Wheelhouse.parseRequirements('alpha  # The app\n'), pythonVersion=RUNNING_VERSION)
+        self.assertEqual({('alpha', '1.0'), ('beta', '2.1')}, {(wheel.name, str(wheel.version)) for wheel in wheels}, 'Extras and markers not honored')
+
+        wheels = wheelhouse.resolve(requirements=['alpha[docs]'], pythonVersion=RUNNING_VERSION)
+        self.assertIn('gamma', [wheel.name for wheel in wheels], 'The extra should bring in its dependency')
+
+        with self.assertRaises(UnableToResolveRequirements):
+            wheelhouse.resolve(requirements=['alpha', 'beta<2'], pythonVersion=RUNNING_VERSION)
+
+    def testInstallInParallel(self):
+
+        for bundledWheel in BUNDLED_WHEELS:
+            copy2(bundledWheel, self._dropPath)
+
+        wheelhouse: Wheelhouse = Wheelhouse(wheelhousePath=self._basePath / 'wheels', dropPath=self._dropPath)
+        wheelhouse.importWheels()
+
+        environmentPath: Path              = self._basePath / 'environment'
+        wheels:          List[WheelFile]   = wheelhouse.resolve(requirements=[wheel.name for wheel in wheelhouse.wheels], pythonVersion=RUNNING_VERSION)
+        timings:         WheelTimings      = WheelInstaller(environmentPath=environmentPath, pythonVersion=RUNNING_VERSION).install(wheelPaths=[wheel.path for wheel in wheels])
+
+        sitePackages: Path = environmentPath / 'lib' / f'python{version_info.major}.{version_info.minor}' / 'site-packages'
+        self.assertEqual(len(BUNDLED_WHEELS), len(timings), 'A timing per wheel')
+        self.assertTrue((sitePackages / 'pip' / '__init__.py').exists(), 'pip not unpacked')
+        self.assertIn(f'#!{environmentPath}/bin/python', (environmentPath / 'bin' / 'pip').read_text(), 'Console script not written')
+
+    def _makeWheel(self, name: str, version: str, requiresDist: List[str]):
+
+        distInfo: str       = f'{name}-{version}.dist-info'
+        metadata: List[str] = ['Metadata-Version: 2.1', f'Name: {name}', f'Version: {version}'] + [f'Requires-Dist: {requirement}' for requirement in requiresDist]
+
+        with ZipFile(self._dropPath / f'{name}-{version}-py3-none-any.whl', 'w') as wheel:
+            wheel.writestr(f'{name}/__init__.py', '')
+            wheel.writestr(f'{distInfo}/METADATA', '\n'.join(metadata) + '\n')
+            wheel.writestr(f'{distInfo}/RECORD', '')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestWheelhouse))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()